@@ -6,10 +6,12 @@ import logging
 import time
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
-from threading import Lock
+from http.cookiejar import DefaultCookiePolicy
+from threading import BoundedSemaphore, Lock
 from typing import Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from app.config import get_settings, AccountCredentials
 
@@ -19,11 +21,43 @@ _COMPOSER_ORIGIN = "public-api"
 _SYMPHONY_STATS_CACHE_TTL_SECONDS = 15.0
 _SYMPHONY_STATS_RATE_LIMIT_COOLDOWN_SECONDS = 15.0
 _SYMPHONY_STATS_CACHE_MAX_ENTRIES = 128
+_HTTP_POOL_CONNECTIONS = 32  # distinct hosts kept warm
+_HTTP_POOL_MAXSIZE = 64  # connections per host, enough for concurrent dry runs/backtests
+# Concurrent in-flight requests per API key across every fan-out (list, catalog,
+# bulk reads, dry runs), so parallel reads do not trip Composer's rate limits.
+_MAX_CONCURRENT_REQUESTS_PER_CREDENTIAL = 8
 
 _symphony_stats_cache_lock = Lock()
 _symphony_stats_cache: Dict[Tuple[str, str, str], Dict[str, object]] = {}
 
 
+def _build_http_session() -> requests.Session:
+    """Process-wide session so Composer calls reuse TLS connections across clients."""
+    session = requests.Session()
+    # Credentials travel in headers; never let one account's cookies reach another.
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=_HTTP_POOL_CONNECTIONS, pool_maxsize=_HTTP_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_http = _build_http_session()
+
+_credential_slots_lock = Lock()
+_credential_slots: Dict[str, BoundedSemaphore] = {}
+
+
+def _credential_slots_for(api_key_id: str) -> BoundedSemaphore:
+    """Process-wide request slots for one API key, shared by all its clients."""
+    with _credential_slots_lock:
+        slots = _credential_slots.get(api_key_id)
+        if slots is None:
+            slots = BoundedSemaphore(_MAX_CONCURRENT_REQUESTS_PER_CREDENTIAL)
+            _credential_slots[api_key_id] = slots
+        return slots
+
+
 class SymphonyStatsRateLimitError(RuntimeError):
     """Raised when symphony stats are rate-limited without a cached payload."""
 
@@ -55,6 +89,7 @@ class ComposerClient:
             "accept": "application/json",
             "Content-Type": "application/json",
         }
+        self._slots = _credential_slots_for(api_key_id)
 
     @property
     def headers(self) -> dict:
@@ -98,9 +133,17 @@ class ComposerClient:
     # Low-level helpers
     # ------------------------------------------------------------------
 
+    def _http_get(self, url: str, **kwargs) -> requests.Response:
+        with self._slots:
+            return _http.get(url, **kwargs)
+
+    def _http_post(self, url: str, **kwargs) -> requests.Response:
+        with self._slots:
+            return _http.post(url, **kwargs)
+
     def _get_json(self, endpoint: str, params: dict = None) -> dict:
         url = f"{self.base_url}/{endpoint}"
-        resp = requests.get(url, headers=self.headers, params=params, timeout=_DEFAULT_HTTP_TIMEOUT)
+        resp = self._http_get(url, headers=self.headers, params=params, timeout=_DEFAULT_HTTP_TIMEOUT)
         if resp.status_code == 429:
             retry_after = resp.headers.get("Retry-After", "unknown")
             logger.error(
@@ -113,7 +156,7 @@ class ComposerClient:
     def _get_csv(self, endpoint: str, params: dict = None) -> str:
         url = f"{self.base_url}/{endpoint}"
         hdrs = {**self.headers, "accept": "text/csv"}
-        resp = requests.get(url, headers=hdrs, params=params, timeout=_DEFAULT_HTTP_TIMEOUT)
+        resp = self._http_get(url, headers=hdrs, params=params, timeout=_DEFAULT_HTTP_TIMEOUT)
         if resp.status_code == 429:
             retry_after = resp.headers.get("Retry-After", "unknown")
             logger.error(
@@ -465,7 +508,7 @@ class ComposerClient:
           (typically 3-5 pp over several months for active strategies).
         """
         url = f"{self.base_url}/api/v0.1/symphonies/{symphony_id}/backtest"
-        resp = requests.post(url, headers=self.headers, json={
+        resp = self._http_post(url, headers=self.headers, json={
             "capital": 10000,
             "apply_reg_fee": True,
             "apply_taf_fee": True,
@@ -503,7 +546,7 @@ class ComposerClient:
         body = {"send_segment_event": False}
         if account_uuids:
             body["account_uuids"] = account_uuids
-        resp = requests.post(url, headers=self.headers, json=body, timeout=_DEFAULT_HTTP_TIMEOUT)
+        resp = self._http_post(url, headers=self.headers, json=body, timeout=_DEFAULT_HTTP_TIMEOUT)
         if resp.status_code == 429:
             retry_after = resp.headers.get("Retry-After", "unknown")
             logger.error("RATE LIMITED (429) on POST dry-run - Retry-After: %s", retry_after)
@@ -523,7 +566,7 @@ class ComposerClient:
         body: Dict = {}
         if broker_account_uuid:
             body["broker_account_uuid"] = broker_account_uuid
-        resp = requests.post(url, headers=self.headers, json=body, timeout=_DEFAULT_HTTP_TIMEOUT)
+        resp = self._http_post(url, headers=self.headers, json=body, timeout=_DEFAULT_HTTP_TIMEOUT)
         if resp.status_code == 429:
             retry_after = resp.headers.get("Retry-After", "unknown")
             logger.error("RATE LIMITED (429) on POST trade-preview %s - Retry-After: %s", symphony_id, retry_after)
@@ -551,7 +594,7 @@ class ComposerClient:
         Returns list of dicts with at least 'id' and 'name' keys.
         """
         url = f"{self._backtest_api_base}/api/v1/watchlist"
-        resp = requests.get(url, headers=self.headers, timeout=_DEFAULT_HTTP_TIMEOUT)
+        resp = self._http_get(url, headers=self.headers, timeout=_DEFAULT_HTTP_TIMEOUT)
         if resp.status_code == 429:
             retry_after = resp.headers.get("Retry-After", "unknown")
             logger.error(
@@ -571,7 +614,7 @@ class ComposerClient:
         Returns list of dicts with at least 'id' and 'name' keys.
         """
         url = f"{self._backtest_api_base}/api/v1/user/symphonies/drafts"
-        resp = requests.get(url, headers=self.headers, timeout=_DEFAULT_HTTP_TIMEOUT)
+        resp = self._http_get(url, headers=self.headers, timeout=_DEFAULT_HTTP_TIMEOUT)
         if resp.status_code == 429:
             retry_after = resp.headers.get("Retry-After", "unknown")
             logger.error(
@@ -3,7 +3,7 @@
 import json
 import logging
 import os
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from pydantic import BaseModel
 
@@ -60,8 +60,17 @@ class Settings(BaseModel):
     risk_free_rate: float = 0.05  # annualized
 
 
+# Last resolved (overrides, Settings) pair; reused while inputs are unchanged.
+_settings_cache: Optional[tuple[tuple, Settings]] = None
+
+
 def get_settings() -> Settings:
-    """Load settings from config.json."""
+    """Load settings from config.json.
+
+    The returned instance is shared between callers while config.json and the
+    PD_* overrides are unchanged, so treat it as read-only.
+    """
+    global _settings_cache
     try:
         data = _load_config_json()
         overrides = data.get("settings", {})
@@ -80,12 +89,20 @@ def get_settings() -> Settings:
     if env_local_write_base_dir:
         values["local_write_base_dir"] = env_local_write_base_dir
 
-    return Settings(**values)
+    signature = tuple(sorted(values.items()))
+    cached = _settings_cache
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    settings = Settings(**values)
+    _settings_cache = (signature, settings)
+    return settings
 
 
 # Module-level cache for parsed config.json data
 _config_json_cache: Optional[dict] = None
 _accounts_log_signature: Optional[tuple[str, ...]] = None
+# (config.json dict the map was built from, credential name -> credentials)
+_accounts_by_name_cache: Optional[Tuple[dict, Dict[str, "AccountCredentials"]]] = None
 
 
 def _load_config_json() -> dict:
@@ -144,6 +161,20 @@ def load_accounts() -> List[AccountCredentials]:
     return accounts
 
 
+def load_accounts_by_name() -> Dict[str, AccountCredentials]:
+    """Credentials keyed by name, rebuilt only when config.json is reloaded."""
+    global _accounts_by_name_cache
+    data = _load_config_json()
+    cached = _accounts_by_name_cache
+    if cached is not None and cached[0] is data:
+        return cached[1]
+    by_name: Dict[str, AccountCredentials] = {}
+    for creds in load_accounts():
+        by_name.setdefault(creds.name, creds)  # first entry wins, as in a linear scan
+    _accounts_by_name_cache = (data, by_name)
+    return by_name
+
+
 _PLACEHOLDER_API_KEY_ID = "your-api-key-id"
 _PLACEHOLDER_API_SECRET = "your-api-secret"
 
@@ -25,7 +25,27 @@ if db_url.startswith("sqlite:///"):
         db_url = f"sqlite:///{db_path}"
     os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
-engine = create_engine(db_url, echo=False)
+# Sync endpoints run on AnyIO's 40-thread pool; the QueuePool default of
+# 5 + 10 connections left requests queueing on checkout under load.
+_POOL_SIZE = 20
+_POOL_MAX_OVERFLOW = 20
+_POOL_RECYCLE_SECONDS = 3600
+
+engine_kwargs = {}
+if db_url.startswith("sqlite"):
+    # In-memory SQLite uses a single-connection pool that takes no sizing.
+    if db_url.startswith("sqlite:///") and ":memory:" not in db_url:
+        engine_kwargs.update(pool_size=_POOL_SIZE, max_overflow=_POOL_MAX_OVERFLOW)
+else:
+    # Server databases drop idle connections; file-backed SQLite never does.
+    engine_kwargs.update(
+        pool_size=_POOL_SIZE,
+        max_overflow=_POOL_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=_POOL_RECYCLE_SECONDS,
+    )
+
+engine = create_engine(db_url, echo=False, **engine_kwargs)
 SessionLocal = sessionmaker(bind=engine)
 
 
@@ -42,6 +62,19 @@ def init_db():
     """Create all tables and run lightweight migrations for schema changes."""
     Base.metadata.create_all(bind=engine)
     _migrate_add_columns()
+    _migrate_add_indexes()
+
+
+def _migrate_add_indexes():
+    """Create indexes added to tables that already existed (create_all skips them)."""
+    from sqlalchemy import inspect as sa_inspect
+
+    existing_tables = set(sa_inspect(engine).get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
 
 
 def _migrate_add_columns():
@@ -54,6 +87,27 @@ def _migrate_add_columns():
     _MIGRATIONS = [
         ("symphony_backtest_cache", "summary_metrics_json", "TEXT NOT NULL DEFAULT '{}'"),
         ("symphony_backtest_cache", "last_semantic_update_at", "TEXT"),
+        ("symphony_backtest_cache", "response_blob", "BLOB"),
+        ("symphony_backtest_cache", "response_encoding", "TEXT"),
+        ("symphony_backtest_cache", "cached_at_epoch", "INTEGER"),
+        ("symphony_backtest_cache", "dvm_series_blob", "BLOB"),
+        ("symphony_backtest_cache", "cumulative_return_pct", "REAL"),
+        ("symphony_backtest_cache", "annualized_return", "REAL"),
+        ("symphony_backtest_cache", "annualized_return_cum", "REAL"),
+        ("symphony_backtest_cache", "time_weighted_return", "REAL"),
+        ("symphony_backtest_cache", "cagr", "REAL"),
+        ("symphony_backtest_cache", "sharpe_ratio", "REAL"),
+        ("symphony_backtest_cache", "sortino_ratio", "REAL"),
+        ("symphony_backtest_cache", "calmar_ratio", "REAL"),
+        ("symphony_backtest_cache", "max_drawdown", "REAL"),
+        ("symphony_backtest_cache", "annualized_volatility", "REAL"),
+        ("symphony_backtest_cache", "win_rate", "REAL"),
+        ("symphony_backtest_cache", "best_day_pct", "REAL"),
+        ("symphony_backtest_cache", "worst_day_pct", "REAL"),
+        ("symphony_backtest_cache", "profit_factor", "REAL"),
+        ("symphony_backtest_cache", "median_drawdown", "REAL"),
+        ("symphony_backtest_cache", "longest_drawdown_days", "INTEGER"),
+        ("symphony_backtest_cache", "median_drawdown_days", "INTEGER"),
         ("daily_metrics", "annualized_return_cum", "REAL DEFAULT 0.0"),
         ("symphony_daily_metrics", "annualized_return_cum", "REAL DEFAULT 0.0"),
         ("cash_flows", "is_manual", "INTEGER NOT NULL DEFAULT 0"),
@@ -11,8 +11,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.database import init_db, SessionLocal
 from app.routers import portfolio, health, symphonies
 from app.config import load_accounts, is_test_mode, validate_composer_config
-from app.composer_client import ComposerClient
 from app.models import Account
+from app.services.account_clients import get_client_for_credentials
+from app.services.json_response import FastJSONResponse
 from app.security import get_allowed_origins
 
 logging.basicConfig(
@@ -34,7 +35,7 @@ def _discover_accounts():
     db = SessionLocal()
     try:
         for creds in accounts_creds:
-            client = ComposerClient.from_credentials(creds)
+            client = get_client_for_credentials(creds)
             try:
                 subs = client.list_sub_accounts()
             except Exception as e:
@@ -96,6 +97,7 @@ app = FastAPI(
     title="Portfolio Dashboard",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 app.add_middleware(
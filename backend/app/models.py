@@ -1,6 +1,6 @@
 """SQLAlchemy ORM models for all database tables."""
 
-from sqlalchemy import Column, Integer, Float, Text, Date, DateTime, UniqueConstraint
+from sqlalchemy import Column, Integer, Float, Text, Date, DateTime, Index, LargeBinary, UniqueConstraint
 from app.database import Base
 
 
@@ -99,6 +99,8 @@ class DailyMetrics(Base):
 
 class BenchmarkData(Base):
     __tablename__ = "benchmark_data"
+    # History reads filter by symbol and scan a date range.
+    __table_args__ = (Index("ix_benchmark_symbol_date", "symbol", "date"),)
 
     date = Column(Date, primary_key=True)
     symbol = Column(Text, nullable=False, default="SPY")
@@ -155,6 +157,7 @@ class SymphonyBacktestCache(Base):
     symphony_id = Column(Text, primary_key=True)
     account_id = Column(Text, nullable=False)
     cached_at = Column(DateTime, nullable=False)
+    cached_at_epoch = Column(Integer, nullable=True)  # same instant as cached_at, Unix seconds
     stats_json = Column(Text, nullable=False, default="{}")
     dvm_capital_json = Column(Text, nullable=False, default="{}")
     tdvm_weights_json = Column(Text, nullable=False, default="{}")
@@ -163,6 +166,27 @@ class SymphonyBacktestCache(Base):
     first_day = Column(Integer, default=0)
     last_market_day = Column(Integer, default=0)
     last_semantic_update_at = Column(Text, nullable=True)
+    response_blob = Column(LargeBinary, nullable=True)  # full API response, served on cache hits
+    response_encoding = Column(Text, nullable=True)  # compression of response_blob, e.g. "zlib"
+    dvm_series_blob = Column(LargeBinary, nullable=True)  # day-sorted (int32 day, float64 value) records
+    # summary_metrics, one column per key (NULL on rows cached before they existed)
+    cumulative_return_pct = Column(Float, nullable=True)
+    annualized_return = Column(Float, nullable=True)
+    annualized_return_cum = Column(Float, nullable=True)
+    time_weighted_return = Column(Float, nullable=True)
+    cagr = Column(Float, nullable=True)
+    sharpe_ratio = Column(Float, nullable=True)
+    sortino_ratio = Column(Float, nullable=True)
+    calmar_ratio = Column(Float, nullable=True)
+    max_drawdown = Column(Float, nullable=True)
+    annualized_volatility = Column(Float, nullable=True)
+    win_rate = Column(Float, nullable=True)
+    best_day_pct = Column(Float, nullable=True)
+    worst_day_pct = Column(Float, nullable=True)
+    profit_factor = Column(Float, nullable=True)
+    median_drawdown = Column(Float, nullable=True)
+    longest_drawdown_days = Column(Integer, nullable=True)
+    median_drawdown_days = Column(Integer, nullable=True)
 
 
 class SymphonyAllocationHistory(Base):
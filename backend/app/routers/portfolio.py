@@ -3,6 +3,7 @@
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Query, Request
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -37,6 +38,7 @@ from app.services.portfolio_holdings_read import (
     get_portfolio_holdings_history_data,
 )
 from app.services.portfolio_live_overlay import get_portfolio_live_summary_data
+from app.services.json_response import typed_json_response
 from app.services.portfolio_read import get_portfolio_performance_data, get_portfolio_summary_data
 from app.services.portfolio_admin import (
     add_manual_cash_flow_data,
@@ -55,6 +57,9 @@ from app.security import require_local_auth, require_local_strict_origin
 
 router = APIRouter(prefix="/api", tags=["portfolio"])
 
+_PERFORMANCE_POINTS = TypeAdapter(List[PerformancePoint])
+_BENCHMARK_HISTORY = TypeAdapter(BenchmarkHistoryResponse)
+
 
 def _resolve_account_ids(db: Session, account_id: Optional[str]) -> List[str]:
     """Portfolio-scoped account resolution with existing error-message parity."""
@@ -154,12 +159,15 @@ def get_performance(
 ):
     """Performance chart data (portfolio value + deposits + returns over time)."""
     ids = _resolve_account_ids(db, account_id)
-    return get_portfolio_performance_data(
-        db=db,
-        account_ids=ids,
-        period=period,
-        start_date=start_date,
-        end_date=end_date,
+    return typed_json_response(
+        _PERFORMANCE_POINTS,
+        get_portfolio_performance_data(
+            db=db,
+            account_ids=ids,
+            period=period,
+            start_date=start_date,
+            end_date=end_date,
+        ),
     )
 
 
@@ -364,16 +372,19 @@ def get_benchmark_history(
     db: Session = Depends(get_db),
 ):
     """Fetch benchmark price history and compute TWR, drawdown, and MWR series."""
-    return get_benchmark_history_data(
-        db=db,
-        ticker=ticker,
-        start_date=start_date,
-        end_date=end_date,
-        account_id=account_id,
-        get_daily_closes_stooq_fn=get_daily_closes_stooq,
-        get_daily_closes_fn=get_daily_closes,
-        get_daily_closes_polygon_fn=get_daily_closes_polygon,
-        get_latest_price_fn=get_latest_price,
+    return typed_json_response(
+        _BENCHMARK_HISTORY,
+        get_benchmark_history_data(
+            db=db,
+            ticker=ticker,
+            start_date=start_date,
+            end_date=end_date,
+            account_id=account_id,
+            get_daily_closes_stooq_fn=get_daily_closes_stooq,
+            get_daily_closes_fn=get_daily_closes,
+            get_daily_closes_polygon_fn=get_daily_closes_polygon,
+            get_latest_price_fn=get_latest_price,
+        ),
     )
 
 
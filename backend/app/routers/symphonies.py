@@ -1,9 +1,10 @@
 """Symphony API routes."""
 
 import logging
-from typing import Optional
+from typing import Any, List, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -11,6 +12,7 @@ from app.schemas import (
     PerformancePoint,
     SymphonyBacktestResponse,
     SymphonyBenchmarkResponse,
+    SymphonyBulkRequest,
     SymphonyCatalogRow,
     SymphonyListRow,
     SymphonySummary,
@@ -18,9 +20,14 @@ from app.schemas import (
     TradePreviewRow,
 )
 from app.services.account_clients import get_client_for_account
-from app.services.backtest_cache import get_symphony_backtest_data
-from app.services.symphony_allocations_read import get_symphony_allocations_data
-from app.services.symphony_benchmark_read import get_symphony_benchmark_data
+from app.services.backtest_cache import (
+    get_symphony_backtest_data,
+    get_symphony_backtest_summary_data,
+)
+from app.services.json_response import typed_json_response
+from app.services.symphony_allocations_read import get_symphony_allocations_response
+from app.services.symphony_benchmark_read import get_symphony_benchmark_response
+from app.services.symphony_bulk_read import get_symphonies_bulk_data
 from app.services.symphony_catalog import get_symphony_catalog_data
 from app.services.symphony_list_read import get_symphonies_list_data
 from app.services.symphony_read import (
@@ -32,14 +39,15 @@ from app.services.symphony_trade_preview import (
     get_symphony_trade_preview_data,
     get_trade_preview_data,
 )
-from app.market_hours import is_within_trading_session
-import time
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api", tags=["symphonies"])
 
 TEST_CREDENTIAL = "__TEST__"
 
+_SYMPHONY_LIST_ROWS = TypeAdapter(list[SymphonyListRow])
+_PERFORMANCE_POINTS = TypeAdapter(list[PerformancePoint])
+
 # ------------------------------------------------------------------
 # List symphonies
 # ------------------------------------------------------------------
@@ -50,11 +58,29 @@ def list_symphonies(
     db: Session = Depends(get_db),
 ):
     """List active symphonies across one or more sub-accounts."""
-    return get_symphonies_list_data(
+    return typed_json_response(
+        _SYMPHONY_LIST_ROWS,
+        get_symphonies_list_data(
+            db=db,
+            account_id=account_id,
+            get_client_for_account_fn=get_client_for_account,
+            test_credential=TEST_CREDENTIAL,
+        ),
+    )
+
+
+@router.post("/symphonies/bulk", response_model=dict[str, dict[str, Any]])
+def get_symphonies_bulk(
+    body: SymphonyBulkRequest,
+    db: Session = Depends(get_db),
+):
+    """Read several symphonies' performance/summary/allocations/backtest summary at once."""
+    return get_symphonies_bulk_data(
         db=db,
-        account_id=account_id,
+        account_id=body.account_id,
+        symphony_ids=body.symphony_ids,
+        fields=body.fields,
         get_client_for_account_fn=get_client_for_account,
-        test_credential=TEST_CREDENTIAL,
     )
 
 
@@ -82,11 +108,14 @@ def get_symphony_performance(
     db: Session = Depends(get_db),
 ):
     """Get daily value history for a symphony."""
-    return get_symphony_performance_data(
-        db=db,
-        symphony_id=symphony_id,
-        account_id=account_id,
-        get_client_for_account_fn=get_client_for_account,
+    return typed_json_response(
+        _PERFORMANCE_POINTS,
+        get_symphony_performance_data(
+            db=db,
+            symphony_id=symphony_id,
+            account_id=account_id,
+            get_client_for_account_fn=get_client_for_account,
+        ),
     )
 
 
@@ -145,6 +174,8 @@ def get_symphony_summary_live(
 @router.get("/symphonies/{symphony_id}/backtest", response_model=SymphonyBacktestResponse)
 def get_symphony_backtest(
     symphony_id: str,
+    request: Request,
+    background_tasks: BackgroundTasks,
     account_id: str = Query(..., description="Sub-account ID for credentials"),
     force_refresh: bool = Query(False, description="Force refresh cache"),
     db: Session = Depends(get_db),
@@ -157,9 +188,24 @@ def get_symphony_backtest(
         force_refresh=force_refresh,
         get_client_for_account_fn=get_client_for_account,
         test_credential=TEST_CREDENTIAL,
+        if_none_match=request.headers.get("if-none-match"),
+        background_tasks=background_tasks,
     )
 
 
+@router.get(
+    "/symphonies/{symphony_id}/backtest/summary",
+    response_model=dict[str, Optional[float]],
+)
+def get_symphony_backtest_summary(
+    symphony_id: str,
+    keys: Optional[List[str]] = Query(None, description="Summary metric keys to return (default: all)"),
+    db: Session = Depends(get_db),
+):
+    """Return cached backtest summary metrics without the full backtest payload."""
+    return get_symphony_backtest_summary_data(db=db, symphony_id=symphony_id, keys=keys)
+
+
 # ------------------------------------------------------------------
 # Symphony allocation history (live daily snapshots)
 # ------------------------------------------------------------------
@@ -197,14 +243,16 @@ def get_symphony_trade_preview(
 @router.get("/symphonies/{symphony_id}/allocations", response_model=dict[str, dict[str, float]])
 def get_symphony_allocations(
     symphony_id: str,
+    request: Request,
     account_id: str = Query(..., description="Sub-account ID that owns this symphony"),
     db: Session = Depends(get_db),
 ):
     """Return daily allocation history for a symphony (from sync snapshots)."""
-    return get_symphony_allocations_data(
+    return get_symphony_allocations_response(
         db=db,
         symphony_id=symphony_id,
         account_id=account_id,
+        if_none_match=request.headers.get("if-none-match"),
     )
 
 
@@ -215,14 +263,15 @@ def get_symphony_allocations(
 @router.get("/symphony-benchmark/{symphony_id}", response_model=SymphonyBenchmarkResponse)
 def get_symphony_benchmark(
     symphony_id: str,
+    request: Request,
     account_id: Optional[str] = Query(None, description="Account ID (used to find credentials)"),
     db: Session = Depends(get_db),
 ):
     """Fetch a symphony backtest and return benchmark-history shape."""
-    return get_symphony_benchmark_data(
+    return get_symphony_benchmark_response(
         db=db,
         symphony_id=symphony_id,
-        account_id=account_id,
+        if_none_match=request.headers.get("if-none-match"),
     )
 
 
@@ -2,11 +2,17 @@
 
 from datetime import date
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+
+class _ResponseModel(BaseModel):
+    """Response payloads are built once, serialized and never mutated."""
+
+    model_config = ConfigDict(frozen=True)
 
 
 # --- Accounts ---
-class AccountInfo(BaseModel):
+class AccountInfo(_ResponseModel):
     id: str
     credential_name: str
     account_type: str
@@ -23,33 +29,33 @@ class ManualCashFlowRequest(BaseModel):
     description: str = ""
 
 
-class ManualCashFlowResponse(BaseModel):
+class ManualCashFlowResponse(_ResponseModel):
     status: str
     date: str
     type: str
     amount: float
 
 
-class ManualCashFlowDeleteResponse(BaseModel):
+class ManualCashFlowDeleteResponse(_ResponseModel):
     status: str
     deleted_id: int
 
 
 # --- Sync ---
-class SyncStatus(BaseModel):
+class SyncStatus(_ResponseModel):
     status: str  # idle / syncing / error
     last_sync_date: Optional[str] = None
     initial_backfill_done: bool = False
     message: str = ""
 
 
-class SyncTriggerResponse(BaseModel):
+class SyncTriggerResponse(_ResponseModel):
     status: str
     synced_accounts: Optional[int] = None
     reason: Optional[str] = None
 
 
-class SymphonyExportJobStatus(BaseModel):
+class SymphonyExportJobStatus(_ResponseModel):
     status: str  # idle / running / cancelling / complete / cancelled / error
     job_id: Optional[str] = None
     exported: int = 0
@@ -59,12 +65,12 @@ class SymphonyExportJobStatus(BaseModel):
     error: Optional[str] = None
 
 
-class SymphonyExportConfig(BaseModel):
+class SymphonyExportConfig(_ResponseModel):
     enabled: bool = True
     local_path: str = ""
 
 
-class AppConfigResponse(BaseModel):
+class AppConfigResponse(_ResponseModel):
     finnhub_api_key: Optional[str] = None
     finnhub_configured: bool
     polygon_configured: bool
@@ -78,7 +84,7 @@ class AppConfigResponse(BaseModel):
     composer_config_error: Optional[str] = None
 
 
-class SaveSymphonyExportResponse(BaseModel):
+class SaveSymphonyExportResponse(_ResponseModel):
     ok: bool
     local_path: str
     enabled: bool
@@ -89,11 +95,11 @@ class SaveSymphonyExportRequest(BaseModel):
     enabled: bool = True
 
 
-class OkResponse(BaseModel):
+class OkResponse(_ResponseModel):
     ok: bool
 
 
-class ScreenshotUploadResponse(BaseModel):
+class ScreenshotUploadResponse(_ResponseModel):
     ok: bool
     path: str
 
@@ -111,42 +117,7 @@ class SaveScreenshotConfigRequest(BaseModel):
 
 
 # --- Portfolio ---
-class DailyPortfolioRow(BaseModel):
-    date: date
-    portfolio_value: float
-    cash_balance: float
-    net_deposits: float
-    total_fees: float
-    total_dividends: float
-
-
-class DailyMetricsRow(BaseModel):
-    date: date
-    daily_return_pct: float
-    cumulative_return_pct: float
-    total_return_dollars: float
-    cagr: float
-    annualized_return: float
-    annualized_return_cum: float
-    time_weighted_return: float
-    money_weighted_return: float
-    win_rate: float
-    num_wins: int
-    num_losses: int
-    avg_win_pct: float
-    avg_loss_pct: float
-    max_drawdown: float
-    current_drawdown: float
-    sharpe_ratio: float
-    calmar_ratio: float
-    sortino_ratio: float
-    annualized_volatility: float
-    best_day_pct: float
-    worst_day_pct: float
-    profit_factor: float
-
-
-class PortfolioSummary(BaseModel):
+class PortfolioSummary(_ResponseModel):
     portfolio_value: float
     net_deposits: float
     total_return_dollars: float
@@ -184,30 +155,25 @@ class PortfolioSummary(BaseModel):
 
 
 # --- Holdings ---
-class HoldingSnapshot(BaseModel):
+class HoldingSnapshot(_ResponseModel):
     symbol: str
     quantity: float
     market_value: float = 0.0
     allocation_pct: Optional[float] = None
 
 
-class HoldingsForDate(BaseModel):
-    date: date
-    holdings: List[HoldingSnapshot]
-
-
-class PortfolioHoldingsResponse(BaseModel):
+class PortfolioHoldingsResponse(_ResponseModel):
     date: Optional[str] = None
     holdings: List[HoldingSnapshot]
 
 
-class HoldingsHistoryRow(BaseModel):
+class HoldingsHistoryRow(_ResponseModel):
     date: str
     num_positions: int
 
 
 # --- Transactions ---
-class TransactionRow(BaseModel):
+class TransactionRow(_ResponseModel):
     date: date
     symbol: str
     action: str
@@ -218,13 +184,13 @@ class TransactionRow(BaseModel):
     account_name: Optional[str] = None
 
 
-class TransactionListResponse(BaseModel):
+class TransactionListResponse(_ResponseModel):
     total: int
     transactions: List[TransactionRow]
 
 
 # --- Cash Flows ---
-class CashFlowRow(BaseModel):
+class CashFlowRow(_ResponseModel):
     id: int
     date: date
     type: str
@@ -236,7 +202,7 @@ class CashFlowRow(BaseModel):
 
 
 # --- Performance chart data ---
-class PerformancePoint(BaseModel):
+class PerformancePoint(_ResponseModel):
     date: date
     portfolio_value: float
     net_deposits: float
@@ -248,7 +214,7 @@ class PerformancePoint(BaseModel):
 
 
 # --- Benchmark history ---
-class BenchmarkHistoryPoint(BaseModel):
+class BenchmarkHistoryPoint(_ResponseModel):
     date: str
     close: float
     return_pct: float
@@ -256,33 +222,33 @@ class BenchmarkHistoryPoint(BaseModel):
     mwr_pct: float
 
 
-class BenchmarkHistoryResponse(BaseModel):
+class BenchmarkHistoryResponse(_ResponseModel):
     ticker: str
     data: List[BenchmarkHistoryPoint]
 
 
-class TradingSessionsResponse(BaseModel):
+class TradingSessionsResponse(_ResponseModel):
     exchange: str
     start_date: str
     end_date: str
     sessions: List[str]
 
 
-class SymphonyBenchmarkResponse(BaseModel):
+class SymphonyBenchmarkResponse(_ResponseModel):
     name: str
     ticker: str
     data: List[BenchmarkHistoryPoint]
 
 
 # --- Symphony list/catalog ---
-class SymphonyHoldingRow(BaseModel):
+class SymphonyHoldingRow(_ResponseModel):
     ticker: str
     allocation: float
     value: float
     last_percent_change: float
 
 
-class SymphonyListRow(BaseModel):
+class SymphonyListRow(_ResponseModel):
     id: str
     position_id: str
     account_id: str
@@ -308,14 +274,14 @@ class SymphonyListRow(BaseModel):
     holdings: List[SymphonyHoldingRow]
 
 
-class SymphonyCatalogRow(BaseModel):
+class SymphonyCatalogRow(_ResponseModel):
     symphony_id: str
     name: str
     source: str
 
 
 # --- Symphony summary/backtest ---
-class SymphonySummary(BaseModel):
+class SymphonySummary(_ResponseModel):
     symphony_id: str
     account_id: str
     period: str
@@ -346,7 +312,7 @@ class SymphonySummary(BaseModel):
     profit_factor: float
 
 
-class SymphonyBacktestResponse(BaseModel):
+class SymphonyBacktestResponse(_ResponseModel):
     stats: Dict[str, Any]
     dvm_capital: Dict[str, Any]
     tdvm_weights: Dict[str, Any]
@@ -358,8 +324,14 @@ class SymphonyBacktestResponse(BaseModel):
     last_semantic_update_at: str = ""
 
 
+class SymphonyBulkRequest(BaseModel):
+    account_id: str
+    symphony_ids: List[str]
+    fields: List[str] = []  # subset of performance/summary/allocations/backtest_summary; empty = all
+
+
 # --- Trade preview ---
-class TradePreviewRow(BaseModel):
+class TradePreviewRow(_ResponseModel):
     symphony_id: str
     symphony_name: str
     account_id: str
@@ -373,7 +345,7 @@ class TradePreviewRow(BaseModel):
     side: str
 
 
-class SymphonyTradeRecommendation(BaseModel):
+class SymphonyTradeRecommendation(_ResponseModel):
     ticker: str
     name: Optional[str] = None
     side: str
@@ -385,7 +357,7 @@ class SymphonyTradeRecommendation(BaseModel):
     next_weight: float
 
 
-class SymphonyTradePreviewResponse(BaseModel):
+class SymphonyTradePreviewResponse(_ResponseModel):
     symphony_id: str
     symphony_name: str
     rebalanced: bool
@@ -5,9 +5,11 @@ from __future__ import annotations
 import ipaddress
 import logging
 import os
+import re
 import secrets
+from functools import lru_cache
 from urllib.parse import urlparse
-from typing import Optional
+from typing import Iterable, Optional, Tuple, Union
 
 from fastapi import HTTPException, Request, WebSocket, WebSocketException, status
 
@@ -16,19 +18,29 @@ from app.config import get_settings, is_test_mode
 logger = logging.getLogger(__name__)
 
 LOCAL_AUTH_HEADER = "x-pd-local-token"
-_DEFAULT_ALLOWED_ORIGINS = {
+_DEFAULT_ALLOWED_ORIGINS = frozenset({
     "http://localhost:3000",
     "http://127.0.0.1:3000",
-}
+})
 _ALLOWED_ORIGINS_ENV = "PD_ALLOWED_ORIGINS"
-_DEFAULT_ALLOWED_HOSTS = {
+_DEFAULT_ALLOWED_HOSTS = frozenset({
     "localhost",
     "127.0.0.1",
     "::1",
     "[::1]",
-}
-_TEST_ALLOWED_HOSTS = {"testserver"}
+})
+_TEST_ALLOWED_HOSTS = frozenset({"testserver"})
+_TEST_MODE_ALLOWED_HOSTS = _DEFAULT_ALLOWED_HOSTS | _TEST_ALLOWED_HOSTS
+# ASGI delivers header values as latin-1 bytes; the guards compare those
+# directly instead of decoding and re-normalizing strings on every request.
+_DEFAULT_ALLOWED_HOSTS_B = frozenset(host.encode("latin-1") for host in _DEFAULT_ALLOWED_HOSTS)
+_TEST_MODE_ALLOWED_HOSTS_B = frozenset(host.encode("latin-1") for host in _TEST_MODE_ALLOWED_HOSTS)
+_HOST_RE = re.compile(rb"\[[^\]]*\]|[^:]*")
+# Host/Origin header values seen by a local server have tiny cardinality.
+_HEADER_CACHE_SIZE = 64
 _runtime_local_auth_token = secrets.token_urlsafe(32)
+# (expected token, its UTF-8 bytes); re-encoded only when the token changes.
+_expected_token_cache: Optional[Tuple[str, bytes]] = None
 
 
 def get_local_auth_token() -> str:
@@ -77,9 +89,17 @@ def get_allowed_origins() -> set[str]:
     For port overrides, set PD_ALLOWED_ORIGINS to a comma-separated list.
     Safety: only loopback origins are honored (localhost/127.0.0.1/::1).
     """
-    raw = os.environ.get(_ALLOWED_ORIGINS_ENV, "").strip()
+    return set(_allowed_origins())
+
+
+def _allowed_origins() -> frozenset[str]:
+    return _parse_allowed_origins(os.environ.get(_ALLOWED_ORIGINS_ENV, "").strip())
+
+
+@lru_cache(maxsize=8)
+def _parse_allowed_origins(raw: str) -> frozenset[str]:
     if not raw:
-        return set(_DEFAULT_ALLOWED_ORIGINS)
+        return _DEFAULT_ALLOWED_ORIGINS
 
     allowed: set[str] = set()
     for part in raw.split(","):
@@ -94,22 +114,45 @@ def get_allowed_origins() -> set[str]:
             "%s was provided but no valid loopback origins were parsed; falling back to defaults",
             _ALLOWED_ORIGINS_ENV,
         )
-        return set(_DEFAULT_ALLOWED_ORIGINS)
+        return _DEFAULT_ALLOWED_ORIGINS
 
-    return allowed
+    return frozenset(allowed)
 
 
-def _normalize_host(host_header: str) -> str:
-    host = host_header.strip().lower()
-    if not host:
-        return ""
-    if host.startswith("["):
-        end_idx = host.find("]")
-        if end_idx != -1:
-            return host[: end_idx + 1]
-    return host.split(":", 1)[0]
+def _allowed_origins_bytes() -> frozenset[bytes]:
+    return _encode_origins(_allowed_origins())
+
+
+@lru_cache(maxsize=8)
+def _encode_origins(origins: frozenset[str]) -> frozenset[bytes]:
+    return frozenset(origin.encode("latin-1", "replace") for origin in origins)
+
+
+def _header_bytes(value: Union[str, bytes, None]) -> bytes:
+    if value is None:
+        return b""
+    if isinstance(value, str):
+        return value.encode("latin-1", "replace")
+    return value
+
+
+def _raw_headers(headers: Iterable[Tuple[bytes, bytes]], *names: bytes) -> dict[bytes, bytes]:
+    """First value of each wanted header from an ASGI ``scope["headers"]`` list."""
+    found: dict[bytes, bytes] = {}
+    for key, value in headers:
+        key = key.lower()
+        if key in names and key not in found:
+            found[key] = value
+    return found
+
+
+@lru_cache(maxsize=_HEADER_CACHE_SIZE)
+def _normalize_host(host_header: bytes) -> bytes:
+    # Bracketed IPv6 literal (kept with its brackets) or everything before the port.
+    return _HOST_RE.match(host_header.strip().lower()).group(0)
 
 
+@lru_cache(maxsize=_HEADER_CACHE_SIZE)
 def _is_loopback_host(value: str) -> bool:
     host = value.strip().strip("[]").lower()
     if host in {"localhost", "testserver"}:
@@ -120,16 +163,13 @@ def _is_loopback_host(value: str) -> bool:
         return False
 
 
-def _allowed_hosts() -> set[str]:
-    hosts = set(_DEFAULT_ALLOWED_HOSTS)
-    if is_test_mode():
-        hosts.update(_TEST_ALLOWED_HOSTS)
-    return hosts
+def _allowed_hosts() -> frozenset[bytes]:
+    return _TEST_MODE_ALLOWED_HOSTS_B if is_test_mode() else _DEFAULT_ALLOWED_HOSTS_B
 
 
 def _enforce_local_network_boundary(
     *,
-    host_header: Optional[str],
+    host_header: Union[str, bytes, None],
     client_host: Optional[str],
     websocket: bool = False,
 ) -> None:
@@ -142,7 +182,7 @@ def _enforce_local_network_boundary(
                 )
             raise HTTPException(403, "Localhost client required")
 
-    parsed_host = _normalize_host(host_header or "")
+    parsed_host = _normalize_host(_header_bytes(host_header))
     if parsed_host not in _allowed_hosts():
         if websocket:
             raise WebSocketException(
@@ -154,11 +194,11 @@ def _enforce_local_network_boundary(
 
 def _enforce_origin(
     *,
-    origin: Optional[str],
+    origin: Union[str, bytes, None],
     require_origin: bool,
     websocket: bool = False,
 ) -> None:
-    normalized = (origin or "").strip().rstrip("/")
+    normalized = _header_bytes(origin).strip().rstrip(b"/")
     if not normalized:
         if require_origin:
             if websocket:
@@ -169,7 +209,7 @@ def _enforce_origin(
             raise HTTPException(403, "Origin header required")
         return
 
-    if normalized not in get_allowed_origins():
+    if normalized not in _allowed_origins_bytes():
         if websocket:
             raise WebSocketException(
                 code=status.WS_1008_POLICY_VIOLATION,
@@ -178,10 +218,20 @@ def _enforce_origin(
         raise HTTPException(403, "Origin not allowed")
 
 
-def _enforce_token(*, token: Optional[str], websocket: bool = False) -> None:
+def _expected_token_bytes() -> bytes:
+    global _expected_token_cache
     expected = get_local_auth_token()
+    cached = _expected_token_cache
+    if cached is None or cached[0] != expected:
+        cached = (expected, expected.encode("utf-8"))
+        _expected_token_cache = cached
+    return cached[1]
+
+
+def _enforce_token(*, token: Optional[str], websocket: bool = False) -> None:
     provided = (token or "").strip()
-    if not provided or not secrets.compare_digest(provided, expected):
+    # Compare bytes: compare_digest rejects non-ASCII str with a TypeError.
+    if not provided or not secrets.compare_digest(provided.encode("utf-8"), _expected_token_bytes()):
         if websocket:
             raise WebSocketException(
                 code=status.WS_1008_POLICY_VIOLATION,
@@ -190,22 +240,23 @@ def _enforce_token(*, token: Optional[str], websocket: bool = False) -> None:
         raise HTTPException(401, "Invalid local auth token")
 
 
-def require_local_origin(request: Request) -> None:
-    """Require localhost host/client and enforce browser Origin when provided."""
+def _enforce_request_origin(request: Request, *, require_origin: bool) -> None:
+    headers = _raw_headers(request.scope["headers"], b"host", b"origin")
     _enforce_local_network_boundary(
-        host_header=request.headers.get("host"),
+        host_header=headers.get(b"host"),
         client_host=request.client.host if request.client else None,
     )
-    _enforce_origin(origin=request.headers.get("origin"), require_origin=False)
+    _enforce_origin(origin=headers.get(b"origin"), require_origin=require_origin)
+
+
+def require_local_origin(request: Request) -> None:
+    """Require localhost host/client and enforce browser Origin when provided."""
+    _enforce_request_origin(request, require_origin=False)
 
 
 def require_local_strict_origin(request: Request) -> None:
     """Require localhost host/client and a valid browser Origin header."""
-    _enforce_local_network_boundary(
-        host_header=request.headers.get("host"),
-        client_host=request.client.host if request.client else None,
-    )
-    _enforce_origin(origin=request.headers.get("origin"), require_origin=True)
+    _enforce_request_origin(request, require_origin=True)
 
 
 def require_local_auth(request: Request) -> None:
@@ -218,13 +269,14 @@ def require_local_auth(request: Request) -> None:
 
 def require_local_ws_auth(websocket: WebSocket) -> None:
     """Require strict localhost + origin + token checks for browser WebSocket calls."""
+    headers = _raw_headers(websocket.scope["headers"], b"host", b"origin")
     _enforce_local_network_boundary(
-        host_header=websocket.headers.get("host"),
+        host_header=headers.get(b"host"),
         client_host=websocket.client.host if websocket.client else None,
         websocket=True,
     )
     _enforce_origin(
-        origin=websocket.headers.get("origin"),
+        origin=headers.get(b"origin"),
         require_origin=True,
         websocket=True,
     )
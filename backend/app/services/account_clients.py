@@ -2,23 +2,47 @@
 
 from __future__ import annotations
 
+from threading import Lock
+from typing import Dict, Tuple
+
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
 from app.composer_client import ComposerClient
-from app.config import load_accounts
-from app.models import Account
+from app.config import AccountCredentials, get_settings, load_accounts_by_name
+from app.services.account_scope import get_account_credential_name
+
+# credential name -> (credential fingerprint, client).  The fingerprint makes
+# an edited config.json (new key, secret, or API base URL) build a new client.
+_client_cache: Dict[str, Tuple[Tuple[str, str, str], ComposerClient]] = {}
+_client_cache_lock = Lock()
+
+
+def get_client_for_credentials(creds: AccountCredentials) -> ComposerClient:
+    """Process-wide ComposerClient for a credential set, rebuilt when it changes."""
+    fingerprint = (creds.api_key_id, creds.api_secret, get_settings().composer_api_base_url)
+    with _client_cache_lock:
+        cached = _client_cache.get(creds.name)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+    client = ComposerClient.from_credentials(creds)
+    with _client_cache_lock:
+        _client_cache[creds.name] = (fingerprint, client)
+    return client
 
 
 def get_client_for_account(db: Session, account_id: str) -> ComposerClient:
-    """Build a ComposerClient with the credentials for a given sub-account."""
-    acct = db.query(Account).filter_by(id=account_id).first()
-    if not acct:
+    """Return a ComposerClient with the credentials for a given sub-account.
+
+    Clients are stateless request wrappers, so one instance per credential is
+    reused across requests.
+    """
+    credential_name = get_account_credential_name(db, account_id)
+    if credential_name is None:
         raise HTTPException(404, f"Account {account_id} not found")
 
-    accounts_creds = load_accounts()
-    for creds in accounts_creds:
-        if creds.name == acct.credential_name:
-            return ComposerClient.from_credentials(creds)
+    creds = load_accounts_by_name().get(credential_name)
+    if creds is not None:
+        return get_client_for_credentials(creds)
 
-    raise HTTPException(500, f"No credentials found for credential name '{acct.credential_name}'")
+    raise HTTPException(500, f"No credentials found for credential name '{credential_name}'")
@@ -3,10 +3,36 @@
 from typing import List, Optional
 
 from fastapi import HTTPException
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from app.config import is_test_mode
 from app.models import Account
+from app.services.ttl_cache import TTLCache
+
+_TEST_CREDENTIAL = "__TEST__"
+
+# account id -> credential name.  ORM writes to Account evict entries; the TTL
+# bounds staleness from bulk statements that bypass mapper events.
+_CREDENTIAL_NAME_TTL = 60  # seconds
+_credential_name_cache = TTLCache(maxsize=512, ttl=_CREDENTIAL_NAME_TTL)
+
+
+def get_account_credential_name(db: Session, account_id: str) -> Optional[str]:
+    """Credential name of a sub-account, or None when it does not exist."""
+    credential_name = _credential_name_cache.get(account_id)
+    if credential_name is None:
+        credential_name = db.query(Account.credential_name).filter_by(id=account_id).scalar()
+        if credential_name is not None:
+            _credential_name_cache.set(account_id, credential_name)
+    return credential_name
+
+
+@event.listens_for(Account, "after_insert")
+@event.listens_for(Account, "after_update")
+@event.listens_for(Account, "after_delete")
+def _evict_account_credential_name(_mapper, _connection, target: Account) -> None:
+    _credential_name_cache.pop(target.id, None)
 
 
 def resolve_account_ids(
@@ -24,44 +50,37 @@ def resolve_account_ids(
     """
     test_mode = is_test_mode()
 
-    if account_id == "all":
-        query = db.query(Account)
-        if test_mode:
-            query = query.filter(Account.credential_name == "__TEST__")
-        else:
-            query = query.filter(Account.credential_name != "__TEST__")
-        accts = query.all()
-        if not accts:
-            raise HTTPException(404, no_accounts_message)
-        return [a.id for a in accts]
-
-    if account_id and account_id.startswith("all:"):
-        cred_name = account_id[4:]
-        if test_mode and cred_name != "__TEST__":
-            raise HTTPException(404, "Only __TEST__ accounts are available in test mode")
-        if not test_mode and cred_name == "__TEST__":
-            raise HTTPException(404, "Test mode is not enabled")
-        accts = db.query(Account).filter_by(credential_name=cred_name).all()
-        if not accts:
-            raise HTTPException(404, f"No sub-accounts found for credential '{cred_name}'")
-        return [a.id for a in accts]
-
-    if account_id:
-        acct = db.query(Account).filter_by(id=account_id).first()
-        if not acct:
+    if account_id and account_id != "all":
+        if account_id.startswith("all:"):
+            cred_name = account_id[4:]
+            _require_visible_credential(cred_name, test_mode)
+            ids = [aid for (aid,) in db.query(Account.id).filter_by(credential_name=cred_name).all()]
+            if not ids:
+                raise HTTPException(404, f"No sub-accounts found for credential '{cred_name}'")
+            return ids
+
+        credential_name = get_account_credential_name(db, account_id)
+        if credential_name is None:
             raise HTTPException(404, f"Account {account_id} not found")
-        if test_mode and acct.credential_name != "__TEST__":
-            raise HTTPException(404, "Only __TEST__ accounts are available in test mode")
-        if not test_mode and acct.credential_name == "__TEST__":
-            raise HTTPException(404, "Test mode is not enabled")
+        _require_visible_credential(credential_name, test_mode)
         return [account_id]
 
-    query = db.query(Account)
-    if test_mode:
-        query = query.filter(Account.credential_name == "__TEST__")
-    else:
-        query = query.filter(Account.credential_name != "__TEST__")
-    first = query.first()
-    if not first:
+    # "all" and the default selector share one id-only query over visible accounts.
+    query = db.query(Account.id).filter(
+        Account.credential_name == _TEST_CREDENTIAL
+        if test_mode
+        else Account.credential_name != _TEST_CREDENTIAL
+    )
+    if account_id != "all":
+        query = query.limit(1)
+    ids = [aid for (aid,) in query.all()]
+    if not ids:
         raise HTTPException(404, no_accounts_message)
-    return [first.id]
+    return ids
+
+
+def _require_visible_credential(credential_name: str, test_mode: bool) -> None:
+    if test_mode and credential_name != _TEST_CREDENTIAL:
+        raise HTTPException(404, "Only __TEST__ accounts are available in test mode")
+    if not test_mode and credential_name == _TEST_CREDENTIAL:
+        raise HTTPException(404, "Test mode is not enabled")
@@ -4,80 +4,299 @@ from __future__ import annotations
 
 import json
 import logging
-from datetime import date, datetime, timedelta
-from typing import Callable, Dict
+import time
+import zlib
+from threading import Lock
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
-from fastapi import HTTPException
-from sqlalchemy.orm import Session
+import numpy as np
+from fastapi import BackgroundTasks, HTTPException, Response
+from sqlalchemy.orm import Session, load_only
 
 from app.config import get_settings
-from app.models import Account, SymphonyBacktestCache
-from app.services.metrics import compute_all_metrics
+from app.database import SessionLocal
+from app.models import SymphonyBacktestCache
+from app.services.account_scope import get_account_credential_name
+from app.services.http_cache import conditional_response, make_etag
+from app.services.metrics import compute_latest_metrics
 from app.services.symphony_export import export_single_symphony
+from app.services.ttl_cache import TTLCache
+
+try:  # optional C JSON codec; stdlib json is always the fallback
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# Composer day-offset maps may arrive with int keys; metric values may be numpy scalars.
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if orjson is not None else 0
+)
 
 logger = logging.getLogger(__name__)
 
 CACHE_TTL_HOURS = 24
+_RESPONSE_ENCODING = "zlib"
+_RESPONSE_COMPRESS_LEVEL = 3  # cheap to compress; dense day->value JSON still shrinks several-fold
+_CACHE_TTL_SECONDS = CACHE_TTL_HOURS * 3600
+_VERSIONS_CACHE_TTL = 300  # seconds
+_VERSIONS_CACHE_MAX_ENTRIES = 512
+# symphony_id -> versions list, so repeat cache hits skip the staleness round trip.
+_symphony_versions_cache = TTLCache(maxsize=_VERSIONS_CACHE_MAX_ENTRIES, ttl=_VERSIONS_CACHE_TTL)
+_DVM_SERIES_CACHE_MAX_ENTRIES = 128
+# (symphony_id, cached_at_epoch) -> (name, series).  A re-cached backtest gets
+# a new epoch, so replaced rows are simply never looked up again.
+_dvm_series_cache = TTLCache(maxsize=_DVM_SERIES_CACHE_MAX_ENTRIES, ttl=_CACHE_TTL_SECONDS)
+# Symphonies with a background refresh queued or running.  Claims expire so a
+# task that never ran (e.g. the client disconnected first) cannot block
+# refreshes for the rest of the process.
+_REFRESH_CLAIM_TTL = 300  # seconds
+_refreshing = TTLCache(maxsize=_VERSIONS_CACHE_MAX_ENTRIES, ttl=_REFRESH_CLAIM_TTL)
+_refreshing_lock = Lock()
+_BACKTEST_EPOCH = np.datetime64("2020-01-01", "D")
+# Layout of dvm_series_blob: day-sorted (day offset, portfolio value) records.
+DVM_SERIES_DTYPE = np.dtype([("day", "<i4"), ("value", "<f8")])
+# summary_metrics keys; each is stored in the SymphonyBacktestCache column of the same name.
+SUMMARY_METRIC_KEYS = (
+    "cumulative_return_pct",
+    "annualized_return",
+    "annualized_return_cum",
+    "time_weighted_return",
+    "cagr",
+    "sharpe_ratio",
+    "sortino_ratio",
+    "calmar_ratio",
+    "max_drawdown",
+    "annualized_volatility",
+    "win_rate",
+    "best_day_pct",
+    "worst_day_pct",
+    "profit_factor",
+    "median_drawdown",
+    "longest_drawdown_days",
+    "median_drawdown_days",
+)
+
+
+def _json_loads(text: str):
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except ValueError:
+            pass  # e.g. NaN/Infinity tokens written by stdlib json
+    return json.loads(text)
+
+
+def _json_dumps(value) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits
+    return json.dumps(value)
+
+
+def _response_body(payload: Dict) -> Optional[bytes]:
+    """Strict JSON for the HTTP response, or None if it cannot be encoded."""
+    try:
+        if orjson is not None:
+            return orjson.dumps(payload, option=_ORJSON_OPTIONS)
+        return json.dumps(payload, allow_nan=False).encode()
+    except (TypeError, ValueError):
+        return None
+
+
+def _payload_response(payload: Dict, body: Optional[bytes]) -> Union[Response, Dict]:
+    if body is None:
+        return payload
+    return Response(content=body, media_type="application/json")
 
 
-def _compute_backtest_summary(dvm_capital: Dict, first_day: int, last_market_day: int) -> Dict:
-    """Compute summary metrics from backtest dvm_capital series."""
+def dvm_series_records(dvm_capital: Dict) -> Optional[np.ndarray]:
+    """Day-sorted ``DVM_SERIES_DTYPE`` records of a backtest's value series.
+
+    ``dvm_capital`` is either ``{day: value}`` or keyed by series id with the
+    symphony's own series first.  Returns None when empty or unparseable.
+    """
     if not dvm_capital:
-        return {}
+        return None
+    series = next(iter(dvm_capital.values()))
+    if not isinstance(series, dict):
+        series = dvm_capital
+    if not series:
+        return None
+    records = np.empty(len(series), dtype=DVM_SERIES_DTYPE)
+    try:
+        records["day"] = [int(day) for day in series]
+        records["value"] = [float(value) for value in series.values()]
+    except (TypeError, ValueError, OverflowError):
+        return None
+    records.sort(order="day", kind="stable")
+    return records
 
-    sorted_keys = sorted(dvm_capital.keys(), key=lambda k: int(k))
-    if len(sorted_keys) < 2:
-        return {}
 
-    base_date = date(2020, 1, 1)
-    initial_value = dvm_capital[sorted_keys[0]]
-    daily_rows = []
-    for key in sorted_keys:
-        day_offset = int(key)
-        d = base_date + timedelta(days=day_offset)
-        daily_rows.append(
-            {
-                "date": d,
-                "portfolio_value": dvm_capital[key],
-                "net_deposits": initial_value,
-            }
+def unpack_dvm_series(blob: bytes) -> np.ndarray:
+    """Read-only view of a stored ``dvm_series_blob``; no parsing or sorting needed."""
+    return np.frombuffer(blob, dtype=DVM_SERIES_DTYPE)
+
+
+def get_cached_dvm_series(db: Session, symphony_id: str) -> Optional[Tuple[str, np.ndarray]]:
+    """(symphony name, sorted series) from a fresh cache row, if one was stored.
+
+    Only the row's epoch is read when this version was already decoded.
+    """
+    cached_at_epoch = (
+        db.query(SymphonyBacktestCache.cached_at_epoch)
+        .filter(SymphonyBacktestCache.symphony_id == symphony_id)
+        .scalar()
+    )
+    if cached_at_epoch is None or cached_at_epoch <= int(time.time()) - _CACHE_TTL_SECONDS:
+        return None
+    key = (symphony_id, cached_at_epoch)
+    decoded = _dvm_series_cache.get(key)
+    if decoded is not None:
+        return decoded
+
+    row = (
+        db.query(SymphonyBacktestCache.stats_json, SymphonyBacktestCache.dvm_series_blob)
+        .filter(SymphonyBacktestCache.symphony_id == symphony_id)
+        .first()
+    )
+    if row is None or not row.dvm_series_blob:
+        return None
+    stats = _json_loads(row.stats_json) if row.stats_json else {}
+    name = stats.get("name", "") if isinstance(stats, dict) else ""
+    decoded = (name, unpack_dvm_series(row.dvm_series_blob))
+    _dvm_series_cache.set(key, decoded)
+    return decoded
+
+
+def get_symphony_backtest_summary_data(
+    db: Session,
+    symphony_id: str,
+    keys: Optional[List[str]] = None,
+) -> Dict:
+    """Cached summary metrics for a symphony, limited to ``keys`` when given.
+
+    Only the requested columns are read; nothing is fetched from Composer.
+    """
+    summaries = get_backtest_summaries(db, [symphony_id], keys)
+    if symphony_id not in summaries:
+        raise HTTPException(404, "No cached backtest for this symphony")
+    return summaries[symphony_id]
+
+
+def get_backtest_summaries(
+    db: Session,
+    symphony_ids: List[str],
+    keys: Optional[List[str]] = None,
+) -> Dict[str, Dict]:
+    """Cached summary metrics for several symphonies in one query.
+
+    Symphonies without a cache row are left out of the result.
+    """
+    keys = list(dict.fromkeys(keys)) if keys else list(SUMMARY_METRIC_KEYS)
+    unknown = [key for key in keys if key not in SUMMARY_METRIC_KEYS]
+    if unknown:
+        raise HTTPException(400, f"Unknown summary metrics: {', '.join(unknown)}")
+
+    rows = (
+        db.query(
+            SymphonyBacktestCache.symphony_id,
+            SymphonyBacktestCache.summary_metrics_json,
+            *(getattr(SymphonyBacktestCache, key) for key in keys),
+        )
+        .filter(SymphonyBacktestCache.symphony_id.in_(symphony_ids))
+        .all()
+    )
+
+    summaries: Dict[str, Dict] = {}
+    for row in rows:
+        values = dict(zip(keys, row[2:]))
+        if all(value is None for value in values.values()) and row.summary_metrics_json:
+            legacy = _json_loads(row.summary_metrics_json)
+            values = {key: legacy.get(key) for key in keys}
+        summaries[row.symphony_id] = values
+    return summaries
+
+
+def _get_symphony_versions(client, symphony_id: str):
+    versions = _symphony_versions_cache.get(symphony_id)
+    if versions is None:
+        versions = client.get_symphony_versions(symphony_id)
+        if versions is not None:
+            _symphony_versions_cache.set(symphony_id, versions)
+    return versions
+
+
+def _upsert_backtest_cache(db: Session, symphony_id: str, cache_fields: Dict) -> None:
+    """Insert or replace one cache row in a single statement where supported."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        # One UPDATE without loading the old row (and its blobs) first.
+        updated = (
+            db.query(SymphonyBacktestCache)
+            .filter(SymphonyBacktestCache.symphony_id == symphony_id)
+            .update(cache_fields, synchronize_session=False)
         )
+        if not updated:
+            db.add(SymphonyBacktestCache(symphony_id=symphony_id, **cache_fields))
+        return
+
+    stmt = insert(SymphonyBacktestCache).values(symphony_id=symphony_id, **cache_fields)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[SymphonyBacktestCache.symphony_id],
+        set_={key: stmt.excluded[key] for key in cache_fields},
+    )
+    db.execute(stmt)
 
-    settings = get_settings()
-    metrics = compute_all_metrics(daily_rows, [], None, settings.risk_free_rate)
-    if not metrics:
+
+def _compute_backtest_summary(records: Optional[np.ndarray], first_day: int, last_market_day: int) -> Dict:
+    """Compute summary metrics from day-sorted backtest value records."""
+    if records is None or len(records) < 2:
         return {}
 
-    last = metrics[-1]
-    return {
-        "cumulative_return_pct": last.get("cumulative_return_pct", 0),
-        "annualized_return": last.get("annualized_return", 0),
-        "annualized_return_cum": last.get("annualized_return_cum", 0),
-        "time_weighted_return": last.get("time_weighted_return", 0),
-        "cagr": last.get("cagr", 0),
-        "sharpe_ratio": last.get("sharpe_ratio", 0),
-        "sortino_ratio": last.get("sortino_ratio", 0),
-        "calmar_ratio": last.get("calmar_ratio", 0),
-        "max_drawdown": last.get("max_drawdown", 0),
-        "annualized_volatility": last.get("annualized_volatility", 0),
-        "win_rate": last.get("win_rate", 0),
-        "best_day_pct": last.get("best_day_pct", 0),
-        "worst_day_pct": last.get("worst_day_pct", 0),
-        "profit_factor": last.get("profit_factor", 0),
-        "median_drawdown": last.get("median_drawdown", 0),
-        "longest_drawdown_days": last.get("longest_drawdown_days", 0),
-        "median_drawdown_days": last.get("median_drawdown_days", 0),
-    }
+    # Days are offsets from 2020-01-01; numpy does the date arithmetic.
+    dates = (_BACKTEST_EPOCH + records["day"].astype("timedelta64[D]")).tolist()
+    values = records["value"].tolist()
+
+    initial_value = values[0]
+    daily_rows = [
+        {"date": d, "portfolio_value": value, "net_deposits": initial_value}
+        for d, value in zip(dates, values)
+    ]
+
+    # Only the final day is summarized, so skip computing every earlier row.
+    last = compute_latest_metrics(daily_rows, [], get_settings().risk_free_rate)
+    if not last:
+        return {}
+    return {key: last.get(key, 0) for key in SUMMARY_METRIC_KEYS}
+
+
+def _summary_metrics_from_row(cached: SymphonyBacktestCache) -> Dict:
+    values = {key: getattr(cached, key) for key in SUMMARY_METRIC_KEYS}
+    if any(value is not None for value in values.values()):
+        return values
+    # Rows written before the summary columns existed keep only the JSON form.
+    return _json_loads(cached.summary_metrics_json) if cached.summary_metrics_json else {}
 
 
 def _serialize_cached_backtest(cached: SymphonyBacktestCache) -> Dict:
-    summary_metrics = json.loads(cached.summary_metrics_json) if cached.summary_metrics_json else {}
+    stats = _json_loads(cached.stats_json)
+    benchmarks = _json_loads(cached.benchmarks_json)
+    if isinstance(stats, dict) and "benchmarks" not in stats:
+        # stats_json is stored without the benchmarks subtree (see _fetch_and_store_backtest).
+        stats["benchmarks"] = benchmarks
     return {
-        "stats": json.loads(cached.stats_json),
-        "dvm_capital": json.loads(cached.dvm_capital_json),
-        "tdvm_weights": json.loads(cached.tdvm_weights_json),
-        "benchmarks": json.loads(cached.benchmarks_json),
-        "summary_metrics": summary_metrics,
+        "stats": stats,
+        "dvm_capital": _json_loads(cached.dvm_capital_json),
+        "tdvm_weights": _json_loads(cached.tdvm_weights_json),
+        "benchmarks": benchmarks,
+        "summary_metrics": _summary_metrics_from_row(cached),
         "first_day": cached.first_day,
         "last_market_day": cached.last_market_day,
         "cached_at": cached.cached_at.isoformat(),
@@ -85,6 +304,54 @@ def _serialize_cached_backtest(cached: SymphonyBacktestCache) -> Dict:
     }
 
 
+def _get_cache_header(db: Session, symphony_id: str) -> Optional[SymphonyBacktestCache]:
+    """Cache row with only the freshness/ETag columns loaded.
+
+    The JSON and response-body columns load lazily on access, so stale
+    rows and 304 revalidations never read the large blobs.
+    """
+    return db.get(
+        SymphonyBacktestCache,
+        symphony_id,
+        options=[
+            load_only(
+                SymphonyBacktestCache.cached_at,
+                SymphonyBacktestCache.cached_at_epoch,
+                SymphonyBacktestCache.last_semantic_update_at,
+                SymphonyBacktestCache.response_encoding,
+            )
+        ],
+    )
+
+
+def _is_cache_fresh(cached: SymphonyBacktestCache, now_epoch: int) -> bool:
+    if cached.cached_at_epoch is not None:
+        return cached.cached_at_epoch > now_epoch - _CACHE_TTL_SECONDS
+    # Rows cached before cached_at_epoch existed; cached_at is naive UTC.
+    cutoff = datetime.fromtimestamp(now_epoch - _CACHE_TTL_SECONDS, timezone.utc).replace(tzinfo=None)
+    return cached.cached_at > cutoff
+
+
+def _cached_backtest_response(cached: SymphonyBacktestCache) -> Union[Response, Dict]:
+    if cached.response_blob and cached.response_encoding == _RESPONSE_ENCODING:
+        return Response(content=zlib.decompress(cached.response_blob), media_type="application/json")
+    # Rows written before any stored response existed are rebuilt from the
+    # columns and encoded directly rather than walked by jsonable_encoder.
+    payload = _serialize_cached_backtest(cached)
+    return _payload_response(payload, _response_body(payload))
+
+
+def _backtest_etag(symphony_id: str, cached_at_epoch: int, semantic_ts: Optional[str]) -> str:
+    return make_etag(symphony_id, cached_at_epoch, semantic_ts or "")
+
+
+def _cached_backtest_etag(cached: SymphonyBacktestCache) -> str:
+    cached_at_epoch = cached.cached_at_epoch
+    if cached_at_epoch is None:
+        cached_at_epoch = int(cached.cached_at.replace(tzinfo=timezone.utc).timestamp())
+    return _backtest_etag(cached.symphony_id, cached_at_epoch, cached.last_semantic_update_at)
+
+
 def get_symphony_backtest_data(
     db: Session,
     symphony_id: str,
@@ -92,53 +359,118 @@ def get_symphony_backtest_data(
     force_refresh: bool,
     get_client_for_account_fn: Callable[[Session, str], object],
     test_credential: str = "__TEST__",
-) -> Dict:
-    """Get backtest payload for a symphony, with TTL+semantic invalidation."""
-    acct = db.query(Account).filter_by(id=account_id).first()
-    if acct and acct.credential_name == test_credential:
-        cached = db.query(SymphonyBacktestCache).filter_by(symphony_id=symphony_id).first()
+    if_none_match: Optional[str] = None,
+    background_tasks: Optional[BackgroundTasks] = None,
+) -> Response:
+    """Get backtest payload for a symphony, with TTL+semantic invalidation.
+
+    Cache hits return the stored response body directly, skipping the
+    parse/re-serialize round trip, or a bodiless 304 when ``if_none_match``
+    already names the cached version.  With ``background_tasks``, a cache
+    entry made stale by a symphony edit is still served and refreshed after
+    the response instead of blocking on the export and re-fetch.
+    """
+    credential_name = get_account_credential_name(db, account_id)
+    if credential_name == test_credential:
+        cached = _get_cache_header(db, symphony_id)
         if cached:
-            return _serialize_cached_backtest(cached)
+            return conditional_response(
+                if_none_match, _cached_backtest_etag(cached), lambda: _cached_backtest_response(cached)
+            )
         raise HTTPException(404, "No cached backtest for test symphony")
 
     client = get_client_for_account_fn(db, account_id)
-    use_cache = False
-    cached = None
 
     if not force_refresh:
-        cached = db.query(SymphonyBacktestCache).filter_by(symphony_id=symphony_id).first()
-        if cached and cached.cached_at > datetime.utcnow() - timedelta(hours=CACHE_TTL_HOURS):
-            stale = False
-            try:
-                versions = client.get_symphony_versions(symphony_id)
-                if versions:
-                    newest = versions[0] if isinstance(versions, list) else {}
-                    newest_ts = newest.get("created_at") or newest.get("updated_at") or ""
-                    if newest_ts and cached.last_semantic_update_at:
-                        stale = newest_ts > cached.last_semantic_update_at
-                    elif newest_ts and not cached.last_semantic_update_at:
-                        stale = True
-            except Exception:
-                pass
-
-            if stale:
-                try:
-                    sym_stats = client.get_symphony_stats(account_id)
-                    sym_name = next(
-                        (s.get("name", symphony_id) for s in sym_stats if s.get("id") == symphony_id),
-                        symphony_id,
-                    )
-                    export_single_symphony(client, symphony_id, sym_name)
-                except Exception as exc:
-                    logger.debug("Symphony export on edit failed for %s: %s", symphony_id, exc)
-            else:
-                use_cache = True
-
-    if use_cache and cached:
-        logger.info("Serving cached backtest for %s", symphony_id)
-        return _serialize_cached_backtest(cached)
+        cached = _get_cache_header(db, symphony_id)
+        if cached and _is_cache_fresh(cached, int(time.time())):
+            stale = _is_semantically_stale(client, symphony_id, cached)
+            if stale and background_tasks is not None:
+                # Serve the previous version now; the edit is re-exported and
+                # re-cached once the response has been sent.
+                _schedule_backtest_refresh(background_tasks, symphony_id, account_id, get_client_for_account_fn)
+            if not stale or background_tasks is not None:
+                logger.info("Serving cached backtest for %s", symphony_id)
+                return conditional_response(
+                    if_none_match, _cached_backtest_etag(cached), lambda: _cached_backtest_response(cached)
+                )
+            _export_edited_symphony(client, symphony_id, account_id)
 
     logger.info("Fetching fresh backtest for %s (force=%s)", symphony_id, force_refresh)
+    response, etag = _fetch_and_store_backtest(db, client, symphony_id, account_id)
+    return conditional_response(None, etag, lambda: response)
+
+
+def _is_semantically_stale(client, symphony_id: str, cached: SymphonyBacktestCache) -> bool:
+    """True when the symphony was edited after the cached backtest was taken."""
+    try:
+        versions = _get_symphony_versions(client, symphony_id)
+        if versions:
+            newest = versions[0] if isinstance(versions, list) else {}
+            newest_ts = newest.get("created_at") or newest.get("updated_at") or ""
+            if newest_ts and cached.last_semantic_update_at:
+                return newest_ts > cached.last_semantic_update_at
+            if newest_ts and not cached.last_semantic_update_at:
+                return True
+    except Exception:
+        pass
+    return False
+
+
+def _export_edited_symphony(client, symphony_id: str, account_id: str) -> None:
+    try:
+        sym_stats = client.get_symphony_stats(account_id)
+        sym_name = next(
+            (s.get("name", symphony_id) for s in sym_stats if s.get("id") == symphony_id),
+            symphony_id,
+        )
+        export_single_symphony(client, symphony_id, sym_name)
+    except Exception as exc:
+        logger.debug("Symphony export on edit failed for %s: %s", symphony_id, exc)
+
+
+def _schedule_backtest_refresh(
+    background_tasks: BackgroundTasks,
+    symphony_id: str,
+    account_id: str,
+    get_client_for_account_fn: Callable[[Session, str], object],
+) -> None:
+    with _refreshing_lock:
+        if symphony_id in _refreshing:
+            return
+        _refreshing.set(symphony_id, True)
+    background_tasks.add_task(_refresh_stale_backtest, symphony_id, account_id, get_client_for_account_fn)
+
+
+def _refresh_stale_backtest(
+    symphony_id: str,
+    account_id: str,
+    get_client_for_account_fn: Callable[[Session, str], object],
+) -> None:
+    """Re-export an edited symphony and re-cache its backtest, outside the request."""
+    db = SessionLocal()
+    try:
+        client = get_client_for_account_fn(db, account_id)
+        _export_edited_symphony(client, symphony_id, account_id)
+        _fetch_and_store_backtest(db, client, symphony_id, account_id)
+    except Exception as exc:
+        db.rollback()
+        logger.warning("Background backtest refresh failed for %s: %s", symphony_id, exc)
+    finally:
+        db.close()
+        with _refreshing_lock:
+            _refreshing.pop(symphony_id)
+
+
+def _fetch_and_store_backtest(
+    db: Session, client, symphony_id: str, account_id: str
+) -> Tuple[Union[Response, Dict], str]:
+    """Fetch a backtest from Composer, cache it, and return (response, etag).
+
+    The response body is encoded once and reused for both the stored blob and
+    the reply; payloads that are not strict JSON come back as the dict.
+    """
+    _symphony_versions_cache.pop(symphony_id, None)
     try:
         data = client.get_symphony_backtest(symphony_id)
     except Exception as exc:
@@ -152,34 +484,13 @@ def get_symphony_backtest_data(
     last_market_day = data.get("last_market_day", 0)
     semantic_ts = data.get("last_semantic_update_at", "")
 
-    dvm_series = {}
-    if dvm_capital:
-        first_key = next(iter(dvm_capital))
-        dvm_series = dvm_capital[first_key] if isinstance(dvm_capital[first_key], dict) else dvm_capital
-    summary_metrics = _compute_backtest_summary(dvm_series, first_day, last_market_day)
+    dvm_records = dvm_series_records(dvm_capital)
+    summary_metrics = _compute_backtest_summary(dvm_records, first_day, last_market_day)
 
-    existing = db.query(SymphonyBacktestCache).filter_by(symphony_id=symphony_id).first()
-    now = datetime.utcnow()
-    cache_fields = dict(
-        account_id=account_id,
-        cached_at=now,
-        stats_json=json.dumps(stats),
-        dvm_capital_json=json.dumps(dvm_capital),
-        tdvm_weights_json=json.dumps(tdvm_weights),
-        benchmarks_json=json.dumps(benchmarks),
-        summary_metrics_json=json.dumps(summary_metrics),
-        first_day=first_day,
-        last_market_day=last_market_day,
-        last_semantic_update_at=semantic_ts or None,
-    )
-    if existing:
-        for key, value in cache_fields.items():
-            setattr(existing, key, value)
-    else:
-        db.add(SymphonyBacktestCache(symphony_id=symphony_id, **cache_fields))
-    db.commit()
-
-    return {
+    now_aware = datetime.now(timezone.utc)
+    now = now_aware.replace(tzinfo=None)  # cached_at is stored as naive UTC
+    now_epoch = int(now_aware.timestamp())
+    payload: Dict = {
         "stats": stats,
         "dvm_capital": dvm_capital,
         "tdvm_weights": tdvm_weights,
@@ -190,3 +501,27 @@ def get_symphony_backtest_data(
         "cached_at": now.isoformat(),
         "last_semantic_update_at": semantic_ts or "",
     }
+    body = _response_body(payload)
+
+    cache_fields = dict(
+        account_id=account_id,
+        cached_at=now,
+        cached_at_epoch=now_epoch,
+        # benchmarks_json already holds stats["benchmarks"]; don't store it twice.
+        stats_json=_json_dumps({key: value for key, value in stats.items() if key != "benchmarks"}),
+        dvm_capital_json=_json_dumps(dvm_capital),
+        tdvm_weights_json=_json_dumps(tdvm_weights),
+        benchmarks_json=_json_dumps(benchmarks),
+        summary_metrics_json="{}",
+        **{key: summary_metrics.get(key) for key in SUMMARY_METRIC_KEYS},
+        first_day=first_day,
+        last_market_day=last_market_day,
+        last_semantic_update_at=semantic_ts or None,
+        response_blob=zlib.compress(body, _RESPONSE_COMPRESS_LEVEL) if body is not None else None,
+        response_encoding=_RESPONSE_ENCODING,
+        dvm_series_blob=dvm_records.tobytes() if dvm_records is not None else None,
+    )
+    _upsert_backtest_cache(db, symphony_id, cache_fields)
+    db.commit()
+
+    return _payload_response(payload, body), _backtest_etag(symphony_id, now_epoch, semantic_ts)
@@ -1,12 +1,14 @@
 """Benchmark history read service."""
 
-from collections import OrderedDict
 import logging
 import math
-import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import date
 from typing import Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 from fastapi import HTTPException
 from sqlalchemy import func
 from sqlalchemy.orm import Session
@@ -25,33 +27,39 @@ from app.services.finnhub_market_data import (
     get_daily_closes_stooq,
     get_latest_price,
 )
-from app.services.metrics import compute_mwr
+from app.services.metrics import compute_mwr_window, compute_return_drawdown_series, sort_cash_flows
+from app.services.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
-_benchmark_cache: "OrderedDict[Tuple[str, str, str, str], Tuple[float, list]]" = OrderedDict()
 _BENCHMARK_TTL = 3600  # 1 hour
 _BENCHMARK_CACHE_MAX = 256
+# (ticker, start, end, account scope) -> result rows.  Sync routes run in a
+# thread pool, so the cache must be safe to share between requests.
+_benchmark_cache = TTLCache(maxsize=_BENCHMARK_CACHE_MAX, ttl=_BENCHMARK_TTL)
+# Upstream misses are remembered too, so a ticker Stooq lacks (or Finnhub
+# refuses) is not re-requested on every uncached benchmark read.
+_STOOQ_MISS_TTL = 600  # 10 minutes
+_FINNHUB_DENIED_TTL = 3600  # 1 hour
+# Stooq gets this long on its own before Finnhub is asked in parallel, so a
+# normal Stooq hit costs no Finnhub quota.
+_STOOQ_HEAD_START_SECONDS = 1.5
+_stooq_miss_cache = TTLCache(maxsize=_BENCHMARK_CACHE_MAX, ttl=_STOOQ_MISS_TTL)  # (ticker, start, end)
+_finnhub_denied_cache = TTLCache(maxsize=_BENCHMARK_CACHE_MAX, ttl=_FINNHUB_DENIED_TTL)  # ticker -> detail
+# Today's live quote, shared by reads of different ranges/scopes for a minute.
+_LATEST_PRICE_TTL = 60
+_latest_price_cache = TTLCache(maxsize=_BENCHMARK_CACHE_MAX, ttl=_LATEST_PRICE_TTL)  # ticker -> price
 _POLYGON_BENCHMARK_FAILURE_DETAIL = "Polygon benchmark data unavailable"
 
 
-def _get_cached_benchmark(cache_key: Tuple[str, str, str, str]) -> Optional[list]:
-    cached = _benchmark_cache.get(cache_key)
-    if not cached:
-        return None
-    ts, cached_data = cached
-    if time.time() - ts >= _BENCHMARK_TTL:
-        _benchmark_cache.pop(cache_key, None)
-        return None
-    _benchmark_cache.move_to_end(cache_key)
-    return cached_data
+def _remember_finnhub_denial(ticker: str) -> Callable[[Future], None]:
+    """Done-callback caching a Finnhub access denial, even if the result goes unread."""
 
+    def callback(future: Future) -> None:
+        if not future.cancelled() and isinstance(future.exception(), FinnhubAccessError):
+            _finnhub_denied_cache.set(ticker, str(future.exception()))
 
-def _set_cached_benchmark(cache_key: Tuple[str, str, str, str], payload: list) -> None:
-    _benchmark_cache[cache_key] = (time.time(), payload)
-    _benchmark_cache.move_to_end(cache_key)
-    while len(_benchmark_cache) > _BENCHMARK_CACHE_MAX:
-        _benchmark_cache.popitem(last=False)
+    return callback
 
 
 def get_benchmark_history_data(
@@ -94,22 +102,51 @@ def get_benchmark_history_data(
     account_scope = ",".join(sorted(resolved_account_ids))
     cache_key = (ticker, s_date, e_date, account_scope)
 
-    cached_data = _get_cached_benchmark(cache_key)
+    cached_data = _benchmark_cache.get(cache_key)
     if cached_data is not None:
         return {"ticker": ticker, "data": cached_data}
 
-    closes: List[Tuple[date, float]] = get_daily_closes_stooq_fn(ticker, start_dt, end_dt)
+    stooq_key = (ticker, s_date, e_date)
+    # A recent access denial is reported again without asking Finnhub.
+    finnhub_error: Optional[str] = _finnhub_denied_cache.get(ticker)
+    closes: List[Tuple[date, float]] = []
+    finnhub_future: Optional[Future] = None
+    pool = ThreadPoolExecutor(max_workers=2)
 
-    finnhub_error: Optional[str] = None
-    if not closes:
-        try:
-            closes = get_daily_closes_fn(ticker, start_dt, end_dt)
-        except FinnhubAccessError as exc:
-            finnhub_error = str(exc)
-            logger.warning("Finnhub access denied for %s candles: %s", ticker, exc)
-        except FinnhubError as exc:
-            finnhub_error = str(exc)
-            logger.warning("Finnhub candle request failed for %s: %s", ticker, exc)
+    def submit_finnhub() -> Optional[Future]:
+        if finnhub_error is not None:
+            return None
+        future = pool.submit(get_daily_closes_fn, ticker, start_dt, end_dt)
+        future.add_done_callback(_remember_finnhub_denial(ticker))
+        return future
+
+    try:
+        if stooq_key not in _stooq_miss_cache:
+            stooq_future = pool.submit(get_daily_closes_stooq_fn, ticker, start_dt, end_dt)
+            try:
+                closes = stooq_future.result(timeout=_STOOQ_HEAD_START_SECONDS)
+            except FuturesTimeoutError:
+                # Stooq is slow: overlap the Finnhub round trip with the rest
+                # of it.  Fast Stooq hits never spend Finnhub quota.
+                finnhub_future = submit_finnhub()
+                closes = stooq_future.result()
+            if not closes:
+                _stooq_miss_cache.set(stooq_key, True)
+
+        if not closes:
+            if finnhub_future is None:
+                finnhub_future = submit_finnhub()
+            if finnhub_future is not None:
+                try:
+                    closes = finnhub_future.result()
+                except FinnhubAccessError as exc:
+                    finnhub_error = str(exc)
+                    logger.warning("Finnhub access denied for %s candles: %s", ticker, exc)
+                except FinnhubError as exc:
+                    finnhub_error = str(exc)
+                    logger.warning("Finnhub candle request failed for %s: %s", ticker, exc)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
 
     polygon_error: Optional[str] = None
     if not closes:
@@ -126,7 +163,7 @@ def get_benchmark_history_data(
 
     if not closes:
         db_rows = (
-            db.query(BenchmarkData)
+            db.query(BenchmarkData.date, BenchmarkData.close)
             .filter(
                 BenchmarkData.symbol == ticker,
                 BenchmarkData.date >= start_dt,
@@ -164,32 +201,27 @@ def get_benchmark_history_data(
 
     today = date.today()
     if closes[-1][0] < today <= end_dt:
-        try:
-            live_price = get_latest_price_fn(ticker)
+        live_price = _latest_price_cache.get(ticker)
+        if live_price is None:
+            try:
+                live_price = get_latest_price_fn(ticker)
+            except FinnhubError:
+                live_price = None
             if live_price and not math.isnan(live_price):
-                closes.append((today, float(live_price)))
+                _latest_price_cache.set(ticker, float(live_price))
             else:
-                closes.append((today, closes[-1][1]))
-        except FinnhubError:
-            closes.append((today, closes[-1][1]))
-
-    first_close = closes[0][1]
-    twr_series: List[float] = []
-    for _, close in closes:
-        twr_series.append(round(((close / first_close) - 1) * 100, 4))
-
-    peak = first_close
-    dd_series: List[float] = []
-    for _, close in closes:
-        if close > peak:
-            peak = close
-        drawdown = ((close / peak) - 1) * 100 if peak > 0 else 0.0
-        dd_series.append(round(drawdown, 4))
+                live_price = None
+        closes.append((today, float(live_price) if live_price is not None else closes[-1][1]))
+
+    close_arr = np.fromiter((close for _, close in closes), dtype=np.float64, count=len(closes))
+    twr_arr, dd_arr = compute_return_drawdown_series(close_arr)
+    twr_series: List[float] = twr_arr.tolist()
+    dd_series: List[float] = dd_arr.tolist()
 
     mwr_series: List[float] = [0.0] * len(closes)
     if resolved_account_ids:
-        cf_query = (
-            db.query(CashFlow)
+        cf_rows = (
+            db.query(CashFlow.date, CashFlow.amount)
             .filter(
                 CashFlow.account_id.in_(resolved_account_ids),
                 func.lower(CashFlow.type).in_(["deposit", "withdrawal"]),
@@ -198,47 +230,55 @@ def get_benchmark_history_data(
             .all()
         )
 
-        ext_flows: Dict[date, float] = {}
-        for cash_flow in cf_query:
-            flow_date = (
-                cash_flow.date
-                if isinstance(cash_flow.date, date)
-                else date.fromisoformat(str(cash_flow.date))
-            )
-            ext_flows[flow_date] = ext_flows.get(flow_date, 0) + cash_flow.amount
+        ext_flows: Dict[date, float] = defaultdict(float)
+        for flow_date, amount in cf_rows:
+            if not isinstance(flow_date, date):
+                flow_date = date.fromisoformat(str(flow_date))
+            ext_flows[flow_date] += amount
 
         if ext_flows:
-            shares_acc = 0.0
-            hypo_pv_list: List[float] = []
-            bench_date_list: List[date] = []
-
-            for bench_date, bench_close in closes:
-                if bench_date in ext_flows and bench_close > 0:
-                    shares_acc += ext_flows[bench_date] / bench_close
-                hypo_pv_list.append(shares_acc * bench_close if shares_acc > 0 else 0.0)
-                bench_date_list.append(bench_date)
+            # Flows are sparse next to the daily closes: place each one at
+            # its trading day instead of probing every day for a flow.
+            date_index = {bench_date: i for i, (bench_date, _) in enumerate(closes)}
+            flow_arr = np.zeros_like(close_arr)
+            for flow_date, amount in ext_flows.items():
+                idx = date_index.get(flow_date)
+                if idx is not None:
+                    flow_arr[idx] = amount
+            # Shares bought/sold by each external flow at that day's close.
+            share_deltas = np.divide(
+                flow_arr, close_arr, out=np.zeros_like(close_arr), where=close_arr > 0
+            )
+            shares = np.cumsum(share_deltas)
+            hypo_pv_list: List[float] = np.where(shares > 0, shares * close_arr, 0.0).tolist()
 
+            # Each day's MWR only depends on the window endpoints, so no
+            # per-day prefix slices of the date/value lists are built.
+            first_date = closes[0][0]
+            flows = sort_cash_flows(ext_flows)
+            irr_guess: Optional[float] = None
             for i in range(1, len(closes)):
                 if hypo_pv_list[i] > 0:
                     try:
-                        _, mwr_period = compute_mwr(
-                            bench_date_list[: i + 1], hypo_pv_list[: i + 1], ext_flows
+                        irr_guess, mwr_period = compute_mwr_window(
+                            first_date, closes[i][0], hypo_pv_list[0], hypo_pv_list[i], flows, irr_guess
                         )
                         mwr_series[i] = round(mwr_period * 100, 4)
                     except Exception:
                         pass
 
-    result = []
-    for i, (row_date, row_close) in enumerate(closes):
-        result.append(
-            {
-                "date": str(row_date),
-                "close": round(row_close, 2),
-                "return_pct": twr_series[i],
-                "drawdown_pct": dd_series[i],
-                "mwr_pct": mwr_series[i],
-            }
+    result = [
+        {
+            "date": str(row_date),
+            "close": round(row_close, 2),
+            "return_pct": return_pct,
+            "drawdown_pct": drawdown_pct,
+            "mwr_pct": mwr_pct,
+        }
+        for (row_date, row_close), return_pct, drawdown_pct, mwr_pct in zip(
+            closes, twr_series, dd_series, mwr_series
         )
+    ]
 
-    _set_cached_benchmark(cache_key, result)
+    _benchmark_cache.set(cache_key, result)
     return {"ticker": ticker, "data": result}
@@ -1,17 +1,40 @@
 """Shared date parsing and period-range helpers for API routers."""
 
+import re
 from datetime import date, timedelta
-from typing import Optional
+from typing import Callable, Dict, Optional
 
 from fastapi import HTTPException
 
+# Exactly YYYY-MM-DD; date.fromisoformat also takes compact and ISO week forms.
+_ISO_DATE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+
+_PERIOD_OFFSETS = {
+    "1D": timedelta(days=1),
+    "1W": timedelta(weeks=1),
+    "1M": timedelta(days=30),
+    "3M": timedelta(days=90),
+    "1Y": timedelta(days=365),
+}
+# Period preset -> start date for a given "today"; "ALL" and unknown presets are unbounded.
+_PERIOD_STARTS: Dict[str, Callable[[date], date]] = {
+    "YTD": lambda today: date(today.year, 1, 1),
+    **{
+        period: (lambda today, offset=offset: today - offset)
+        for period, offset in _PERIOD_OFFSETS.items()
+    },
+}
+
 
 def parse_iso_date(value: str, field_name: str) -> date:
     """Parse a YYYY-MM-DD date string or raise HTTP 400."""
-    try:
-        return date.fromisoformat(value)
-    except ValueError:
-        raise HTTPException(400, f"Invalid {field_name}: expected YYYY-MM-DD")
+    match = _ISO_DATE.fullmatch(value)
+    if match is not None:
+        try:
+            return date(int(match[1]), int(match[2]), int(match[3]))
+        except ValueError:
+            pass  # well-formed but not a calendar date, e.g. 2025-02-30
+    raise HTTPException(400, f"Invalid {field_name}: expected YYYY-MM-DD")
 
 
 def resolve_date_range(
@@ -27,17 +50,7 @@ def resolve_date_range(
             raise HTTPException(400, "start_date cannot be after end_date")
         return (start, end)
 
-    if period and period != "ALL":
-        today = date.today()
-        offsets = {
-            "1D": timedelta(days=1),
-            "1W": timedelta(weeks=1),
-            "1M": timedelta(days=30),
-            "3M": timedelta(days=90),
-            "1Y": timedelta(days=365),
-        }
-        if period == "YTD":
-            return (date(today.year, 1, 1), None)
-        if period in offsets:
-            return (today - offsets[period], None)
+    period_start = _PERIOD_STARTS.get(period) if period else None
+    if period_start is not None:
+        return (period_start(date.today()), None)
     return (None, None)
@@ -3,17 +3,32 @@
 from __future__ import annotations
 
 import csv
-import io
 import logging
 from datetime import date, datetime, time, timedelta, timezone
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 
 from app.config import load_finnhub_key, load_polygon_key
 
 logger = logging.getLogger(__name__)
 
+_HTTP_POOL_MAXSIZE = 16  # connections per host for concurrent benchmark/price reads
+
+
+def _build_http_session() -> requests.Session:
+    """Process-wide session so paginated and repeated market-data calls reuse TLS connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=_HTTP_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_http = _build_http_session()
+
 _FINNHUB_BASE_URL = "https://finnhub.io/api/v1"
 _STOOQ_DAILY_URL = "https://stooq.com/q/d/l/"
 _POLYGON_SPLITS_URL = "https://api.polygon.io/v3/reference/splits"
@@ -56,36 +71,22 @@ def get_daily_closes_stooq(symbol: str, start_date: date, end_date: date) -> Lis
 
     for stooq_symbol in candidates:
         try:
-            resp = requests.get(
+            with _http.get(
                 _STOOQ_DAILY_URL,
                 params={"s": stooq_symbol, "d1": d1, "d2": d2, "i": "d"},
                 timeout=20,
-            )
-            resp.raise_for_status()
+                stream=True,
+            ) as resp:
+                resp.raise_for_status()
+                # Stooq omits the charset; without one iter_lines yields bytes.
+                resp.encoding = resp.encoding or "utf-8"
+                rows_by_date = _parse_stooq_closes(
+                    resp.iter_lines(decode_unicode=True), start_date, end_date
+                )
         except requests.RequestException as e:
             logger.warning("Stooq request failed for %s: %s", stooq_symbol, e)
             continue
 
-        txt = (resp.text or "").strip()
-        if not txt or txt.lower().startswith("no data"):
-            continue
-
-        rows_by_date: Dict[date, float] = {}
-        reader = csv.DictReader(io.StringIO(txt))
-        for row in reader:
-            ds = (row.get("Date") or "").strip()
-            cs = (row.get("Close") or "").strip()
-            if not ds or not cs:
-                continue
-            try:
-                d = date.fromisoformat(ds)
-                if d < start_date or d > end_date:
-                    continue
-                c = float(cs)
-            except Exception:
-                continue
-            rows_by_date[d] = c
-
         rows = sorted(rows_by_date.items(), key=lambda x: x[0])
         if rows:
             logger.debug("Stooq candles %s: %d rows", stooq_symbol, len(rows))
@@ -94,6 +95,40 @@ def get_daily_closes_stooq(symbol: str, start_date: date, end_date: date) -> Lis
     return []
 
 
+def _parse_stooq_closes(lines: Iterable[str], start_date: date, end_date: date) -> Dict[date, float]:
+    """Closes by date from Stooq CSV lines, read one row at a time.
+
+    Columns are located from the header once; a "No data" body has no
+    Date/Close header and yields nothing.
+    """
+    reader = csv.reader(line for line in lines if line)
+    header = [name.strip().lstrip("\ufeff") for name in next(reader, [])]
+    try:
+        date_idx = header.index("Date")
+        close_idx = header.index("Close")
+    except ValueError:
+        return {}
+    width = max(date_idx, close_idx) + 1
+
+    rows_by_date: Dict[date, float] = {}
+    for row in reader:
+        if len(row) < width:
+            continue
+        ds = row[date_idx].strip()
+        cs = row[close_idx].strip()
+        if not ds or not cs:
+            continue
+        try:
+            d = date.fromisoformat(ds)
+            if d < start_date or d > end_date:
+                continue
+            c = float(cs)
+        except Exception:
+            continue
+        rows_by_date[d] = c
+    return rows_by_date
+
+
 def get_splits_polygon(symbol: str, start_date: date, end_date: date) -> List[Tuple[date, float]]:
     """Return split events as (date, quantity_multiplier) from Polygon."""
     symbol = symbol.strip().upper()
@@ -120,7 +155,7 @@ def get_splits_polygon(symbol: str, start_date: date, end_date: date) -> List[Tu
     while url and pages < 10:
         pages += 1
         try:
-            resp = requests.get(url, params=params, timeout=20)
+            resp = _http.get(url, params=params, timeout=20)
         except requests.RequestException as e:
             raise PolygonError(f"Polygon request failed: {e}") from e
         params = None
@@ -200,7 +235,7 @@ def get_daily_closes_polygon(symbol: str, start_date: date, end_date: date) -> L
         end=end_date.isoformat(),
     )
     try:
-        resp = requests.get(
+        resp = _http.get(
             url,
             params={
                 "adjusted": "true",
@@ -276,7 +311,7 @@ def _request_json(path: str, params: Dict[str, object], timeout: int = 20):
     req_params["token"] = key
 
     try:
-        resp = requests.get(f"{_FINNHUB_BASE_URL}{path}", params=req_params, timeout=timeout)
+        resp = _http.get(f"{_FINNHUB_BASE_URL}{path}", params=req_params, timeout=timeout)
     except requests.RequestException as e:
         raise FinnhubError(f"Finnhub request failed: {e}") from e
 
@@ -339,21 +374,43 @@ def get_daily_closes(symbol: str, start_date: date, end_date: date) -> List[Tupl
     if not isinstance(ts_series, list) or not isinstance(close_series, list):
         raise FinnhubError("Finnhub candle payload missing time/close arrays.")
 
-    rows_by_date: Dict[date, float] = {}
-    for ts, close_val in zip(ts_series, close_series):
-        try:
-            d = datetime.fromtimestamp(int(ts), tz=timezone.utc).date()
-            c = float(close_val)
-        except Exception:
-            continue
-        if start_date <= d <= end_date:
-            rows_by_date[d] = c
-
-    rows = sorted(rows_by_date.items(), key=lambda x: x[0])
+    rows = sorted(_candle_closes_by_date(ts_series, close_series, start_date, end_date).items())
     logger.debug("Finnhub candles %s: %d rows", symbol, len(rows))
     return rows
 
 
+def _candle_closes_by_date(
+    ts_series: list, close_series: list, start_date: date, end_date: date
+) -> Dict[date, float]:
+    """UTC day -> close for candle points within [start_date, end_date].
+
+    Well-formed series are converted in one vectorized pass; anything numpy
+    cannot coerce falls back to skipping bad points one at a time.
+    """
+    n = min(len(ts_series), len(close_series))
+    try:
+        if None in close_series[:n]:
+            raise TypeError("null close")  # numpy would coerce it to NaN
+        ts_arr = np.asarray(ts_series[:n], dtype=np.int64)
+        close_arr = np.asarray(close_series[:n], dtype=np.float64)
+    except (TypeError, ValueError, OverflowError):
+        rows_by_date: Dict[date, float] = {}
+        for ts, close_val in zip(ts_series, close_series):
+            try:
+                d = datetime.fromtimestamp(int(ts), tz=timezone.utc).date()
+                c = float(close_val)
+            except Exception:
+                continue
+            if start_date <= d <= end_date:
+                rows_by_date[d] = c
+        return rows_by_date
+
+    days = ts_arr.astype("datetime64[s]").astype("datetime64[D]")
+    mask = (days >= np.datetime64(start_date, "D")) & (days <= np.datetime64(end_date, "D"))
+    # Later points win for duplicate days, as with per-point assignment.
+    return dict(zip(days[mask].tolist(), close_arr[mask].tolist()))
+
+
 def get_latest_price(symbol: str) -> float | None:
     """Return the latest Finnhub quote price for a symbol, if available."""
     symbol = symbol.strip().upper()
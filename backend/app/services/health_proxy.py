@@ -4,35 +4,65 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
-import requests
 from fastapi import WebSocket, WebSocketDisconnect
 
 from app.config import load_finnhub_key
+from app.services.finnhub_market_data import _http
+from app.services.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+_FINNHUB_QUOTE_URL = "https://finnhub.io/api/v1/quote"
+_MAX_QUOTE_SYMBOLS = 50
+# Concurrent quote calls; matches the shared market-data session's per-host pool.
+_QUOTE_FETCH_MAX_WORKERS = 16
+_QUOTE_CACHE_TTL = 3  # seconds; absorbs rapid dashboard refreshes without staling ticks
+
+_quote_cache = TTLCache(maxsize=4096, ttl=_QUOTE_CACHE_TTL)
+
 
 def get_finnhub_quote_proxy_data(symbols: str) -> dict:
-    """Proxy Finnhub quote requests so the API key never reaches the browser."""
+    """Proxy Finnhub quote requests so the API key never reaches the browser.
+
+    Quotes fetched in the last few seconds are served from memory; the rest
+    are fetched concurrently over the market-data session, which already
+    keeps connections to finnhub.io warm.  The result keeps request order
+    and omits symbols whose quote call failed.
+    """
     api_key = load_finnhub_key()
     if not api_key:
         return {}
 
-    symbol_list = [item.strip().upper() for item in symbols.split(",") if item.strip()]
-    result: dict = {}
-    for symbol in symbol_list[:50]:
+    symbol_list = list(
+        dict.fromkeys(item.strip().upper() for item in symbols.split(",") if item.strip())
+    )[:_MAX_QUOTE_SYMBOLS]
+    if not symbol_list:
+        return {}
+
+    def fetch(symbol: str) -> Optional[dict]:
         try:
-            resp = requests.get(
-                "https://finnhub.io/api/v1/quote",
+            resp = _http.get(
+                _FINNHUB_QUOTE_URL,
                 params={"symbol": symbol, "token": api_key},
                 timeout=5,
             )
             if resp.ok:
-                result[symbol] = resp.json()
+                quote = resp.json()
+                _quote_cache.set(symbol, quote)
+                return quote
         except Exception:
             pass
-    return result
+        return None
+
+    quotes = {symbol: _quote_cache.get(symbol) for symbol in symbol_list}
+    missing = [symbol for symbol, quote in quotes.items() if quote is None]
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(_QUOTE_FETCH_MAX_WORKERS, len(missing))) as pool:
+            quotes.update(zip(missing, pool.map(fetch, missing)))
+    return {symbol: quote for symbol, quote in quotes.items() if quote is not None}
 
 
 async def proxy_finnhub_ws(websocket: WebSocket) -> None:
@@ -60,11 +90,17 @@ async def proxy_finnhub_ws(websocket: WebSocket) -> None:
             async def upstream_to_client() -> None:
                 try:
                     async for message in upstream:
-                        await websocket.send_text(message)
+                        # Pass frames through in their original type, no re-encoding.
+                        if isinstance(message, str):
+                            await websocket.send_text(message)
+                        else:
+                            await websocket.send_bytes(message)
                 except Exception:
                     pass
 
-            await asyncio.gather(client_to_upstream(), upstream_to_client())
+            async with asyncio.TaskGroup() as tasks:
+                tasks.create_task(client_to_upstream())
+                tasks.create_task(upstream_to_client())
     except Exception as exc:
         logger.debug("Finnhub WS proxy closed: %s", exc)
     finally:
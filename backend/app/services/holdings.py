@@ -1,8 +1,10 @@
 """Reconstruct historical holdings by replaying trade-activity transactions."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from app.services.finnhub_market_data import (
     FinnhubAccessError,
@@ -13,6 +15,7 @@ from app.services.finnhub_market_data import (
     get_splits,
     get_splits_polygon,
 )
+from app.services.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -25,8 +28,18 @@ _DATE_FORMATS = [
     "%Y-%m-%dT%H:%M:%S%z",
 ]
 
+_ACTION_SIGN = {"buy": 1.0, "sell": -1.0}
 
+
+@lru_cache(maxsize=65536)
 def _parse_date(date_str: str):
+    """Trade date of a CSV timestamp, or None.  Memoized: exports repeat the same
+    timestamps across many rows, and a miss walks every format below."""
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            pass
     for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt).date()
@@ -35,9 +48,61 @@ def _parse_date(date_str: str):
     return None
 
 
+_SPLIT_FETCH_MAX_WORKERS = 16  # split lookups are one HTTP round-trip per symbol
+_SPLIT_CACHE_TTL = 24 * 3600  # split history only changes when a new split is announced
+
+_split_cache = TTLCache(maxsize=4096, ttl=_SPLIT_CACHE_TTL)
+
+
+def _fetch_symbol_splits(
+    sym: str, since_date: date, end_date: date
+) -> Tuple[List[Tuple[date, float]], Optional[str], Optional[str]]:
+    """Split events for one symbol (Finnhub, then Polygon) plus any access warnings.
+
+    Warnings are returned rather than logged so the caller can emit each kind once.
+    Answers are cached per (symbol, since) for a day; lookups where every
+    provider failed are not, so they are retried on the next sync.
+    """
+    cache_key = (sym, since_date)
+    cached = _split_cache.get(cache_key)
+    if cached is not None:
+        return cached, None, None
+
+    events: List[Tuple[date, float]] = []
+    finnhub_warning: Optional[str] = None
+    polygon_warning: Optional[str] = None
+    answered = False
+    try:
+        events = get_splits(sym, since_date, end_date)
+        answered = True
+    except FinnhubAccessError as e:
+        finnhub_warning = f"Finnhub split data is unavailable: {e}"
+    except FinnhubError:
+        pass
+    except Exception:
+        pass
+
+    if not events:
+        try:
+            events = get_splits_polygon(sym, since_date, end_date)
+            answered = True
+        except PolygonNotConfiguredError as e:
+            polygon_warning = f"Polygon split data is unavailable: {e}"
+        except PolygonAccessError as e:
+            polygon_warning = f"Polygon split access denied: {e}"
+        except PolygonError:
+            pass
+        except Exception:
+            pass
+    if answered:
+        _split_cache.set(cache_key, events)
+    return events, finnhub_warning, polygon_warning
+
+
 def get_splits_by_date(symbols: List[str], since: str = "2020-01-01") -> Dict[str, List]:
-    """Fetch stock split history from Finnhub.
+    """Fetch stock split history from Finnhub (Polygon as fallback).
 
+    Symbols are looked up concurrently.
     Returns {date_str: [(symbol, ratio), ...]}.
     """
     splits_by_date: Dict[str, list] = {}
@@ -46,37 +111,21 @@ def get_splits_by_date(symbols: List[str], since: str = "2020-01-01") -> Dict[st
     except Exception:
         since_date = date(2020, 1, 1)
     end_date = datetime.now().date()
+    if not symbols:
+        return splits_by_date
+
+    with ThreadPoolExecutor(max_workers=min(_SPLIT_FETCH_MAX_WORKERS, len(symbols))) as pool:
+        fetched = list(pool.map(lambda sym: _fetch_symbol_splits(sym, since_date, end_date), symbols))
 
     finnhub_warning_emitted = False
     polygon_warning_emitted = False
-    for sym in symbols:
-        events: List[tuple[date, float]] = []
-        try:
-            events = get_splits(sym, since_date, end_date)
-        except FinnhubAccessError as e:
-            if not finnhub_warning_emitted:
-                logger.warning("Finnhub split data is unavailable: %s", e)
-                finnhub_warning_emitted = True
-        except FinnhubError:
-            pass
-        except Exception:
-            pass
-
-        if not events:
-            try:
-                events = get_splits_polygon(sym, since_date, end_date)
-            except PolygonNotConfiguredError as e:
-                if not polygon_warning_emitted:
-                    logger.warning("Polygon split data is unavailable: %s", e)
-                    polygon_warning_emitted = True
-            except PolygonAccessError as e:
-                if not polygon_warning_emitted:
-                    logger.warning("Polygon split access denied: %s", e)
-                    polygon_warning_emitted = True
-            except PolygonError:
-                pass
-            except Exception:
-                pass
+    for sym, (events, finnhub_warning, polygon_warning) in zip(symbols, fetched):
+        if finnhub_warning and not finnhub_warning_emitted:
+            logger.warning(finnhub_warning)
+            finnhub_warning_emitted = True
+        if polygon_warning and not polygon_warning_emitted:
+            logger.warning(polygon_warning)
+            polygon_warning_emitted = True
 
         for dt, ratio in events:
             ds = dt.strftime("%Y-%m-%d")
@@ -94,21 +143,25 @@ def reconstruct_holdings(
     Returns list of {'date': 'YYYY-MM-DD', 'holdings': {symbol: qty, ...}}
     sorted by date.  Only dates with activity (trades or splits) are included.
     """
-    # Group transactions by date
-    tx_by_date: Dict[str, list] = {}
+    # Net signed quantity per date and symbol, built in one pass
+    deltas_by_date: Dict[str, Dict[str, float]] = {}
     for tx in transactions:
         d = _parse_date(tx.get("date", ""))
-        if d:
-            ds = d.strftime("%Y-%m-%d")
-            tx_by_date.setdefault(ds, []).append(tx)
+        if not d:
+            continue
+        deltas = deltas_by_date.setdefault(d.isoformat(), {})
+        sym = tx.get("symbol", "")
+        sign = _ACTION_SIGN.get(tx.get("action", ""))
+        if sym and sign is not None:
+            deltas[sym] = deltas.get(sym, 0.0) + sign * float(tx.get("quantity", 0))
 
     # Gather unique symbols and fetch splits
     all_symbols = list({tx.get("symbol", "") for tx in transactions if tx.get("symbol")})
-    earliest = min(tx_by_date.keys()) if tx_by_date else "2020-01-01"
+    earliest = min(deltas_by_date) if deltas_by_date else "2020-01-01"
     splits_by_date = get_splits_by_date(all_symbols, since=earliest)
 
-    today_str = datetime.now().date().strftime("%Y-%m-%d")
-    all_dates = sorted(d for d in set(tx_by_date) | set(splits_by_date) if d <= today_str)
+    today_str = datetime.now().date().isoformat()
+    all_dates = sorted(d for d in deltas_by_date.keys() | splits_by_date.keys() if d <= today_str)
 
     if not all_dates:
         return []
@@ -118,25 +171,17 @@ def reconstruct_holdings(
 
     for ds in all_dates:
         # 1. Apply splits before trades
-        if ds in splits_by_date:
-            for sym, ratio in splits_by_date[ds]:
-                if sym in holdings and abs(holdings[sym]) > 1e-6:
-                    holdings[sym] *= ratio
-
-        # 2. Apply trades
-        if ds in tx_by_date:
-            for tx in tx_by_date[ds]:
-                sym = tx.get("symbol", "")
-                action = tx.get("action", "")
-                qty = float(tx.get("quantity", 0))
-                if not sym or not action:
-                    continue
-                if action == "buy":
-                    holdings[sym] = holdings.get(sym, 0) + qty
-                elif action == "sell":
-                    holdings[sym] = holdings.get(sym, 0) - qty
-                    if sym in holdings and abs(holdings[sym]) < 1e-6:
-                        del holdings[sym]
+        for sym, ratio in splits_by_date.get(ds, ()):
+            if sym in holdings and abs(holdings[sym]) > 1e-6:
+                holdings[sym] *= ratio
+
+        # 2. Apply the day's net trades
+        for sym, delta in deltas_by_date.get(ds, {}).items():
+            qty = holdings.get(sym, 0) + delta
+            if abs(qty) < 1e-6:
+                holdings.pop(sym, None)
+            else:
+                holdings[sym] = qty
 
         snapshot = {s: round(q, 6) for s, q in holdings.items() if abs(q) > 1e-6}
         history.append({"date": ds, "holdings": snapshot})
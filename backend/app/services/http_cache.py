@@ -0,0 +1,52 @@
+"""Conditional GET helpers (ETag / If-None-Match) for read endpoints."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+
+from app.services.json_response import FastJSONResponse
+
+CACHE_CONTROL = "private, max-age=60"
+
+
+def make_etag(*parts: Any) -> str:
+    """Weak validator built from the values that identify a response version."""
+    return 'W/"' + ":".join(str(part).replace('"', "") for part in parts) + '"'
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against ``etag``."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    wanted = _opaque_tag(etag)
+    return any(_opaque_tag(tag) == wanted for tag in if_none_match.split(","))
+
+
+def conditional_response(
+    if_none_match: Optional[str],
+    etag: str,
+    build: Callable[[], Any],
+) -> Response:
+    """304 when the client already holds ``etag``; otherwise ``build()`` with caching headers.
+
+    ``build`` is only called on a miss, so revalidation skips loading and
+    serializing the body entirely.
+    """
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    result = build()
+    if not isinstance(result, Response):
+        result = FastJSONResponse(content=jsonable_encoder(result))
+    result.headers.update(headers)
+    return result
@@ -0,0 +1,48 @@
+"""JSON response helpers for large read payloads."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+try:  # optional C JSON codec; stdlib json is always the fallback
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if orjson is not None else 0
+)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when it is installed.
+
+    orjson also accepts numpy scalars/arrays and non-string keys.  Content it
+    cannot encode (e.g. integers beyond 64 bits) and environments without
+    orjson fall back to Starlette's stdlib rendering.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            try:
+                return orjson.dumps(content, option=_ORJSON_OPTIONS)
+            except TypeError:
+                pass
+        return super().render(content)
+
+
+def typed_json_response(adapter: TypeAdapter, content: Any) -> Response:
+    """Validate and serialize ``content`` in one pydantic-core pass.
+
+    Rows may be dicts or ORM/attribute objects.  Routes keep ``response_model`` for the OpenAPI schema; returning a
+    Response skips FastAPI's per-call response validation, jsonable_encoder
+    walk and ``json.dumps``.
+    """
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(content, from_attributes=True)),
+        media_type="application/json",
+    )
@@ -8,8 +8,9 @@ before.
 
 import math
 import logging
+from bisect import bisect_left, insort
 from datetime import date
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from scipy.optimize import brentq
@@ -19,6 +20,7 @@ _MAX_ANNUALIZED_PCT = 1_000_000.0
 _MAX_ANNUALIZED_DECIMAL = _MAX_ANNUALIZED_PCT / 100.0
 _DEFAULT_RISK_FREE_RATE = 0.05
 _MIN_RISK_FREE_RATE = -0.999999
+_IRR_GUESS_SPAN = 0.05  # half-width of the warm-start IRR bracket
 
 
 def _annualized_pct_from_return_decimal(return_decimal: float, days_elapsed: int) -> float:
@@ -95,14 +97,15 @@ def compute_daily_returns(
 
     First element is always 0.0 (no prior day).
     """
-    returns = [0.0]
-    for i in range(1, len(pv)):
-        new_dep = deposits[i] - deposits[i - 1]
-        if pv[i - 1] > 0:
-            returns.append((pv[i] - pv[i - 1] - new_dep) / pv[i - 1])
-        else:
-            returns.append(0.0)
-    return returns
+    if len(pv) == 0:
+        return [0.0]
+    values = np.asarray(pv, dtype=np.float64)
+    dep = np.asarray(deposits, dtype=np.float64)
+    prev = values[:-1]
+    gains = values[1:] - prev - np.diff(dep)
+    returns = np.zeros(len(values))
+    np.divide(gains, prev, out=returns[1:], where=prev > 0)
+    return returns.tolist()
 
 
 def compute_cumulative_return(pv_i: float, deposits_i: float) -> float:
@@ -118,28 +121,43 @@ def compute_twr(daily_returns: List[float]) -> float:
     *daily_returns* should include the leading 0.0 for day-0; returns after
     index 0 are compounded.
     """
-    twr = 1.0
-    for r in daily_returns[1:]:
-        twr *= (1 + r)
-    return twr - 1.0
+    if len(daily_returns) < 2:
+        return 0.0
+    return float(_equity_curve(daily_returns)[-1]) - 1.0
+
+
+def _equity_curve(daily_returns) -> np.ndarray:
+    """Chain-linked growth of 1.0 over *daily_returns* (day-0 included).
+
+    ``np.cumprod`` multiplies in order, so each element matches the running
+    product a Python loop would produce.
+    """
+    rets = np.asarray(daily_returns, dtype=np.float64)
+    equity = np.empty(max(len(rets), 1))
+    equity[0] = 1.0
+    np.cumprod(1.0 + rets[1:], out=equity[1:])
+    return equity
+
+
+def _trading_returns(daily_returns) -> np.ndarray:
+    """Daily returns with non-trading days (exactly 0.0) removed."""
+    rets = np.asarray(daily_returns, dtype=np.float64)
+    return rets[rets != 0.0]
 
 
 def _modified_dietz(
     pv_start: float,
     pv_end: float,
     total_days: int,
-    ext_flows: Dict[date, float],
-    d0: date,
-    dn: date,
+    flow_days_left: np.ndarray,
+    flow_amt: np.ndarray,
 ) -> Tuple[float, float]:
-    """Modified Dietz fallback.  Returns ``(annualized, period)``."""
-    total_flow = 0.0
-    weighted_flow = 0.0
-    for d, amt in ext_flows.items():
-        if d0 <= d <= dn:
-            total_flow += amt
-            w = (dn - d).days / total_days
-            weighted_flow += amt * w
+    """Modified Dietz fallback over flows ``d0 <= d <= dn``.  Returns ``(annualized, period)``.
+
+    *flow_days_left* holds ``(dn - d).days`` for each flow in *flow_amt*.
+    """
+    total_flow = float(flow_amt.sum())
+    weighted_flow = float(flow_amt @ flow_days_left) / total_days
 
     denom = pv_start + weighted_flow
     if abs(denom) < 1e-6:
@@ -152,6 +170,18 @@ def _modified_dietz(
     return annualized, mdr
 
 
+def sort_cash_flows(ext_flows: Dict[date, float]) -> Tuple[np.ndarray, np.ndarray]:
+    """``(day ordinals, amounts)`` of *ext_flows*, ascending by date.
+
+    Pass the result to ``compute_mwr_window`` when solving many windows over
+    one history so each call selects its flows with a binary search.
+    """
+    items = sorted(ext_flows.items())
+    ordinals = np.fromiter((d.toordinal() for d, _ in items), dtype=np.int64, count=len(items))
+    amounts = np.fromiter((amt for _, amt in items), dtype=np.float64, count=len(items))
+    return ordinals, amounts
+
+
 def compute_mwr(
     dates_list: List[date],
     pv_list: List[float],
@@ -164,44 +194,85 @@ def compute_mwr(
     """
     if len(dates_list) < 2:
         return 0.0, 0.0
+    return compute_mwr_window(dates_list[0], dates_list[-1], pv_list[0], pv_list[-1], ext_flows)
+
 
-    d0, dn = dates_list[0], dates_list[-1]
+def compute_mwr_window(
+    d0: date,
+    dn: date,
+    pv_start: float,
+    pv_end: float,
+    ext_flows: Union[Dict[date, float], Tuple[np.ndarray, np.ndarray]],
+    guess: Optional[float] = None,
+) -> Tuple[float, float]:
+    """``compute_mwr`` for the window ``d0..dn`` given only its end values.
+
+    The rolling-metric loops call this once per day, so it must not need
+    the sliced date/value lists.  *ext_flows* is a date -> amount dict or,
+    for those loops, the ``sort_cash_flows`` arrays of one.  *guess* (the
+    previous day's IRR in those loops) lets the solver start from a narrow
+    bracket when the root is known to be unique.
+    """
     total_days = (dn - d0).days
     if total_days <= 0:
         return 0.0, 0.0
 
-    pv_start = pv_list[0]
-    pv_end = pv_list[-1]
     years = total_days / 365.25
-
-    # Collect flows within the window
-    flows_in_window: List[Tuple[float, float]] = []  # (years_remaining, amount)
-    for d, amt in ext_flows.items():
-        if d0 < d <= dn:
-            t = (dn - d).days / 365.25
-            flows_in_window.append((t, amt))
+    flow_ord, flow_amts = sort_cash_flows(ext_flows) if isinstance(ext_flows, dict) else ext_flows
+    d0_ord = d0.toordinal()
+    dn_ord = dn.toordinal()
+    lo = int(np.searchsorted(flow_ord, d0_ord, side="right"))
+    hi = int(np.searchsorted(flow_ord, dn_ord, side="right"))
+
+    # Flows within the window (d0 < d <= dn): years remaining and amount
+    if lo == hi and pv_start > 0 and pv_end > 0:
+        # No flows: pv_start*(1+r)^T = pv_end has a closed-form root.
+        irr = math.expm1(math.log(pv_end / pv_start) / years)
+        if -0.999 <= irr <= 10.0:
+            return irr, _period_return_from_irr(irr, years)
+    flow_t = (dn_ord - flow_ord[lo:hi]) / 365.25
+    flow_amt = flow_amts[lo:hi]
 
     # NPV equation: 0 = -pv_start*(1+r)^T - sum(cf*(1+r)^t) + pv_end
     def npv(r: float) -> float:
         total = -pv_start * (1 + r) ** years
-        for t, amt in flows_in_window:
-            total -= amt * (1 + r) ** t
-        total += pv_end
-        return total
-
+        if hi > lo:
+            total -= float(flow_amt @ np.power(1 + r, flow_t))
+        return total + pv_end
+
+    near_lo = max(-0.999, guess - _IRR_GUESS_SPAN) if guess is not None else 0.0
+    near_hi = min(10.0, guess + _IRR_GUESS_SPAN) if guess is not None else 0.0
+    if near_lo < near_hi and pv_start > 0 and (hi == lo or float(flow_amt.min()) >= 0):
+        # Deposits only: npv is strictly decreasing, so a root bracketed next
+        # to the guess is the one the full bracket would find, in fewer steps.
+        try:
+            irr = brentq(npv, near_lo, near_hi, maxiter=200, xtol=1e-12)
+            return irr, _period_return_from_irr(irr, years)
+        except (ValueError, RuntimeError):
+            pass
     try:
         irr = brentq(npv, -0.999, 10.0, maxiter=200, xtol=1e-12)
-        log_growth = years * math.log1p(irr)
-        if log_growth >= math.log1p(_MAX_ANNUALIZED_DECIMAL):
-            period_return = _MAX_ANNUALIZED_DECIMAL
-        else:
-            period_return = math.expm1(log_growth)
-            if not math.isfinite(period_return):
-                period_return = 0.0
-        return irr, period_return
     except (ValueError, RuntimeError):
-        # Solver failed — fall back to Modified Dietz
-        return _modified_dietz(pv_start, pv_end, total_days, ext_flows, d0, dn)
+        # Solver failed — fall back to Modified Dietz (which also counts flows on d0)
+        lo = int(np.searchsorted(flow_ord, d0_ord, side="left"))
+        return _modified_dietz(
+            pv_start,
+            pv_end,
+            total_days,
+            (dn_ord - flow_ord[lo:hi]).astype(np.float64),
+            flow_amts[lo:hi],
+        )
+    return irr, _period_return_from_irr(irr, years)
+
+
+def _period_return_from_irr(irr: float, years: float) -> float:
+    log_growth = years * math.log1p(irr)
+    if log_growth >= math.log1p(_MAX_ANNUALIZED_DECIMAL):
+        return _MAX_ANNUALIZED_DECIMAL
+    period_return = math.expm1(log_growth)
+    if not math.isfinite(period_return):
+        return 0.0
+    return period_return
 
 
 def compute_cagr(pv_start: float, pv_end: float, days_elapsed: int) -> float:
@@ -258,21 +329,25 @@ def compute_drawdown(pv_series: List[float]) -> Tuple[float, float]:
 
     Returns ``(max_drawdown, current_drawdown)``.
     """
-    if not pv_series:
+    if len(pv_series) == 0:
         return 0.0, 0.0
-    peak = pv_series[0]
-    max_dd = 0.0
-    for v in pv_series:
-        if v > peak:
-            peak = v
-        dd = (v / peak - 1) if peak > 0 else 0.0
-        if dd < max_dd:
-            max_dd = dd
-    current_peak = max(pv_series)
-    current_dd = (pv_series[-1] / current_peak - 1) if current_peak > 0 else 0.0
+    values = np.asarray(pv_series, dtype=np.float64)
+    peaks = np.maximum.accumulate(values)
+    dd = _drawdowns(values, peaks)
+    max_dd = min(float(dd.min()), 0.0)
+    current_peak = float(peaks[-1])
+    current_dd = (float(values[-1]) / current_peak - 1) if current_peak > 0 else 0.0
     return max_dd, current_dd
 
 
+def _drawdowns(values: np.ndarray, peaks: np.ndarray) -> np.ndarray:
+    """``values / peaks - 1`` where the running peak is positive, else 0."""
+    dd = np.zeros_like(values)
+    positive = peaks > 0
+    dd[positive] = values[positive] / peaks[positive] - 1
+    return dd
+
+
 def compute_drawdown_stats(pv_series: List[float]) -> Dict:
     """Compute drawdown episode statistics from an equity curve.
 
@@ -287,41 +362,48 @@ def compute_drawdown_stats(pv_series: List[float]) -> Dict:
     if len(pv_series) < 2:
         return {"median_drawdown": 0.0, "longest_drawdown_days": 0, "median_drawdown_days": 0}
 
-    peak = pv_series[0]
-    dd_troughs: List[float] = []
-    dd_lengths: List[int] = []
-    current_trough = 0.0
-    current_length = 0
-
-    for v in pv_series:
-        if v >= peak:
-            # Recovery or new peak
-            if current_length > 0:
-                dd_troughs.append(current_trough)
-                dd_lengths.append(current_length)
-                current_trough = 0.0
-                current_length = 0
-            peak = v
-        else:
-            dd = (v / peak - 1) if peak > 0 else 0.0
-            current_length += 1
-            if dd < current_trough:
-                current_trough = dd
-
-    # Handle ongoing drawdown at end of series
-    if current_length > 0:
-        dd_troughs.append(current_trough)
-        dd_lengths.append(current_length)
-
-    median_dd = float(np.median(dd_troughs)) if dd_troughs else 0.0
-    longest = max(dd_lengths) if dd_lengths else 0
-    median_len = int(np.median(dd_lengths)) if dd_lengths else 0
+    values = np.asarray(pv_series, dtype=np.float64)
+    peaks = np.maximum.accumulate(values)
+    underwater = values < peaks
+    # Episodes are maximal runs of days below the running peak; an episode
+    # still open at the end of the series counts too.
+    edges = np.diff(np.concatenate(([0], underwater.view(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    if starts.size:
+        dd = _drawdowns(values, peaks)
+        dd_troughs = np.minimum(np.minimum.reduceat(dd, starts), 0.0)
+        dd_lengths = ends - starts
+        median_dd = float(np.median(dd_troughs))
+        longest = int(dd_lengths.max())
+        median_len = int(np.median(dd_lengths))
+    else:
+        median_dd, longest, median_len = 0.0, 0, 0
     # Guard against NaN propagation from edge-case equity curves
     if math.isnan(median_dd):
         median_dd = 0.0
     return {"median_drawdown": median_dd, "longest_drawdown_days": longest, "median_drawdown_days": median_len}
 
 
+def compute_return_drawdown_series(values) -> Tuple[np.ndarray, np.ndarray]:
+    """Cumulative return and drawdown percents (4 dp) for a value series.
+
+    Returns ``(return_pct, drawdown_pct)`` arrays aligned with ``values``;
+    return is measured against the first value and drawdown against the
+    running peak (0 where the peak is not positive).
+    """
+    arr = np.ascontiguousarray(values, dtype=np.float64)
+    if arr.size == 0:
+        return arr.copy(), arr.copy()
+    peaks = np.maximum.accumulate(arr)
+    positive = peaks > 0
+    ratio = np.divide(arr, peaks, out=np.ones_like(arr), where=positive)
+    return_pct = np.round((arr / arr[0] - 1) * 100, 4)
+    drawdown_pct = np.round((ratio - 1) * 100, 4)
+    return return_pct, drawdown_pct
+
+
 def compute_volatility(daily_returns: List[float]) -> float:
     """Annualized volatility as a decimal.
 
@@ -332,7 +414,7 @@ def compute_volatility(daily_returns: List[float]) -> float:
     excluded so that only actual trading-day returns contribute to the
     standard deviation, matching industry convention (√252 annualisation).
     """
-    trading = [r for r in daily_returns if r != 0.0]
+    trading = _trading_returns(daily_returns)
     if len(trading) < 2:
         return 0.0
     vol = float(np.std(trading, ddof=1))
@@ -347,14 +429,13 @@ def compute_sharpe(daily_returns: List[float], rf_daily: float) -> float:
     Non-trading days (exactly 0.0 return) are excluded so that the
     risk-adjusted ratio reflects actual trading-day performance only.
     """
-    trading = [r for r in daily_returns if r != 0.0]
+    trading = _trading_returns(daily_returns)
     if len(trading) < 2:
         return 0.0
     vol = float(np.std(trading, ddof=1))
     if vol <= 0:
         return 0.0
-    excess = [r - rf_daily for r in trading]
-    return float(np.mean(excess)) / vol * math.sqrt(252)
+    return float(np.mean(trading - rf_daily)) / vol * math.sqrt(252)
 
 
 def compute_sortino(daily_returns: List[float], rf_daily: float) -> float:
@@ -371,15 +452,15 @@ def compute_sortino(daily_returns: List[float], rf_daily: float) -> float:
     it is ``sqrt(sum(min(r-T,0)² ) / N)`` per the original Sortino &
     van der Meer (1991) definition and the CFA Institute CIPM programme.
     """
-    trading = [r for r in daily_returns if r != 0.0]
+    trading = _trading_returns(daily_returns)
     if len(trading) < 2:
         return 0.0
-    downside_sq = [min(r - rf_daily, 0) ** 2 for r in trading]
-    downside_dev = math.sqrt(sum(downside_sq) / len(trading))
+    excess = trading - rf_daily
+    downside = np.minimum(excess, 0.0)
+    downside_dev = math.sqrt(float(np.sum(downside * downside)) / len(trading))
     if downside_dev <= 0:
         return 0.0
-    excess_mean = float(np.mean([r - rf_daily for r in trading]))
-    return excess_mean / downside_dev * math.sqrt(252)
+    return float(np.mean(excess)) / downside_dev * math.sqrt(252)
 
 
 def compute_calmar(annualized_return_pct: float, max_drawdown_pct: float) -> float:
@@ -401,30 +482,31 @@ def compute_win_loss(daily_returns: List[float]) -> Dict:
     Returns dict with: win_rate, num_wins, num_losses, avg_win, avg_loss,
     best_day, worst_day, profit_factor  (all as decimals except counts).
     """
-    if not daily_returns:
+    if len(daily_returns) == 0:
         return {
             "win_rate": 0.0, "num_wins": 0, "num_losses": 0,
             "avg_win": 0.0, "avg_loss": 0.0,
             "best_day": 0.0, "worst_day": 0.0, "profit_factor": 0.0,
         }
 
-    pos = [r for r in daily_returns if r > 0]
-    neg = [r for r in daily_returns if r < 0]
+    rets = np.asarray(daily_returns, dtype=np.float64)
+    pos = rets[rets > 0]
+    neg = rets[rets < 0]
     num_wins = len(pos)
     num_losses = len(neg)
     decided = num_wins + num_losses
 
-    gross_wins = sum(pos) if pos else 0.0
-    gross_losses = abs(sum(neg)) if neg else 0.0
+    gross_wins = float(pos.sum())
+    gross_losses = abs(float(neg.sum()))
 
     return {
         "win_rate": (num_wins / decided) if decided > 0 else 0.0,
         "num_wins": num_wins,
         "num_losses": num_losses,
-        "avg_win": float(np.mean(pos)) if pos else 0.0,
-        "avg_loss": float(np.mean(neg)) if neg else 0.0,
-        "best_day": max(daily_returns),
-        "worst_day": min(daily_returns),
+        "avg_win": float(np.mean(pos)) if num_wins else 0.0,
+        "avg_loss": float(np.mean(neg)) if num_losses else 0.0,
+        "best_day": float(rets.max()),
+        "worst_day": float(rets.min()),
         "profit_factor": (gross_wins / gross_losses) if gross_losses > 0 else 0.0,
     }
 
@@ -438,27 +520,29 @@ def _compute_row(
     pv: List[float],
     dates: List[date],
     deposits: List[float],
-    daily_rets: List[float],
-    ext_flows: Dict[date, float],
-    rf_daily: float,
+    daily_rets: np.ndarray,
+    equity: np.ndarray,
+    mwr: Tuple[float, float],
+    window: Dict,
 ) -> Dict:
     """Compute the full metric dict for day *i* given pre-computed arrays.
 
-    This is O(N) for the statistics that need the full returns window
-    (volatility, Sharpe, Sortino, win/loss) and O(1) for everything else
-    except MWR which is one IRR solve.
+    *equity* is the chain-linked curve of *daily_rets* (see ``_equity_curve``);
+    row *i* only looks at its prefix.  *window* holds the win/loss, drawdown
+    and volatility/Sharpe/Sortino statistics of that prefix (``_window_stats``
+    or one day of ``_rolling_window_stats``); *mwr* is the day's
+    ``(annualized, period)`` money-weighted return.
     """
     row: Dict = {"date": dates[i]}
-    rets_window = daily_rets[1 : i + 1]  # returns excluding day-0
     days_elapsed = (dates[i] - dates[0]).days
 
     # --- Basic returns ---
-    row["daily_return_pct"] = round(daily_rets[i] * 100, 4)
+    row["daily_return_pct"] = round(float(daily_rets[i]) * 100, 4)
     row["total_return_dollars"] = round(pv[i] - deposits[i], 2)
     row["cumulative_return_pct"] = round(compute_cumulative_return(pv[i], deposits[i]) * 100, 4)
 
     # --- TWR (chain-link full series) ---
-    twr_dec = compute_twr(daily_rets[: i + 1])
+    twr_dec = float(equity[i]) - 1.0
     row["time_weighted_return"] = round(twr_dec * 100, 4)
 
     # --- CAGR / Annualized ---
@@ -469,39 +553,34 @@ def _compute_row(
     ann_ret_cum = compute_annualized_return_cumulative(cum_ret_dec, days_elapsed)
     row["annualized_return_cum"] = round(ann_ret_cum, 4)
 
-    # --- MWR (one IRR solve) ---
-    mwr_ann, mwr_period = compute_mwr(dates[: i + 1], pv[: i + 1], ext_flows)
+    # --- MWR ---
+    mwr_ann, mwr_period = mwr
     row["money_weighted_return"] = round(mwr_ann * 100, 4)
     row["money_weighted_return_period"] = round(mwr_period * 100, 4)
 
     # --- Win / Loss ---
-    wl = compute_win_loss(rets_window)
-    row["win_rate"] = round(wl["win_rate"] * 100, 2)
-    row["num_wins"] = wl["num_wins"]
-    row["num_losses"] = wl["num_losses"]
-    row["avg_win_pct"] = round(wl["avg_win"] * 100, 4)
-    row["avg_loss_pct"] = round(wl["avg_loss"] * 100, 4)
+    row["win_rate"] = round(window["win_rate"] * 100, 2)
+    row["num_wins"] = window["num_wins"]
+    row["num_losses"] = window["num_losses"]
+    row["avg_win_pct"] = round(window["avg_win"] * 100, 4)
+    row["avg_loss_pct"] = round(window["avg_loss"] * 100, 4)
 
     # --- Drawdown (from deposit-adjusted equity curve, not raw pv) ---
-    equity = [1.0]
-    for r in daily_rets[1 : i + 1]:
-        equity.append(equity[-1] * (1 + r))
-    max_dd, cur_dd = compute_drawdown(equity)
+    max_dd = window["max_drawdown"]
     row["max_drawdown"] = round(max_dd * 100, 4)
-    row["current_drawdown"] = round(cur_dd * 100, 4)
-    dd_stats = compute_drawdown_stats(equity)
-    row["median_drawdown"] = round(dd_stats["median_drawdown"] * 100, 4)
-    row["longest_drawdown_days"] = dd_stats["longest_drawdown_days"]
-    row["median_drawdown_days"] = dd_stats["median_drawdown_days"]
+    row["current_drawdown"] = round(window["current_drawdown"] * 100, 4)
+    row["median_drawdown"] = round(window["median_drawdown"] * 100, 4)
+    row["longest_drawdown_days"] = window["longest_drawdown_days"]
+    row["median_drawdown_days"] = window["median_drawdown_days"]
 
     # --- Volatility ---
-    row["annualized_volatility"] = round(compute_volatility(rets_window) * 100, 4)
+    row["annualized_volatility"] = round(window["volatility"] * 100, 4)
 
     # --- Sharpe ---
-    row["sharpe_ratio"] = round(compute_sharpe(rets_window, rf_daily), 4)
+    row["sharpe_ratio"] = round(window["sharpe"], 4)
 
     # --- Sortino ---
-    row["sortino_ratio"] = round(compute_sortino(rets_window, rf_daily), 4)
+    row["sortino_ratio"] = round(window["sortino"], 4)
 
     # --- Calmar (full-precision intermediates, uses cumulative-based ann return) ---
     max_dd_full = max_dd * 100
@@ -510,40 +589,227 @@ def _compute_row(
     ) if days_elapsed > 0 else 0.0
 
     # --- Best / Worst day ---
-    row["best_day_pct"] = round(wl["best_day"] * 100, 4) if rets_window else 0.0
-    row["worst_day_pct"] = round(wl["worst_day"] * 100, 4) if rets_window else 0.0
+    row["best_day_pct"] = round(window["best_day"] * 100, 4) if i else 0.0
+    row["worst_day_pct"] = round(window["worst_day"] * 100, 4) if i else 0.0
 
     # --- Profit Factor ---
-    row["profit_factor"] = round(wl["profit_factor"], 4)
+    row["profit_factor"] = round(window["profit_factor"], 4)
 
     return row
 
 
+def _window_stats(rets_window: np.ndarray, equity_window: np.ndarray, rf_daily: float) -> Dict:
+    """Win/loss, drawdown and risk statistics of one window, from the pure metric functions."""
+    max_dd, cur_dd = compute_drawdown(equity_window)
+    dd_stats = compute_drawdown_stats(equity_window)
+    return {
+        **compute_win_loss(rets_window),
+        "max_drawdown": max_dd,
+        "current_drawdown": cur_dd,
+        "median_drawdown": dd_stats["median_drawdown"],
+        "longest_drawdown_days": dd_stats["longest_drawdown_days"],
+        "median_drawdown_days": dd_stats["median_drawdown_days"],
+        "volatility": compute_volatility(rets_window),
+        "sharpe": compute_sharpe(rets_window, rf_daily),
+        "sortino": compute_sortino(rets_window, rf_daily),
+    }
+
+
+def _rolling_window_stats(daily_rets: np.ndarray, equity: np.ndarray, rf_daily: float) -> Dict[str, List]:
+    """``_window_stats`` of every prefix ``0..i`` at once, as per-day lists.
+
+    Win/loss counts and sums come from prefix sums over all days.
+    Volatility, Sharpe and Sortino use prefix sums over trading days,
+    shifted by the overall mean so the sum-of-squares variance does not
+    cancel.  Best/worst day and drawdowns come from running extrema.
+    Replaces the O(N) window pass per day with O(N) work for the whole
+    series.
+    """
+    rets = np.asarray(daily_rets, dtype=np.float64)[1:]
+    trading = rets != 0.0
+    shift = float(rets[trading].mean()) if trading.any() else 0.0
+    centered = np.where(trading, rets - shift, 0.0)
+    downside = np.where(trading, np.minimum(rets - rf_daily, 0.0), 0.0)
+
+    def prefix(values: np.ndarray) -> np.ndarray:
+        out = np.zeros(len(values) + 1)
+        np.cumsum(values, out=out[1:])
+        return out
+
+    n = prefix(trading.astype(np.float64))
+    s1 = prefix(centered)
+    s2 = prefix(centered * centered)
+    d2 = prefix(downside * downside)
+    enough = n >= 2
+    n_safe = np.where(enough, n, 2.0)
+    variance = np.maximum((s2 - s1 * s1 / n_safe) / (n_safe - 1), 0.0)
+    std = np.sqrt(variance)
+    mean_excess = shift + s1 / n_safe - rf_daily
+    downside_dev = np.sqrt(d2 / n_safe)
+    sqrt_252 = math.sqrt(252)
+    volatility = np.where(enough, std * sqrt_252, 0.0)
+    sharpe = np.where(
+        enough & (std > 0), mean_excess / np.where(std > 0, std, 1.0) * sqrt_252, 0.0
+    )
+    sortino = np.where(
+        enough & (downside_dev > 0),
+        mean_excess / np.where(downside_dev > 0, downside_dev, 1.0) * sqrt_252,
+        0.0,
+    )
+
+    win_loss = _rolling_win_loss(rets, prefix)
+
+    peaks = np.maximum.accumulate(equity)
+    dd = _drawdowns(equity, peaks)
+    max_dd = np.minimum(np.minimum.accumulate(dd), 0.0)
+    median_dd, longest, median_len = _rolling_drawdown_episodes(equity, peaks, dd)
+
+    return {
+        **win_loss,
+        "max_drawdown": max_dd.tolist(),
+        "current_drawdown": dd.tolist(),
+        "median_drawdown": median_dd,
+        "longest_drawdown_days": longest,
+        "median_drawdown_days": median_len,
+        "volatility": volatility.tolist(),
+        "sharpe": sharpe.tolist(),
+        "sortino": sortino.tolist(),
+    }
+
+
+def _rolling_win_loss(rets: np.ndarray, prefix: Callable[[np.ndarray], np.ndarray]) -> Dict[str, List]:
+    """``compute_win_loss`` of every prefix of *rets* (day 0 = empty window)."""
+    wins = rets > 0
+    losses = rets < 0
+    num_wins = prefix(wins.astype(np.float64))
+    num_losses = prefix(losses.astype(np.float64))
+    gross_wins = prefix(np.where(wins, rets, 0.0))
+    loss_sums = prefix(np.where(losses, rets, 0.0))
+    gross_losses = np.abs(loss_sums)
+    decided = num_wins + num_losses
+
+    def ratio(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+        return np.divide(num, den, out=np.zeros_like(num), where=den > 0)
+
+    best = np.zeros(len(rets) + 1)
+    worst = np.zeros(len(rets) + 1)
+    np.maximum.accumulate(rets, out=best[1:])
+    np.minimum.accumulate(rets, out=worst[1:])
+    return {
+        "win_rate": ratio(num_wins, decided).tolist(),
+        "num_wins": num_wins.astype(np.int64).tolist(),
+        "num_losses": num_losses.astype(np.int64).tolist(),
+        "avg_win": ratio(gross_wins, num_wins).tolist(),
+        "avg_loss": ratio(loss_sums, num_losses).tolist(),
+        "best_day": best.tolist(),
+        "worst_day": worst.tolist(),
+        "profit_factor": ratio(gross_wins, gross_losses).tolist(),
+    }
+
+
+def _median_with(sorted_values: List[float], extra: Optional[float]) -> float:
+    """Median of *sorted_values* plus *extra* (if given), as ``np.median`` computes it."""
+    if extra is None:
+        count = len(sorted_values)
+
+        def at(k: int) -> float:
+            return sorted_values[k]
+    else:
+        count = len(sorted_values) + 1
+        pos = bisect_left(sorted_values, extra)
+
+        def at(k: int) -> float:
+            if k < pos:
+                return sorted_values[k]
+            return extra if k == pos else sorted_values[k - 1]
+
+    mid = count // 2
+    if count % 2:
+        return float(at(mid))
+    return (at(mid - 1) + at(mid)) / 2
+
+
+def _rolling_drawdown_episodes(
+    equity: np.ndarray, peaks: np.ndarray, dd: np.ndarray
+) -> Tuple[List[float], List[int], List[int]]:
+    """``compute_drawdown_stats`` of every prefix, in one pass over the curve.
+
+    Closed episodes are kept in sorted lists; the episode still open on
+    day *i* is folded into that day's medians without being inserted.
+    """
+    closed_troughs: List[float] = []
+    closed_lengths: List[int] = []
+    longest_closed = 0
+    open_trough: Optional[float] = None
+    open_length = 0
+
+    median_dd: List[float] = []
+    longest: List[int] = []
+    median_len: List[int] = []
+    for value, peak, drawdown in zip(equity.tolist(), peaks.tolist(), dd.tolist()):
+        if value < peak:
+            open_length += 1
+            open_trough = drawdown if open_trough is None else min(open_trough, drawdown)
+        elif open_trough is not None:
+            insort(closed_troughs, min(open_trough, 0.0))
+            insort(closed_lengths, open_length)
+            longest_closed = max(longest_closed, open_length)
+            open_trough, open_length = None, 0
+
+        if open_trough is None and not closed_troughs:
+            median_dd.append(0.0)
+            longest.append(0)
+            median_len.append(0)
+            continue
+        open_episode = open_trough is not None
+        med = _median_with(closed_troughs, min(open_trough, 0.0) if open_episode else None)
+        median_dd.append(0.0 if math.isnan(med) else med)
+        longest.append(max(longest_closed, open_length))
+        median_len.append(int(_median_with(closed_lengths, open_length if open_episode else None)))
+    return median_dd, longest, median_len
+
+
+def _rolling_mwr(
+    dates: List[date],
+    pv: List[float],
+    flows: Tuple[np.ndarray, np.ndarray],
+) -> List[Tuple[float, float]]:
+    """``compute_mwr_window`` from day 0 to every day, each solve warm-started
+    from the previous day's IRR."""
+    mwr: List[Tuple[float, float]] = [(0.0, 0.0)]
+    guess: Optional[float] = None
+    for i in range(1, len(dates)):
+        mwr.append(compute_mwr_window(dates[0], dates[i], pv[0], pv[i], flows, guess))
+        guess = mwr[-1][0]
+    return mwr
+
+
 def _prepare_arrays(
     daily_rows: List[Dict],
     cash_flow_events: List[Dict],
     risk_free_rate: float,
-) -> Tuple[List[float], List[date], List[float], List[float], Dict[date, float], float]:
-    """Extract arrays and ext_flows from raw dicts.  Shared setup."""
+) -> Tuple[List[float], List[date], List[float], np.ndarray, Tuple[np.ndarray, np.ndarray], float]:
+    """Extract arrays and sorted external flows from raw dicts.  Shared setup."""
     pv = [r["portfolio_value"] for r in daily_rows]
     dates = [
         r["date"] if isinstance(r["date"], date) else date.fromisoformat(str(r["date"]))
         for r in daily_rows
     ]
     deposits = [r["net_deposits"] for r in daily_rows]
-    daily_rets = compute_daily_returns(pv, deposits)
+    daily_rets = np.asarray(compute_daily_returns(pv, deposits))
 
     ext_flows: Dict[date, float] = {}
     for cf in cash_flow_events:
         d = cf["date"] if isinstance(cf["date"], date) else date.fromisoformat(str(cf["date"]))
         ext_flows[d] = ext_flows.get(d, 0) + cf["amount"]
+    flows = sort_cash_flows(ext_flows)
 
     normalized_rf = _sanitize_risk_free_rate(risk_free_rate)
     rf_daily = (1 + normalized_rf) ** (1 / 252) - 1
     if isinstance(rf_daily, complex) or not math.isfinite(rf_daily):
         logger.warning("Computed invalid rf_daily=%r from risk_free_rate=%r; using 0.0", rf_daily, risk_free_rate)
         rf_daily = 0.0
-    return pv, dates, deposits, daily_rets, ext_flows, rf_daily
+    return pv, dates, deposits, daily_rets, flows, rf_daily
 
 
 # =====================================================================
@@ -572,12 +838,18 @@ def compute_all_metrics(
     if not daily_rows:
         return []
 
-    pv, dates, deposits, daily_rets, ext_flows, rf_daily = _prepare_arrays(
+    pv, dates, deposits, daily_rets, flows, rf_daily = _prepare_arrays(
         daily_rows, cash_flow_events, risk_free_rate
     )
 
+    equity = _equity_curve(daily_rets)
+    rolling = _rolling_window_stats(daily_rets, equity, rf_daily)
+    mwr = _rolling_mwr(dates, pv, flows)
     return [
-        _compute_row(i, pv, dates, deposits, daily_rets, ext_flows, rf_daily)
+        _compute_row(
+            i, pv, dates, deposits, daily_rets, equity, mwr[i],
+            {key: values[i] for key, values in rolling.items()},
+        )
         for i in range(len(daily_rows))
     ]
 
@@ -600,11 +872,15 @@ def compute_latest_metrics(
     if not daily_rows:
         return None
 
-    pv, dates, deposits, daily_rets, ext_flows, rf_daily = _prepare_arrays(
+    pv, dates, deposits, daily_rets, flows, rf_daily = _prepare_arrays(
         daily_rows, cash_flow_events, risk_free_rate
     )
 
-    return _compute_row(len(daily_rows) - 1, pv, dates, deposits, daily_rets, ext_flows, rf_daily)
+    equity = _equity_curve(daily_rets)
+    last = len(daily_rows) - 1
+    mwr = compute_mwr_window(dates[0], dates[last], pv[0], pv[last], flows) if last else (0.0, 0.0)
+    window = _window_stats(daily_rets[1:], equity, rf_daily)
+    return _compute_row(last, pv, dates, deposits, daily_rets, equity, mwr, window)
 
 
 # =====================================================================
@@ -636,19 +912,18 @@ def compute_performance_series(
     for cf in cash_flow_events:
         d = cf["date"] if isinstance(cf["date"], date) else date.fromisoformat(str(cf["date"]))
         ext_flows[d] = ext_flows.get(d, 0) + cf["amount"]
+    flows = sort_cash_flows(ext_flows)
 
-    results: List[Dict] = []
-    twr_cum = 1.0
-    equity_peak = 1.0
+    equity = _equity_curve(daily_rets)
+    twr_pct = np.round((equity - 1) * 100, 4)
+    dd_pct = np.round(_drawdowns(equity, np.maximum.accumulate(equity)) * 100, 4)
 
-    for i in range(len(daily_rows)):
-        if i > 0:
-            twr_cum *= (1 + daily_rets[i])
-        equity_peak = max(equity_peak, twr_cum)
-        dd = ((twr_cum / equity_peak) - 1) if equity_peak > 0 else 0.0
+    mwr = _rolling_mwr(dates, pv, flows)
 
+    results: List[Dict] = []
+    for i in range(len(daily_rows)):
         cum_ret = compute_cumulative_return(pv[i], deposits[i])
-        mwr_ann, mwr_period = compute_mwr(dates[: i + 1], pv[: i + 1], ext_flows)
+        mwr_period = mwr[i][1]
 
         results.append({
             "date": str(dates[i]),
@@ -656,9 +931,9 @@ def compute_performance_series(
             "net_deposits": round(deposits[i], 2),
             "cumulative_return_pct": round(cum_ret * 100, 4),
             "daily_return_pct": round(daily_rets[i] * 100, 4),
-            "time_weighted_return": round((twr_cum - 1) * 100, 4),
+            "time_weighted_return": float(twr_pct[i]),
             "money_weighted_return": round(mwr_period * 100, 4),
-            "current_drawdown": round(dd * 100, 4),
+            "current_drawdown": float(dd_pct[i]),
         })
 
     return results
@@ -26,10 +26,9 @@ def get_portfolio_transactions_data(
     total = query.count()
     rows = query.offset(offset).limit(limit).all()
 
-    acct_names = {
-        acct.id: acct.display_name
-        for acct in db.query(Account).filter(Account.id.in_(account_ids)).all()
-    }
+    acct_names = dict(
+        db.query(Account.id, Account.display_name).filter(Account.id.in_(account_ids)).all()
+    )
     return {
         "total": total,
         "transactions": [
@@ -56,10 +55,9 @@ def get_portfolio_cash_flows_data(
     rows = db.query(CashFlow).filter(
         CashFlow.account_id.in_(account_ids)
     ).order_by(CashFlow.date).all()
-    acct_names = {
-        acct.id: acct.display_name
-        for acct in db.query(Account).filter(Account.id.in_(account_ids)).all()
-    }
+    acct_names = dict(
+        db.query(Account.id, Account.display_name).filter(Account.id.in_(account_ids)).all()
+    )
     return [
         {
             "id": row.id,
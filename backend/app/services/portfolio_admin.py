@@ -31,7 +31,10 @@ from app.security import get_local_auth_token
 from app.services.local_paths import LocalPathError, resolve_local_write_path
 from app.services.manual_cash_flow import encode_manual_description, is_manual_cash_flow
 from app.services.portfolio_live_overlay import invalidate_portfolio_live_cache
-from app.services.symphony_read import invalidate_symphony_live_cache
+from app.services.symphony_read import (
+    invalidate_symphony_live_cache,
+    invalidate_symphony_performance_cache,
+)
 from app.services.sync import (
     full_backfill_core,
     finish_initial_backfill_activity,
@@ -221,7 +224,7 @@ def trigger_sync_data(
         ids = resolve_account_ids_fn(db, selected_account)
 
         # Skip synthetic test accounts (no real Composer credentials).
-        test_ids = {a.id for a in db.query(Account).filter_by(credential_name="__TEST__").all()}
+        test_ids = {aid for (aid,) in db.query(Account.id).filter_by(credential_name="__TEST__").all()}
         sync_ids = [aid for aid in ids if aid not in test_ids]
         if not sync_ids:
             return {
@@ -252,6 +255,8 @@ def trigger_sync_data(
                         _sync_message = f"Completing first-run trade activity for {aid}..."
                     finish_initial_backfill_activity(db, client, aid)
 
+            invalidate_symphony_performance_cache(account_id=aid)
+
             if len(sync_ids) > 1:
                 time.sleep(1)
 
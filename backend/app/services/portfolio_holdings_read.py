@@ -42,10 +42,7 @@ def get_portfolio_holdings_data(
             rows = base_query.filter_by(date=latest_date).all()
 
     notional_map: Dict[str, float] = {}
-    test_ids = {
-        acct.id
-        for acct in db.query(Account).filter_by(credential_name="__TEST__").all()
-    }
+    test_ids = {aid for (aid,) in db.query(Account.id).filter_by(credential_name="__TEST__").all()}
 
     for aid in account_ids:
         if aid in test_ids:
@@ -7,6 +7,7 @@ from datetime import date
 from typing import Dict, List, Optional, Tuple
 
 from fastapi import HTTPException
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
@@ -24,7 +25,14 @@ def load_aggregated_daily_series(
     date_end: Optional[date],
 ) -> Tuple[List[Dict], float, float]:
     """Load daily portfolio rows and aggregate across account scope with forward-fill."""
-    port_query = db.query(DailyPortfolio).filter(
+    port_query = db.query(
+        DailyPortfolio.account_id,
+        DailyPortfolio.date,
+        DailyPortfolio.portfolio_value,
+        DailyPortfolio.net_deposits,
+        DailyPortfolio.total_fees,
+        DailyPortfolio.total_dividends,
+    ).filter(
         DailyPortfolio.account_id.in_(account_ids)
     ).order_by(DailyPortfolio.date)
     if date_start:
@@ -36,7 +44,7 @@ def load_aggregated_daily_series(
     if not all_rows:
         raise HTTPException(404, "No portfolio data for selected period.")
 
-    per_acct: dict[str, dict[str, DailyPortfolio]] = defaultdict(dict)
+    per_acct: dict[str, dict[str, Row]] = defaultdict(dict)
     for row in all_rows:
         per_acct[row.account_id][str(row.date)] = row
 
@@ -86,7 +94,7 @@ def load_cash_flow_events(
     date_end: Optional[date],
 ) -> List[Dict]:
     """Load external cash-flow events used for MWR calculations."""
-    cf_query = db.query(CashFlow).filter(
+    cf_query = db.query(CashFlow.date, CashFlow.amount).filter(
         CashFlow.account_id.in_(account_ids),
         CashFlow.type.in_(["deposit", "withdrawal"]),
     ).order_by(CashFlow.date)
@@ -107,7 +115,7 @@ def get_portfolio_summary_data(
     """Compute portfolio summary payload for the given account scope/date range."""
     date_start, date_end = resolve_date_range(period, start_date, end_date)
 
-    latest_portfolio = db.query(DailyPortfolio).filter(
+    latest_portfolio = db.query(DailyPortfolio.date).filter(
         DailyPortfolio.account_id.in_(account_ids)
     ).order_by(DailyPortfolio.date.desc()).first()
     if not latest_portfolio:
@@ -195,7 +203,19 @@ def get_portfolio_performance_data(
     end_date: Optional[str],
 ) -> List[Dict]:
     """Load performance chart series (single-account pass-through or multi-account aggregate)."""
-    query = db.query(DailyPortfolio, DailyMetrics).outerjoin(
+    query = db.query(
+        DailyPortfolio.account_id,
+        DailyPortfolio.date,
+        DailyPortfolio.portfolio_value,
+        DailyPortfolio.net_deposits,
+        # NULL when the outer join found no metrics row for the day.
+        DailyMetrics.date.label("metrics_date"),
+        DailyMetrics.cumulative_return_pct,
+        DailyMetrics.daily_return_pct,
+        DailyMetrics.time_weighted_return,
+        DailyMetrics.money_weighted_return_period,
+        DailyMetrics.current_drawdown,
+    ).outerjoin(
         DailyMetrics,
         (DailyPortfolio.date == DailyMetrics.date) & (DailyPortfolio.account_id == DailyMetrics.account_id),
     ).filter(
@@ -219,7 +239,7 @@ def get_portfolio_performance_data(
                 "portfolio_value": p.portfolio_value,
                 "net_deposits": p.net_deposits,
             }
-            for p, _ in results
+            for p in results
         ]
         cf_dicts = load_cash_flow_events(
             db=db,
@@ -229,7 +249,7 @@ def get_portfolio_performance_data(
         )
 
         # Any missing metric row can produce zero-filled points; recompute to preserve correctness.
-        if any(m is None for _, m in results):
+        if any(r.metrics_date is None for r in results):
             return compute_performance_series(daily_series, cf_dicts)
 
         points = [
@@ -237,15 +257,13 @@ def get_portfolio_performance_data(
                 "date": str(p.date),
                 "portfolio_value": p.portfolio_value,
                 "net_deposits": p.net_deposits,
-                "cumulative_return_pct": m.cumulative_return_pct,
-                "daily_return_pct": m.daily_return_pct,
-                "time_weighted_return": m.time_weighted_return,
-                "money_weighted_return": getattr(
-                    m, "money_weighted_return_period", m.money_weighted_return
-                ),
-                "current_drawdown": m.current_drawdown,
+                "cumulative_return_pct": p.cumulative_return_pct,
+                "daily_return_pct": p.daily_return_pct,
+                "time_weighted_return": p.time_weighted_return,
+                "money_weighted_return": p.money_weighted_return_period,
+                "current_drawdown": p.current_drawdown,
             }
-            for p, m in results
+            for p in results
         ]
         rebased = _rebase_performance_window(points)
         return _overlay_window_mwr(rebased, daily_series, cf_dicts)
@@ -256,7 +274,7 @@ def get_portfolio_performance_data(
     zeros = {"portfolio_value": 0.0, "net_deposits": 0.0}
 
     per_account: dict[str, dict[str, dict]] = defaultdict(dict)
-    for p, _ in results:
+    for p in results:
         ds = str(p.date)
         per_account[p.account_id][ds] = {
             "portfolio_value": p.portfolio_value,
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from fastapi import Response
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.models import SymphonyAllocationHistory
+from app.services.http_cache import conditional_response, make_etag
 
 
 def get_symphony_allocations_data(
@@ -15,19 +19,73 @@ def get_symphony_allocations_data(
     account_id: str,
 ) -> Dict[str, Dict[str, float]]:
     """Return daily allocation history for a symphony."""
-    rows = (
-        db.query(SymphonyAllocationHistory)
+    # Column rows only; the (account_id, symphony_id, date, ticker) unique
+    # index already serves both the filter and the date ordering.
+    query = (
+        db.query(
+            SymphonyAllocationHistory.date,
+            SymphonyAllocationHistory.ticker,
+            SymphonyAllocationHistory.allocation_pct,
+        )
         .filter_by(account_id=account_id, symphony_id=symphony_id)
         .order_by(SymphonyAllocationHistory.date)
-        .all()
     )
-    if not rows:
-        return {}
-
-    result: Dict[str, Dict[str, float]] = {}
-    for row in rows:
-        ds = str(row.date)
-        if ds not in result:
-            result[ds] = {}
-        result[ds][row.ticker] = row.allocation_pct
-    return result
+
+    return _group_by_date(query)
+
+
+def get_symphony_allocations_bulk(
+    db: Session,
+    symphony_ids: List[str],
+    account_id: str,
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Allocation history for several symphonies of one account in one query."""
+    query = (
+        db.query(
+            SymphonyAllocationHistory.symphony_id,
+            SymphonyAllocationHistory.date,
+            SymphonyAllocationHistory.ticker,
+            SymphonyAllocationHistory.allocation_pct,
+        )
+        .filter(
+            SymphonyAllocationHistory.account_id == account_id,
+            SymphonyAllocationHistory.symphony_id.in_(symphony_ids),
+        )
+        .order_by(SymphonyAllocationHistory.symphony_id, SymphonyAllocationHistory.date)
+    )
+
+    by_symphony: Dict[str, List[Tuple[date, str, float]]] = {sid: [] for sid in symphony_ids}
+    for symphony_id, row_date, ticker, allocation_pct in query:
+        by_symphony[symphony_id].append((row_date, ticker, allocation_pct))
+    return {sid: _group_by_date(rows) for sid, rows in by_symphony.items()}
+
+
+def _group_by_date(rows: Iterable[Tuple[date, str, float]]) -> Dict[str, Dict[str, float]]:
+    by_date: Dict[date, Dict[str, float]] = {}
+    for row_date, ticker, allocation_pct in rows:
+        by_date.setdefault(row_date, {})[ticker] = allocation_pct
+    return {str(row_date): allocs for row_date, allocs in by_date.items()}
+
+
+def get_symphony_allocations_response(
+    db: Session,
+    symphony_id: str,
+    account_id: str,
+    if_none_match: Optional[str] = None,
+) -> Response:
+    """Allocation history with an ETag; 304 when the client copy is current.
+
+    Snapshots are append-only, so row count plus the newest row id identify
+    the history version without reading it.
+    """
+    row_count, max_id = (
+        db.query(func.count(SymphonyAllocationHistory.id), func.max(SymphonyAllocationHistory.id))
+        .filter_by(account_id=account_id, symphony_id=symphony_id)
+        .one()
+    )
+    etag = make_etag(account_id, symphony_id, row_count, max_id or 0)
+    return conditional_response(
+        if_none_match,
+        etag,
+        lambda: get_symphony_allocations_data(db=db, symphony_id=symphony_id, account_id=account_id),
+    )
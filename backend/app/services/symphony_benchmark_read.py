@@ -3,26 +3,34 @@
 from __future__ import annotations
 
 import logging
-import math
-import time
-from datetime import date
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from threading import Lock
 from typing import Dict, Optional, Tuple
 
-from fastapi import HTTPException
+import numpy as np
+from fastapi import HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app.composer_client import ComposerClient
-from app.config import load_accounts
+from app.config import load_accounts_by_name
 from app.models import Account
+from app.services.account_clients import get_client_for_credentials
+from app.services.backtest_cache import dvm_series_records, get_cached_dvm_series
+from app.services.http_cache import conditional_response, make_etag
+from app.services.json_response import FastJSONResponse
+from app.services.metrics import compute_return_drawdown_series
+from app.services.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
-_symphony_bench_cache: Dict[str, Tuple[float, Dict]] = {}
 _SYMPHONY_BENCH_TTL = 3600  # 1 hour
-
-
-def _epoch_day_to_date(day_num: int) -> date:
-    return date.fromordinal(date(1970, 1, 1).toordinal() + day_num)
+_SYMPHONY_BENCH_CACHE_MAX = 512
+# symphony_id -> (etag, response, encoded JSON body)
+_symphony_bench_cache = TTLCache(maxsize=_SYMPHONY_BENCH_CACHE_MAX, ttl=_SYMPHONY_BENCH_TTL)
+# symphony_id -> Future of the entry being built; concurrent misses wait on it.
+_symphony_bench_inflight: Dict[str, Future] = {}
+_symphony_bench_inflight_lock = Lock()
 
 
 def get_symphony_benchmark_data(
@@ -30,41 +38,122 @@ def get_symphony_benchmark_data(
     symphony_id: str,
     account_id: Optional[str] = None,  # kept for interface compatibility
 ) -> Dict:
-    """Fetch symphony backtest and map to benchmark-history chart format."""
+    """Fetch symphony backtest and map to benchmark-history chart format.
+
+    Concurrent misses for the same symphony share a single fetch.
+    """
+    return _get_symphony_benchmark(db, symphony_id)[1]
+
+
+def get_symphony_benchmark_response(
+    db: Session,
+    symphony_id: str,
+    if_none_match: Optional[str] = None,
+) -> Response:
+    """Benchmark-history payload with an ETag; 304 when the client copy is current.
+
+    The body is encoded once per cache entry, so hits skip serialization.
+    """
+    etag, _response, body = _get_symphony_benchmark(db, symphony_id)
+    return conditional_response(
+        if_none_match, etag, lambda: Response(content=body, media_type="application/json")
+    )
+
+
+def _get_symphony_benchmark(db: Session, symphony_id: str) -> Tuple[str, Dict, bytes]:
     symphony_id = symphony_id.strip()
     if not symphony_id:
         raise HTTPException(400, "Symphony ID is required")
 
-    if symphony_id in _symphony_bench_cache:
-        ts, cached = _symphony_bench_cache[symphony_id]
-        if time.time() - ts < _SYMPHONY_BENCH_TTL:
-            return cached
-
-    all_accounts = db.query(Account).all()
-    if not all_accounts:
+    cached = _symphony_bench_cache.get(symphony_id)
+    if cached is not None:
+        return cached
+
+    with _symphony_bench_inflight_lock:
+        pending = _symphony_bench_inflight.get(symphony_id)
+        if pending is None:
+            pending = Future()
+            _symphony_bench_inflight[symphony_id] = pending
+            is_owner = True
+        else:
+            is_owner = False
+    if not is_owner:
+        return pending.result()
+
+    try:
+        response = _build_symphony_benchmark(db, symphony_id)
+        body = FastJSONResponse(response).body
+        # Content hash, so rebuilds of unchanged data keep the same validator.
+        entry = (make_etag(symphony_id, f"{zlib.crc32(body):08x}"), response, body)
+    except BaseException as exc:
+        pending.set_exception(exc)
+        raise
+    else:
+        _symphony_bench_cache.set(symphony_id, entry)
+        pending.set_result(entry)
+        return entry
+    finally:
+        with _symphony_bench_inflight_lock:
+            _symphony_bench_inflight.pop(symphony_id, None)
+
+
+def _get_credential_clients(db: Session) -> Dict[str, ComposerClient]:
+    """Clients for every discovered credential.
+
+    Read from config.json on every miss so rotated or added keys apply at
+    once; ``get_client_for_credentials`` already reuses unchanged clients.
+    """
+    credential_names = [name for (name,) in db.query(Account.credential_name).distinct().all()]
+    if not credential_names:
         raise HTTPException(404, "No accounts discovered")
 
-    accounts_creds = load_accounts()
+    creds_by_name = load_accounts_by_name()
     cred_map: Dict[str, ComposerClient] = {}
-    for acct in all_accounts:
-        if acct.credential_name not in cred_map:
-            for creds in accounts_creds:
-                if creds.name == acct.credential_name:
-                    cred_map[acct.credential_name] = ComposerClient.from_credentials(creds)
-                    break
+    for credential_name in credential_names:
+        creds = creds_by_name.get(credential_name)
+        if creds is not None:
+            cred_map[credential_name] = get_client_for_credentials(creds)
+    return cred_map
+
+
+def _build_symphony_benchmark(db: Session, symphony_id: str) -> Dict:
+    # A fresh backtest cache row already holds the day-sorted series.
+    stored = get_cached_dvm_series(db, symphony_id)
+    if stored is not None and stored[0] and len(stored[1]) >= 2:
+        symphony_name, records = stored
+        return _benchmark_response(symphony_name, records["day"], records["value"])
+
+    cred_map = _get_credential_clients(db)
 
     backtest_data = None
     last_error = ""
     client = None
-    for cred_name, cred_client in cred_map.items():
+    if cred_map:
+        # Ask every credential at once; the first one to succeed wins, so a
+        # slow or hanging credential never delays the response.  Credential
+        # order only breaks ties between answers that are already in.
+        pool = ThreadPoolExecutor(max_workers=len(cred_map))
         try:
-            client = cred_client
-            backtest_data = cred_client.get_symphony_backtest(symphony_id)
-            break
-        except Exception as exc:
-            last_error = str(exc)
-            logger.debug("Backtest for %s failed with credentials '%s': %s", symphony_id, cred_name, exc)
-            continue
+            attempts = {
+                pool.submit(cred_client.get_symphony_backtest, symphony_id): (cred_name, cred_client)
+                for cred_name, cred_client in cred_map.items()
+            }
+            for future in as_completed(attempts):
+                exc = future.exception()
+                if exc is not None:
+                    last_error = str(exc)
+                    logger.debug(
+                        "Backtest for %s failed with credentials '%s': %s", symphony_id, attempts[future][0], exc
+                    )
+                    continue
+                winner = next(
+                    f for f in attempts if f.done() and not f.cancelled() and f.exception() is None
+                )
+                backtest_data = winner.result()
+                client = attempts[winner][1]
+                break
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     if backtest_data is None:
         raise HTTPException(404, f"Symphony '{symphony_id}' not found or backtest failed: {last_error}")
@@ -82,42 +171,33 @@ def get_symphony_benchmark_data(
     if not dvm_capital:
         raise HTTPException(400, "No backtest data available for this symphony")
 
-    first_key = next(iter(dvm_capital))
-    series = dvm_capital[first_key] if isinstance(dvm_capital[first_key], dict) else dvm_capital
-
-    sorted_keys = sorted(series.keys(), key=lambda k: int(k))
-    if len(sorted_keys) < 2:
+    records = dvm_series_records(dvm_capital)
+    if records is None or len(records) < 2:
         raise HTTPException(400, "Insufficient backtest data")
 
-    closes = []
-    for key in sorted_keys:
-        day_num = int(key)
-        row_date = _epoch_day_to_date(day_num)
-        value = float(series[key])
-        if not math.isnan(value) and value > 0:
-            closes.append((row_date, value))
+    return _benchmark_response(symphony_name, records["day"], records["value"])
 
-    if not closes:
-        raise HTTPException(400, "No valid backtest data")
 
-    first_value = closes[0][1]
-    result_data = []
-    peak = first_value
-    for row_date, value in closes:
-        return_pct = round(((value / first_value) - 1) * 100, 4)
-        if value > peak:
-            peak = value
-        drawdown_pct = round(((value / peak) - 1) * 100, 4) if peak > 0 else 0.0
-        result_data.append(
-            {
-                "date": str(row_date),
-                "close": round(value, 2),
-                "return_pct": return_pct,
-                "drawdown_pct": drawdown_pct,
-                "mwr_pct": 0.0,
-            }
-        )
+def _benchmark_response(symphony_name: str, days: np.ndarray, values: np.ndarray) -> Dict:
+    """Benchmark-history payload from day-sorted (epoch day, value) arrays."""
+    valid = values > 0  # also drops NaN
+    if not valid.any():
+        raise HTTPException(400, "No valid backtest data")
 
-    response = {"name": symphony_name, "ticker": symphony_name, "data": result_data}
-    _symphony_bench_cache[symphony_id] = (time.time(), response)
-    return response
+    values = values[valid]
+    dates = days[valid].astype("datetime64[D]").astype(str).tolist()
+    return_pct, drawdown_pct = compute_return_drawdown_series(values)
+    closes = np.round(values, 2).tolist()
+
+    result_data = [
+        {
+            "date": row_date,
+            "close": close,
+            "return_pct": ret,
+            "drawdown_pct": dd,
+            "mwr_pct": 0.0,
+        }
+        for row_date, close, ret, dd in zip(dates, closes, return_pct.tolist(), drawdown_pct.tolist())
+    ]
+
+    return {"name": symphony_name, "ticker": symphony_name, "data": result_data}
@@ -0,0 +1,124 @@
+"""Bulk symphony read service (several symphonies per request)."""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.services.backtest_cache import get_backtest_summaries
+from app.services.symphony_allocations_read import get_symphony_allocations_bulk
+from app.services.symphony_read import get_symphony_performance_data, get_symphony_summary_data
+
+logger = logging.getLogger(__name__)
+
+BULK_FIELDS = ("performance", "summary", "allocations", "backtest_summary")
+MAX_BULK_SYMPHONIES = 100
+_PER_SYMPHONY_FIELDS = ("performance", "summary")
+# Bounds concurrent Composer history calls and SQLite readers per request.
+_BULK_READ_MAX_WORKERS = 8
+
+
+def get_symphonies_bulk_data(
+    db: Session,
+    account_id: str,
+    symphony_ids: List[str],
+    fields: Optional[List[str]],
+    get_client_for_account_fn: Callable[[Session, str], object],
+) -> Dict[str, Dict[str, Any]]:
+    """Selected read payloads for many symphonies of one account, keyed by symphony id.
+
+    Allocations and backtest summaries are loaded with one query each for
+    the whole batch; performance and summary reuse the per-symphony services
+    (and their caches) and run concurrently, one session per worker, so
+    live history calls overlap.  A field that cannot be loaded for one
+    symphony is None rather than failing the whole batch.
+    """
+    ids = list(dict.fromkeys(sid.strip() for sid in symphony_ids if sid and sid.strip()))
+    if not ids:
+        raise HTTPException(400, "At least one symphony ID is required")
+    if len(ids) > MAX_BULK_SYMPHONIES:
+        raise HTTPException(400, f"At most {MAX_BULK_SYMPHONIES} symphonies per request")
+    fields = list(dict.fromkeys(fields)) if fields else list(BULK_FIELDS)
+    unknown = [field for field in fields if field not in BULK_FIELDS]
+    if unknown:
+        raise HTTPException(400, f"Unknown fields: {', '.join(unknown)}")
+
+    result: Dict[str, Dict[str, Any]] = {sid: {} for sid in ids}
+
+    if "allocations" in fields:
+        allocations = get_symphony_allocations_bulk(db, ids, account_id)
+        for sid in ids:
+            result[sid]["allocations"] = allocations[sid]
+
+    if "backtest_summary" in fields:
+        summaries = get_backtest_summaries(db, ids)
+        for sid in ids:
+            result[sid]["backtest_summary"] = summaries.get(sid)
+
+    per_symphony = [field for field in fields if field in _PER_SYMPHONY_FIELDS]
+    if not per_symphony:
+        return result
+
+    if len(ids) == 1:
+        result[ids[0]].update(
+            _load_symphony_fields(db, ids[0], account_id, per_symphony, get_client_for_account_fn)
+        )
+        return result
+
+    session_factory = sessionmaker(bind=db.get_bind())
+
+    def load(sid: str) -> Dict[str, Any]:
+        worker_db = session_factory()
+        try:
+            return _load_symphony_fields(worker_db, sid, account_id, per_symphony, get_client_for_account_fn)
+        finally:
+            worker_db.close()
+
+    with ThreadPoolExecutor(max_workers=min(_BULK_READ_MAX_WORKERS, len(ids))) as pool:
+        for sid, loaded in zip(ids, pool.map(load, ids)):
+            result[sid].update(loaded)
+
+    return result
+
+
+def _load_symphony_fields(
+    db: Session,
+    symphony_id: str,
+    account_id: str,
+    fields: List[str],
+    get_client_for_account_fn: Callable[[Session, str], object],
+) -> Dict[str, Any]:
+    loaded: Dict[str, Any] = {}
+    if "performance" in fields:
+        loaded["performance"] = _or_none(
+            lambda: get_symphony_performance_data(
+                db=db,
+                symphony_id=symphony_id,
+                account_id=account_id,
+                get_client_for_account_fn=get_client_for_account_fn,
+            )
+        )
+    if "summary" in fields:
+        loaded["summary"] = _or_none(
+            lambda: get_symphony_summary_data(
+                db=db,
+                symphony_id=symphony_id,
+                account_id=account_id,
+                period=None,
+                start_date=None,
+                end_date=None,
+            )
+        )
+    return loaded
+
+
+def _or_none(load: Callable[[], Any]) -> Any:
+    try:
+        return load()
+    except HTTPException as exc:
+        logger.debug("Bulk symphony read skipped a field: %s", exc.detail)
+        return None
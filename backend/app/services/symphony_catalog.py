@@ -3,74 +3,118 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from threading import Lock
 from typing import Dict, List
 
 from sqlalchemy.orm import Session
 
-from app.composer_client import ComposerClient
 from app.config import load_accounts
 from app.models import Account, SymphonyCatalogEntry
+from app.services.account_clients import get_client_for_credentials
+from app.services.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 _CATALOG_TTL_SECONDS = 3600  # auto-refresh if older than 1 hour
+_CATALOG_FETCH_MAX_WORKERS = 16
+# Every catalog write goes through _refresh_symphony_catalog, which clears this
+# cache, so the TTL only bounds how late the hourly staleness check runs.
+_CATALOG_RESPONSE_TTL_SECONDS = 300
+_catalog_rows_cache = TTLCache(maxsize=1, ttl=_CATALOG_RESPONSE_TTL_SECONDS)
+# Serializes cache misses so concurrent requests share one refresh/read.
+_catalog_load_lock = Lock()
+
+
+def _catalog_sid(symphony: Dict) -> str:
+    return symphony.get("symphony_id", symphony.get("id", symphony.get("symphony_sid", "")))
 
 
 def _refresh_symphony_catalog(db: Session) -> None:
-    """Fetch invested, watchlist, and drafts across credentials and upsert."""
+    """Fetch invested, watchlist, and drafts across credentials and upsert.
+
+    All Composer requests are independent, so they are fanned out on a thread
+    pool; results are merged afterwards in credential order so precedence
+    (invested > watchlist > draft) matches a sequential refresh.
+    """
     accounts_creds = load_accounts()
-    now = datetime.utcnow()
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
     entries: Dict[str, tuple] = {}
     had_errors = False
 
+    plan = []
     for creds in accounts_creds:
-        client = ComposerClient.from_credentials(creds)
+        client = get_client_for_credentials(creds)
+        account_ids = [
+            acct_id
+            for (acct_id,) in db.query(Account.id).filter_by(credential_name=creds.name).all()
+        ]
+        plan.append((creds, client, account_ids))
+
+    n_tasks = sum(len(account_ids) + 2 for _, _, account_ids in plan)
+    with ThreadPoolExecutor(max_workers=max(1, min(_CATALOG_FETCH_MAX_WORKERS, n_tasks))) as pool:
+        futures = [
+            (
+                creds,
+                [(acct_id, pool.submit(client.get_symphony_stats, acct_id)) for acct_id in account_ids],
+                pool.submit(client.get_watchlist),
+                pool.submit(client.get_drafts),
+            )
+            for creds, client, account_ids in plan
+        ]
+
+        for creds, stats_futures, watchlist_future, drafts_future in futures:
+            for acct_id, future in stats_futures:
+                try:
+                    for symphony in future.result():
+                        sid = symphony.get("id", "")
+                        name = symphony.get("name", "")
+                        if sid and name:
+                            entries[sid] = (sid, name, "invested", creds.name)
+                except Exception as exc:
+                    logger.warning("Catalog: failed invested fetch for %s/%s: %s", creds.name, acct_id, exc)
+                    had_errors = True
 
-        db_accounts = db.query(Account).filter_by(credential_name=creds.name).all()
-        for acct in db_accounts:
             try:
-                symphonies = client.get_symphony_stats(acct.id)
-                for symphony in symphonies:
-                    sid = symphony.get("id", "")
+                for symphony in watchlist_future.result():
+                    sid = _catalog_sid(symphony)
                     name = symphony.get("name", "")
-                    if sid and name:
-                        entries[sid] = (sid, name, "invested", creds.name)
+                    if sid and name and sid not in entries:
+                        entries[sid] = (sid, name, "watchlist", creds.name)
             except Exception as exc:
-                logger.warning("Catalog: failed invested fetch for %s/%s: %s", creds.name, acct.id, exc)
+                logger.warning("Catalog: failed watchlist fetch for %s: %s", creds.name, exc)
                 had_errors = True
 
-        try:
-            watchlist = client.get_watchlist()
-            for symphony in watchlist:
-                sid = symphony.get("symphony_id", symphony.get("id", symphony.get("symphony_sid", "")))
-                name = symphony.get("name", "")
-                if sid and name and sid not in entries:
-                    entries[sid] = (sid, name, "watchlist", creds.name)
-        except Exception as exc:
-            logger.warning("Catalog: failed watchlist fetch for %s: %s", creds.name, exc)
-            had_errors = True
+            try:
+                for symphony in drafts_future.result():
+                    sid = _catalog_sid(symphony)
+                    name = symphony.get("name", "")
+                    if sid and name and sid not in entries:
+                        entries[sid] = (sid, name, "draft", creds.name)
+            except Exception as exc:
+                logger.warning("Catalog: failed drafts fetch for %s: %s", creds.name, exc)
+                had_errors = True
 
-        try:
-            drafts = client.get_drafts()
-            for symphony in drafts:
-                sid = symphony.get("symphony_id", symphony.get("id", symphony.get("symphony_sid", "")))
-                name = symphony.get("name", "")
-                if sid and name and sid not in entries:
-                    entries[sid] = (sid, name, "draft", creds.name)
-        except Exception as exc:
-            logger.warning("Catalog: failed drafts fetch for %s: %s", creds.name, exc)
-            had_errors = True
+    existing_rows = {}
+    if entries:
+        existing_rows = {
+            row.symphony_id: row
+            for row in db.query(SymphonyCatalogEntry)
+            .filter(SymphonyCatalogEntry.symphony_id.in_(list(entries.keys())))
+            .all()
+        }
 
+    new_rows = []
     for sid, name, source, cred_name in entries.values():
-        existing = db.query(SymphonyCatalogEntry).filter_by(symphony_id=sid).first()
+        existing = existing_rows.get(sid)
         if existing:
             existing.name = name
             existing.source = source
             existing.credential_name = cred_name
             existing.updated_at = now
         else:
-            db.add(
+            new_rows.append(
                 SymphonyCatalogEntry(
                     symphony_id=sid,
                     name=name,
@@ -79,6 +123,7 @@ def _refresh_symphony_catalog(db: Session) -> None:
                     updated_at=now,
                 )
             )
+    db.add_all(new_rows)
 
     if not had_errors:
         valid_ids = list(entries.keys())
@@ -90,15 +135,30 @@ def _refresh_symphony_catalog(db: Session) -> None:
             db.query(SymphonyCatalogEntry).delete(synchronize_session=False)
 
     db.commit()
+    _catalog_rows_cache.clear()
     logger.info("Symphony catalog refreshed: %d entries", len(entries))
 
 
 def get_symphony_catalog_data(db: Session, refresh: bool = False) -> List[Dict]:
     """Return cached catalog rows, auto-refreshing when stale or forced."""
+    if not refresh:
+        cached = _catalog_rows_cache.get("rows")
+        if cached is not None:
+            return cached
+
+    with _catalog_load_lock:
+        if not refresh:
+            cached = _catalog_rows_cache.get("rows")
+            if cached is not None:
+                return cached
+        return _load_symphony_catalog(db, refresh)
+
+
+def _load_symphony_catalog(db: Session, refresh: bool) -> List[Dict]:
     from sqlalchemy import func
 
     latest = db.query(func.max(SymphonyCatalogEntry.updated_at)).scalar()
-    is_stale = latest is None or (datetime.utcnow() - latest).total_seconds() > _CATALOG_TTL_SECONDS
+    is_stale = latest is None or (datetime.now(timezone.utc).replace(tzinfo=None) - latest).total_seconds() > _CATALOG_TTL_SECONDS
 
     if refresh or is_stale:
         try:
@@ -109,4 +169,6 @@ def get_symphony_catalog_data(db: Session, refresh: bool = False) -> List[Dict]:
                 return []
 
     rows = db.query(SymphonyCatalogEntry).order_by(SymphonyCatalogEntry.name).all()
-    return [{"symphony_id": row.symphony_id, "name": row.name, "source": row.source} for row in rows]
+    result = [{"symphony_id": row.symphony_id, "name": row.name, "source": row.source} for row in rows]
+    _catalog_rows_cache.set("rows", result)
+    return result
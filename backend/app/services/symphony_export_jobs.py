@@ -113,10 +113,10 @@ def _run_export_job(job_id: str, account_ids: List[str]) -> None:
             return _is_cancel_requested(job_id)
 
         # Resolve credential grouping to avoid exporting drafts repeatedly per sub-account.
-        rows = db.query(Account).filter(Account.id.in_(account_ids)).all()
+        rows = db.query(Account.id, Account.credential_name).filter(Account.id.in_(account_ids)).all()
         cred_to_ids: Dict[str, List[str]] = defaultdict(list)
-        for row in rows:
-            cred_to_ids[row.credential_name].append(row.id)
+        for aid, cred_name in rows:
+            cred_to_ids[cred_name].append(aid)
 
         # Keep processing deterministic for logs and stable progress.
         for cred_name in sorted(cred_to_ids.keys()):
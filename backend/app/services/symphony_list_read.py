@@ -5,8 +5,11 @@ from __future__ import annotations
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Dict, List, Optional
 
+import numpy as np
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.models import Account, SymphonyDailyMetrics, SymphonyDailyPortfolio
@@ -14,37 +17,43 @@ from app.services.account_scope import resolve_account_ids
 
 logger = logging.getLogger(__name__)
 
+_LIST_FETCH_MAX_WORKERS = 8
+
 _TEST_META_PATH = os.path.join(
     os.path.dirname(__file__), "..", "..", "data", "test_symphony_meta.json"
 )
 
 
+def _load_test_meta() -> Optional[Dict]:
+    meta_path = os.path.normpath(_TEST_META_PATH)
+    if not os.path.exists(meta_path):
+        logger.warning("Test symphony meta not found at %s", meta_path)
+        return None
+    with open(meta_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 def _list_symphonies_test(
     db: Session,
     account_id: str,
     account_name: str,
     stored_twr: dict,
+    meta: Optional[Dict],
 ) -> List[Dict]:
     """Build symphony list for __TEST__ accounts from DB + JSON metadata."""
-    meta_path = os.path.normpath(_TEST_META_PATH)
-    if not os.path.exists(meta_path):
-        logger.warning("Test symphony meta not found at %s", meta_path)
+    if meta is None:
         return _list_symphonies_test_from_db(
             db=db,
             account_id=account_id,
             account_name=account_name,
             stored_twr=stored_twr,
         )
-    with open(meta_path, "r", encoding="utf-8") as f:
-        meta = json.load(f)
 
     result = []
     for sym_id, meta_row in meta.items():
         twr = stored_twr.get((account_id, sym_id))
         if twr is None:
             twr = meta_row.get("time_weighted_return", 0.0)
-        else:
-            twr = round(twr, 2)
         result.append(
             {
                 "id": sym_id,
@@ -193,6 +202,91 @@ def _list_symphonies_test_from_db(
     return result
 
 
+# Numeric fields copied straight from symphony-stats-meta, rounded to cents.
+_DOLLAR_FIELDS = ("value", "net_deposits", "cash", "last_dollar_change", "sharpe_ratio")
+# (output key, API key) pairs for fractional fields reported as percentages.
+_PERCENT_FIELDS = (
+    ("simple_return", "simple_return"),
+    ("last_percent_change", "last_percent_change"),
+    ("max_drawdown", "max_drawdown"),
+    ("annualized_return", "annualized_rate_of_return"),
+)
+
+
+def _build_symphony_rows(
+    symphonies: List[Dict],
+    account_id: str,
+    account_name: str,
+    stored_twr: dict,
+) -> List[Dict]:
+    """Map symphony-stats-meta payloads to list rows.
+
+    Numeric coercion runs as one NumPy pass over the whole batch instead of
+    a ``round()`` call per field per symphony.
+    """
+    if not symphonies:
+        return []
+
+    dollars = np.array(
+        [[s.get(field, 0) for field in _DOLLAR_FIELDS] for s in symphonies],
+        dtype=np.float64,
+    )
+    fractions = np.array(
+        [[s.get(api_key, 0) for _, api_key in _PERCENT_FIELDS] for s in symphonies],
+        dtype=np.float64,
+    )
+    value, net_deposits = dollars[:, 0], dollars[:, 1]
+    total_return = value - net_deposits
+    cum_return_pct = np.divide(
+        total_return,
+        net_deposits,
+        out=np.zeros_like(total_return),
+        where=net_deposits != 0,
+    ) * 100
+
+    dollars_out = np.round(dollars, 2).tolist()
+    percents_out = np.round(fractions * 100, 2).tolist()
+    total_return_out = np.round(total_return, 2).tolist()
+    cum_return_out = np.round(cum_return_pct, 2).tolist()
+
+    rows: List[Dict] = []
+    for i, symphony in enumerate(symphonies):
+        sym_id = symphony.get("id", "")
+        twr = stored_twr.get((account_id, sym_id))
+        if twr is None:
+            api_twr = symphony.get("time_weighted_return")
+            twr = round(api_twr * 100, 2) if api_twr is not None else 0.0
+
+        row = {
+            "id": sym_id,
+            "position_id": symphony.get("position_id", ""),
+            "account_id": account_id,
+            "account_name": account_name,
+            "name": symphony.get("name", "Unknown"),
+            "color": symphony.get("color", "#888"),
+            "total_return": total_return_out[i],
+            "cumulative_return_pct": cum_return_out[i],
+            "time_weighted_return": twr,
+            "invested_since": symphony.get("invested_since", ""),
+            "last_rebalance_on": symphony.get("last_rebalance_on"),
+            "next_rebalance_on": symphony.get("next_rebalance_on"),
+            "rebalance_frequency": symphony.get("rebalance_frequency", ""),
+            "holdings": [
+                {
+                    "ticker": holding.get("ticker", ""),
+                    "allocation": round(holding.get("allocation", 0) * 100, 2),
+                    "value": round(holding.get("value", 0), 2),
+                    "last_percent_change": round(holding.get("last_percent_change", 0) * 100, 2),
+                }
+                for holding in symphony.get("holdings", [])
+            ],
+        }
+        row.update(zip(_DOLLAR_FIELDS, dollars_out[i]))
+        row.update(zip((key for key, _ in _PERCENT_FIELDS), percents_out[i]))
+        rows.append(row)
+    return rows
+
+
 def get_symphonies_list_data(
     db: Session,
     account_id: Optional[str],
@@ -201,100 +295,92 @@ def get_symphonies_list_data(
 ) -> List[Dict]:
     """List active symphonies across one or more sub-accounts."""
     ids = resolve_account_ids(db, account_id)
-    acct_names = {a.id: a.display_name for a in db.query(Account).filter(Account.id.in_(ids)).all()}
+    accts = (
+        db.query(Account.id, Account.credential_name, Account.display_name)
+        .filter(Account.id.in_(ids))
+        .all()
+    )
+    acct_names = {aid: display_name for aid, _cred, display_name in accts}
 
-    stored_twr: dict = {}
-    for aid in ids:
-        rows = (
-            db.query(SymphonyDailyMetrics.symphony_id, SymphonyDailyMetrics.time_weighted_return)
-            .filter_by(account_id=aid)
-            .order_by(SymphonyDailyMetrics.date.desc())
-            .all()
+    # Latest stored TWR per (account, symphony), already rounded by the DB.
+    latest_dates = (
+        db.query(
+            SymphonyDailyMetrics.account_id.label("account_id"),
+            SymphonyDailyMetrics.symphony_id.label("symphony_id"),
+            func.max(SymphonyDailyMetrics.date).label("date"),
+        )
+        .filter(SymphonyDailyMetrics.account_id.in_(ids))
+        .group_by(SymphonyDailyMetrics.account_id, SymphonyDailyMetrics.symphony_id)
+        .subquery()
+    )
+    stored_twr: dict = {
+        (aid, sym_id): twr
+        for aid, sym_id, twr in db.query(
+            SymphonyDailyMetrics.account_id,
+            SymphonyDailyMetrics.symphony_id,
+            func.round(SymphonyDailyMetrics.time_weighted_return, 2),
+        ).join(
+            latest_dates,
+            (SymphonyDailyMetrics.account_id == latest_dates.c.account_id)
+            & (SymphonyDailyMetrics.symphony_id == latest_dates.c.symphony_id)
+            & (SymphonyDailyMetrics.date == latest_dates.c.date),
         )
-        seen = set()
-        for sym_id, twr in rows:
-            if sym_id not in seen:
-                stored_twr[(aid, sym_id)] = twr
-                seen.add(sym_id)
-
-    test_ids = {
-        acct.id
-        for acct in db.query(Account).filter(Account.id.in_(ids)).all()
-        if acct.credential_name == test_credential
     }
 
-    result = []
+    cred_by_id = {aid: cred_name for aid, cred_name, _display_name in accts}
+    test_ids = {aid for aid, cred_name in cred_by_id.items() if cred_name == test_credential}
+    test_meta = _load_test_meta() if test_ids else None
+
+    # Resolve one client per credential on the request thread (DB access),
+    # then fan the per-account symphony-stats calls out so wall time tracks
+    # the slowest account.
+    cred_clients: Dict[Optional[str], Optional[object]] = {}
+    live_clients: Dict[str, object] = {}
     for aid in ids:
         if aid in test_ids:
-            result.extend(
-                _list_symphonies_test(
-                    db=db,
-                    account_id=aid,
-                    account_name=acct_names.get(aid, aid),
-                    stored_twr=stored_twr,
-                )
-            )
             continue
+        cred_name = cred_by_id.get(aid)
+        if cred_name not in cred_clients:
+            try:
+                cred_clients[cred_name] = get_client_for_account_fn(db, aid)
+            except Exception as exc:
+                logger.warning("Failed to fetch symphonies for account %s: %s", aid, exc)
+                cred_clients[cred_name] = None
+        client = cred_clients[cred_name]
+        if client is not None:
+            live_clients[aid] = client
+
+    result = []
+    with ThreadPoolExecutor(max_workers=max(1, min(_LIST_FETCH_MAX_WORKERS, len(live_clients)))) as pool:
+        stats_futures = {
+            aid: pool.submit(client.get_symphony_stats, aid) for aid, client in live_clients.items()
+        }
+        for aid in ids:
+            if aid in test_ids:
+                result.extend(
+                    _list_symphonies_test(
+                        db=db,
+                        account_id=aid,
+                        account_name=acct_names.get(aid, aid),
+                        stored_twr=stored_twr,
+                        meta=test_meta,
+                    )
+                )
+                continue
 
-        try:
-            client = get_client_for_account_fn(db, aid)
-            symphonies = client.get_symphony_stats(aid)
-            for symphony in symphonies:
-                sym_id = symphony.get("id", "")
-                total_return = symphony.get("value", 0) - symphony.get("net_deposits", 0)
-                cum_return_pct = (
-                    total_return / symphony.get("net_deposits", 1) * 100
-                ) if symphony.get("net_deposits", 0) else 0
-
-                twr = stored_twr.get((aid, sym_id))
-                if twr is None:
-                    api_twr = symphony.get("time_weighted_return")
-                    twr = round(api_twr * 100, 2) if api_twr is not None else 0.0
-                else:
-                    twr = round(twr, 2)
-
-                result.append(
-                    {
-                        "id": sym_id,
-                        "position_id": symphony.get("position_id", ""),
-                        "account_id": aid,
-                        "account_name": acct_names.get(aid, aid),
-                        "name": symphony.get("name", "Unknown"),
-                        "color": symphony.get("color", "#888"),
-                        "value": round(symphony.get("value", 0), 2),
-                        "net_deposits": round(symphony.get("net_deposits", 0), 2),
-                        "cash": round(symphony.get("cash", 0), 2),
-                        "total_return": round(total_return, 2),
-                        "cumulative_return_pct": round(cum_return_pct, 2),
-                        "simple_return": round(symphony.get("simple_return", 0) * 100, 2),
-                        "time_weighted_return": twr,
-                        "last_dollar_change": round(symphony.get("last_dollar_change", 0), 2),
-                        "last_percent_change": round(
-                            symphony.get("last_percent_change", 0) * 100, 2
-                        ),
-                        "sharpe_ratio": round(symphony.get("sharpe_ratio", 0), 2),
-                        "max_drawdown": round(symphony.get("max_drawdown", 0) * 100, 2),
-                        "annualized_return": round(
-                            symphony.get("annualized_rate_of_return", 0) * 100, 2
-                        ),
-                        "invested_since": symphony.get("invested_since", ""),
-                        "last_rebalance_on": symphony.get("last_rebalance_on"),
-                        "next_rebalance_on": symphony.get("next_rebalance_on"),
-                        "rebalance_frequency": symphony.get("rebalance_frequency", ""),
-                        "holdings": [
-                            {
-                                "ticker": holding.get("ticker", ""),
-                                "allocation": round(holding.get("allocation", 0) * 100, 2),
-                                "value": round(holding.get("value", 0), 2),
-                                "last_percent_change": round(
-                                    holding.get("last_percent_change", 0) * 100, 2
-                                ),
-                            }
-                            for holding in symphony.get("holdings", [])
-                        ],
-                    }
+            future = stats_futures.get(aid)
+            if future is None:
+                continue
+            try:
+                result.extend(
+                    _build_symphony_rows(
+                        future.result(),
+                        account_id=aid,
+                        account_name=acct_names.get(aid, aid),
+                        stored_twr=stored_twr,
+                    )
                 )
-        except Exception as exc:
-            logger.warning("Failed to fetch symphonies for account %s: %s", aid, exc)
+            except Exception as exc:
+                logger.warning("Failed to fetch symphonies for account %s: %s", aid, exc)
 
     return result
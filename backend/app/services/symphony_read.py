@@ -2,20 +2,34 @@
 
 from __future__ import annotations
 
-import time
 from datetime import date, timedelta
 from typing import Callable, Dict, List, Optional
 
+import numpy as np
 from fastapi import HTTPException
+from sqlalchemy import Row, func
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
 from app.models import SymphonyDailyMetrics, SymphonyDailyPortfolio
 from app.services.date_filters import parse_iso_date
 from app.services.metrics import compute_all_metrics, compute_latest_metrics
+from app.services.ttl_cache import TTLCache
 
-_sym_live_cache: dict = {}  # key: (symphony_id, account_id, period, start, end) -> {ts, data}
 _SYM_LIVE_CACHE_TTL = 120  # seconds
+_SYM_LIVE_CACHE_MAX_ENTRIES = 1024
+# key: (symphony_id, account_id, period, start, end) -> {daily_dicts, cf_dicts, first_date_str}
+_sym_live_cache = TTLCache(maxsize=_SYM_LIVE_CACHE_MAX_ENTRIES, ttl=_SYM_LIVE_CACHE_TTL)
+
+_SYM_PERF_CACHE_TTL = 300  # seconds; sync invalidates affected accounts explicitly
+_SYM_PERF_CACHE_MAX_ENTRIES = 256
+# key: (account_id, symphony_id) -> list of PerformancePoint dicts
+_sym_perf_cache = TTLCache(maxsize=_SYM_PERF_CACHE_MAX_ENTRIES, ttl=_SYM_PERF_CACHE_TTL)
+
+_SYM_LATEST_CACHE_TTL = 30  # seconds
+_SYM_LATEST_CACHE_MAX_ENTRIES = 1024
+# key: (account_id, symphony_id) -> (date, portfolio_value, net_deposits) row
+_sym_latest_cache = TTLCache(maxsize=_SYM_LATEST_CACHE_MAX_ENTRIES, ttl=_SYM_LATEST_CACHE_TTL)
 
 
 def invalidate_symphony_live_cache(
@@ -38,7 +52,7 @@ def invalidate_symphony_live_cache(
         return removed
 
     to_remove = []
-    for key in _sym_live_cache:
+    for key in _sym_live_cache.keys():
         key_symphony_id, key_account_id = key[0], key[1]
         if account_id is not None and key_account_id != account_id:
             continue
@@ -51,6 +65,56 @@ def invalidate_symphony_live_cache(
     return len(to_remove)
 
 
+def invalidate_symphony_performance_cache(*, account_id: Optional[str] = None) -> int:
+    """Drop cached stored-data reads, for one account or all of them.
+
+    Covers both performance series and latest-row lookups.  Returns the
+    number of removed performance-series entries.
+    """
+    if account_id is None:
+        removed = len(_sym_perf_cache)
+        _sym_perf_cache.clear()
+        _sym_latest_cache.clear()
+        return removed
+
+    for key in _sym_latest_cache.keys():
+        if key[0] == account_id:
+            _sym_latest_cache.pop(key, None)
+    to_remove = [key for key in _sym_perf_cache.keys() if key[0] == account_id]
+    for key in to_remove:
+        _sym_perf_cache.pop(key, None)
+    return len(to_remove)
+
+
+def _query_latest_symphony_row(db: Session, account_id: str, symphony_id: str):
+    # Served by the (account_id, symphony_id, date) primary key: one index seek.
+    return (
+        db.query(
+            SymphonyDailyPortfolio.date,
+            SymphonyDailyPortfolio.portfolio_value,
+            SymphonyDailyPortfolio.net_deposits,
+        )
+        .filter_by(account_id=account_id, symphony_id=symphony_id)
+        .order_by(SymphonyDailyPortfolio.date.desc())
+        .first()
+    )
+
+
+def get_latest_symphony_portfolio(db: Session, account_id: str, symphony_id: str):
+    """Latest stored ``(date, portfolio_value, net_deposits)`` row, or None.
+
+    Results are cached briefly per (account, symphony); sync drops them via
+    ``invalidate_symphony_performance_cache``.
+    """
+    cache_key = (account_id, symphony_id)
+    latest = _sym_latest_cache.get(cache_key)
+    if latest is None:
+        latest = _query_latest_symphony_row(db, account_id, symphony_id)
+        if latest is not None:
+            _sym_latest_cache.set(cache_key, latest)
+    return latest
+
+
 def _period_cutoff(period: str, end_date: date) -> Optional[date]:
     mapping = {
         "1D": timedelta(days=1),
@@ -75,40 +139,49 @@ def _load_filtered_rows(
     period: Optional[str],
     start_date: Optional[str],
     end_date: Optional[str],
-) -> List[SymphonyDailyPortfolio]:
-    rows = db.query(SymphonyDailyPortfolio).filter_by(
-        account_id=account_id,
-        symphony_id=symphony_id,
-    ).order_by(SymphonyDailyPortfolio.date).all()
-
-    if not rows:
+) -> List[Row]:
+    """(date, portfolio_value, net_deposits) rows for the window, oldest first."""
+    latest = _query_latest_symphony_row(db, account_id, symphony_id)
+    if latest is None:
         raise HTTPException(404, "No stored data for this symphony. Run sync first.")
+    last_date = latest.date
 
+    query = db.query(
+        SymphonyDailyPortfolio.date,
+        SymphonyDailyPortfolio.portfolio_value,
+        SymphonyDailyPortfolio.net_deposits,
+    ).filter_by(
+        account_id=account_id,
+        symphony_id=symphony_id,
+    )
     if start_date or end_date:
         sd = parse_iso_date(start_date, "start_date") if start_date else None
         ed = parse_iso_date(end_date, "end_date") if end_date else None
         if sd and ed and sd > ed:
             raise HTTPException(400, "start_date cannot be after end_date")
-        rows = [row for row in rows if (sd is None or row.date >= sd) and (ed is None or row.date <= ed)]
+        if sd is not None:
+            query = query.filter(SymphonyDailyPortfolio.date >= sd)
+        if ed is not None:
+            query = query.filter(SymphonyDailyPortfolio.date <= ed)
     elif period and period != "ALL":
-        all_dates = [row.date for row in rows]
-        if all_dates:
-            cutoff = _period_cutoff(period, all_dates[-1])
-            if cutoff:
-                rows = [row for row in rows if row.date >= cutoff]
+        cutoff = _period_cutoff(period, last_date)
+        if cutoff:
+            query = query.filter(SymphonyDailyPortfolio.date >= cutoff)
 
+    rows = query.order_by(SymphonyDailyPortfolio.date).all()
     if not rows:
         raise HTTPException(404, "No data in selected period.")
     return rows
 
 
-def _build_symphony_cash_flows(rows: List[SymphonyDailyPortfolio]) -> List[Dict]:
-    cash_flows: List[Dict] = []
-    for i in range(1, len(rows)):
-        delta = rows[i].net_deposits - rows[i - 1].net_deposits
-        if abs(delta) > 0.50:
-            cash_flows.append({"date": rows[i].date, "amount": delta})
-    return cash_flows
+def _build_symphony_cash_flows(rows: List[Row]) -> List[Dict]:
+    """Infer cash-flow events from day-over-day net_deposits changes."""
+    if len(rows) < 2:
+        return []
+    net_deposits = np.fromiter((row.net_deposits for row in rows), dtype=np.float64, count=len(rows))
+    deltas = np.diff(net_deposits)
+    flow_idx = np.flatnonzero(np.abs(deltas) > 0.50)
+    return [{"date": rows[i + 1].date, "amount": float(deltas[i])} for i in flow_idx]
 
 
 def _symphony_performance_live(
@@ -147,9 +220,40 @@ def get_symphony_performance_data(
     symphony_id: str,
     account_id: str,
     get_client_for_account_fn: Callable[[Session, str], object],
+) -> List[Dict]:
+    cache_key = (account_id, symphony_id)
+    cached = _sym_perf_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    result = _load_symphony_performance(
+        db=db,
+        symphony_id=symphony_id,
+        account_id=account_id,
+        get_client_for_account_fn=get_client_for_account_fn,
+    )
+    if result:
+        _sym_perf_cache.set(cache_key, result)
+    return result
+
+
+def _load_symphony_performance(
+    db: Session,
+    symphony_id: str,
+    account_id: str,
+    get_client_for_account_fn: Callable[[Session, str], object],
 ) -> List[Dict]:
     rows = (
-        db.query(SymphonyDailyPortfolio, SymphonyDailyMetrics)
+        db.query(
+            SymphonyDailyPortfolio.date,
+            SymphonyDailyPortfolio.portfolio_value,
+            SymphonyDailyPortfolio.net_deposits,
+            func.coalesce(SymphonyDailyMetrics.cumulative_return_pct, 0.0),
+            func.coalesce(SymphonyDailyMetrics.daily_return_pct, 0.0),
+            func.coalesce(SymphonyDailyMetrics.time_weighted_return, 0.0),
+            func.coalesce(SymphonyDailyMetrics.money_weighted_return_period, 0.0),
+            func.coalesce(SymphonyDailyMetrics.current_drawdown, 0.0),
+        )
         .outerjoin(
             SymphonyDailyMetrics,
             (SymphonyDailyPortfolio.account_id == SymphonyDailyMetrics.account_id)
@@ -172,21 +276,28 @@ def get_symphony_performance_data(
             get_client_for_account_fn=get_client_for_account_fn,
         )
 
-    result = []
-    for port, met in rows:
-        result.append(
-            {
-                "date": str(port.date),
-                "portfolio_value": round(port.portfolio_value, 2),
-                "net_deposits": round(port.net_deposits, 2),
-                "cumulative_return_pct": round(met.cumulative_return_pct, 4) if met else 0.0,
-                "daily_return_pct": round(met.daily_return_pct, 4) if met else 0.0,
-                "time_weighted_return": round(met.time_weighted_return, 4) if met else 0.0,
-                "money_weighted_return": round(met.money_weighted_return_period, 4) if met else 0.0,
-                "current_drawdown": round(met.current_drawdown, 4) if met else 0.0,
-            }
-        )
-    return result
+    return [
+        {
+            "date": str(row_date),
+            "portfolio_value": round(portfolio_value, 2),
+            "net_deposits": round(net_deposits, 2),
+            "cumulative_return_pct": round(cumulative_return_pct, 4),
+            "daily_return_pct": round(daily_return_pct, 4),
+            "time_weighted_return": round(time_weighted_return, 4),
+            "money_weighted_return": round(money_weighted_return, 4),
+            "current_drawdown": round(current_drawdown, 4),
+        }
+        for (
+            row_date,
+            portfolio_value,
+            net_deposits,
+            cumulative_return_pct,
+            daily_return_pct,
+            time_weighted_return,
+            money_weighted_return,
+            current_drawdown,
+        ) in rows
+    ]
 
 
 def get_symphony_summary_data(
@@ -266,7 +377,7 @@ def get_symphony_summary_live_data(
     cache_key = (symphony_id, account_id, period, start_date, end_date)
     cached = _sym_live_cache.get(cache_key)
 
-    if cached and time.time() - cached["ts"] < _SYM_LIVE_CACHE_TTL:
+    if cached:
         daily_dicts = cached["daily_dicts"]
         cf_dicts = cached["cf_dicts"]
         first_date_str = cached["first_date_str"]
@@ -279,31 +390,33 @@ def get_symphony_summary_live_data(
             start_date=start_date,
             end_date=end_date,
         )
-        daily_dicts = [
+        daily_dicts = tuple(
             {"date": row.date, "portfolio_value": row.portfolio_value, "net_deposits": row.net_deposits}
             for row in rows
-        ]
-        cf_dicts = _build_symphony_cash_flows(rows)
+        )
+        cf_dicts = tuple(_build_symphony_cash_flows(rows))
         first_date_str = str(rows[0].date)
-        _sym_live_cache[cache_key] = {
-            "ts": time.time(),
-            "daily_dicts": daily_dicts,
-            "cf_dicts": cf_dicts,
-            "first_date_str": first_date_str,
-        }
-
-    series = [dict(d) for d in daily_dicts]
-    cf = list(cf_dicts)
+        _sym_live_cache.set(
+            cache_key,
+            {
+                "daily_dicts": daily_dicts,
+                "cf_dicts": cf_dicts,
+                "first_date_str": first_date_str,
+            },
+        )
 
-    if series and str(series[-1]["date"]) == today_str:
-        series[-1]["portfolio_value"] = live_pv
-        series[-1]["net_deposits"] = live_nd
+    # The cached base rows are shared across requests and never mutated; the
+    # live point is overlaid as a single new tail row.
+    cf = cf_dicts
+    if daily_dicts and str(daily_dicts[-1]["date"]) == today_str:
+        live_row = {**daily_dicts[-1], "portfolio_value": live_pv, "net_deposits": live_nd}
+        series = daily_dicts[:-1] + (live_row,)
     else:
-        last_nd = series[-1]["net_deposits"] if series else 0.0
+        last_nd = daily_dicts[-1]["net_deposits"] if daily_dicts else 0.0
         deposit_delta = live_nd - last_nd
         if abs(deposit_delta) > 0.50:
-            cf.append({"date": today, "amount": deposit_delta})
-        series.append({"date": today_str, "portfolio_value": live_pv, "net_deposits": live_nd})
+            cf = cf_dicts + ({"date": today, "amount": deposit_delta},)
+        series = daily_dicts + ({"date": today_str, "portfolio_value": live_pv, "net_deposits": live_nd},)
 
     settings = get_settings()
     metric = compute_latest_metrics(series, cf, risk_free_rate=settings.risk_free_rate)
@@ -2,101 +2,134 @@
 
 from __future__ import annotations
 
-import random
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Dict, List, Optional
 
+import numpy as np
+import requests
 from fastapi import HTTPException
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-import requests
 
 from app.models import (
     Account,
     SymphonyAllocationHistory,
     SymphonyCatalogEntry,
-    SymphonyDailyPortfolio,
 )
-from app.services.account_scope import resolve_account_ids
+from app.services.account_scope import get_account_credential_name, resolve_account_ids
+from app.services.symphony_read import get_latest_symphony_portfolio
+
+logger = logging.getLogger(__name__)
+
+_DRY_RUN_MAX_WORKERS = 8
 
 
 def _generate_test_trade_preview(db: Session, aid_list: List[str], acct_names: dict) -> List[Dict]:
-    random.seed()
-    results = []
-    for aid in aid_list:
-        alloc_rows = (
-            db.query(SymphonyAllocationHistory)
-            .filter_by(account_id=aid)
-            .order_by(SymphonyAllocationHistory.date.desc())
-            .all()
+    rng = np.random.default_rng()
+
+    latest_dates = (
+        db.query(
+            SymphonyAllocationHistory.account_id.label("account_id"),
+            func.max(SymphonyAllocationHistory.date).label("date"),
         )
-        if not alloc_rows:
-            continue
-        alloc_date = alloc_rows[0].date
+        .filter(SymphonyAllocationHistory.account_id.in_(aid_list))
+        .group_by(SymphonyAllocationHistory.account_id)
+        .subquery()
+    )
+    allocs_by_account: Dict[str, dict] = {}
+    for row in db.query(SymphonyAllocationHistory).join(
+        latest_dates,
+        (SymphonyAllocationHistory.account_id == latest_dates.c.account_id)
+        & (SymphonyAllocationHistory.date == latest_dates.c.date),
+    ).order_by(SymphonyAllocationHistory.id):
+        allocs_by_account.setdefault(row.account_id, {}).setdefault(row.symphony_id, []).append(row)
 
-        sym_allocs: dict = {}
-        for row in alloc_rows:
-            if row.date != alloc_date:
-                continue
-            sym_allocs.setdefault(row.symphony_id, []).append(row)
+    # First pass: pick symphonies per account without touching the DB.
+    account_picks = []
+    for aid in aid_list:
+        sym_allocs = allocs_by_account.get(aid)
+        if not sym_allocs:
+            continue
 
         sym_ids = list(sym_allocs.keys())
         n_trade_syms = max(3, len(sym_ids) // 3)
-        trade_syms = random.sample(sym_ids, min(n_trade_syms, len(sym_ids)))
+        trade_syms = [
+            sym_ids[i]
+            for i in rng.choice(len(sym_ids), size=min(n_trade_syms, len(sym_ids)), replace=False)
+        ]
+        account_picks.append((aid, sym_allocs, trade_syms))
 
-        cat_entries = {
-            row.symphony_id: row.name
-            for row in db.query(SymphonyCatalogEntry).filter(
-                SymphonyCatalogEntry.symphony_id.in_(trade_syms)
-            ).all()
-        }
+    all_trade_syms = {sid for _, _, trade_syms in account_picks for sid in trade_syms}
+    cat_entries = {}
+    if all_trade_syms:
+        cat_entries = dict(
+            db.query(SymphonyCatalogEntry.symphony_id, SymphonyCatalogEntry.name)
+            .filter(SymphonyCatalogEntry.symphony_id.in_(all_trade_syms))
+            .all()
+        )
 
-        acct_name = acct_names.get(aid, aid)
+    # Second pass: build synthetic trades.
+    results = []
+    for aid, sym_allocs, trade_syms in account_picks:
+        picked = []
         for sid in trade_syms:
             allocs = sym_allocs.get(sid, [])
             if len(allocs) < 2:
                 continue
-            n_trades = random.randint(1, min(3, len(allocs)))
-            trade_allocs = random.sample(allocs, n_trades)
-            for alloc in trade_allocs:
-                side = random.choice(["BUY", "SELL"])
-                notional = round(random.uniform(200, 5000) * (1 if side == "BUY" else -1), 2)
-                prev_w = alloc.allocation_pct / 100
-                shift = random.uniform(0.005, 0.03) * (1 if side == "BUY" else -1)
-                next_w = max(0, prev_w + shift)
-                results.append(
-                    {
-                        "symphony_id": sid,
-                        "symphony_name": cat_entries.get(sid, sid),
-                        "account_id": aid,
-                        "account_name": acct_name,
-                        "ticker": alloc.ticker,
-                        "notional": abs(notional),
-                        "quantity": round(abs(notional) / random.uniform(20, 400), 4),
-                        "prev_value": round(alloc.value, 2),
-                        "prev_weight": round(prev_w * 100, 2),
-                        "next_weight": round(next_w * 100, 2),
-                        "side": side,
-                    }
-                )
+            n_trades = int(rng.integers(1, min(3, len(allocs)), endpoint=True))
+            picked.extend((sid, allocs[j]) for j in rng.choice(len(allocs), size=n_trades, replace=False))
+        if not picked:
+            continue
+
+        n = len(picked)
+        is_buy = rng.random(n) < 0.5
+        signs = np.where(is_buy, 1.0, -1.0)
+        notionals = np.round(rng.uniform(200, 5000, size=n), 2)
+        shifts = rng.uniform(0.005, 0.03, size=n) * signs
+        prices = rng.uniform(20, 400, size=n)
+
+        acct_name = acct_names.get(aid, aid)
+        for k, (sid, alloc) in enumerate(picked):
+            notional = float(notionals[k])
+            prev_w = alloc.allocation_pct / 100
+            next_w = max(0, prev_w + float(shifts[k]))
+            results.append(
+                {
+                    "symphony_id": sid,
+                    "symphony_name": cat_entries.get(sid, sid),
+                    "account_id": aid,
+                    "account_name": acct_name,
+                    "ticker": alloc.ticker,
+                    "notional": notional,
+                    "quantity": round(notional / float(prices[k]), 4),
+                    "prev_value": round(alloc.value, 2),
+                    "prev_weight": round(prev_w * 100, 2),
+                    "next_weight": round(next_w * 100, 2),
+                    "side": "BUY" if is_buy[k] else "SELL",
+                }
+            )
     return results
 
 
 def _generate_test_symphony_trade_preview(db: Session, symphony_id: str, account_id: str) -> Dict:
-    random.seed()
+    rng = np.random.default_rng()
+    latest_date = (
+        db.query(func.max(SymphonyAllocationHistory.date))
+        .filter_by(account_id=account_id, symphony_id=symphony_id)
+        .scalar_subquery()
+    )
     alloc_rows = (
         db.query(SymphonyAllocationHistory)
         .filter_by(account_id=account_id, symphony_id=symphony_id)
-        .order_by(SymphonyAllocationHistory.date.desc())
+        .filter(SymphonyAllocationHistory.date == latest_date)
+        .order_by(SymphonyAllocationHistory.id)
         .all()
     )
     cat = db.query(SymphonyCatalogEntry).filter_by(symphony_id=symphony_id).first()
     sym_name = cat.name if cat else symphony_id
 
-    latest = (
-        db.query(SymphonyDailyPortfolio)
-        .filter_by(account_id=account_id, symphony_id=symphony_id)
-        .order_by(SymphonyDailyPortfolio.date.desc())
-        .first()
-    )
+    latest = get_latest_symphony_portfolio(db, account_id, symphony_id)
     sym_value = latest.portfolio_value if latest else 0
 
     if not alloc_rows:
@@ -109,28 +142,29 @@ def _generate_test_symphony_trade_preview(db: Session, symphony_id: str, account
             "recommended_trades": [],
         }
 
-    alloc_date = alloc_rows[0].date
-    allocs = [row for row in alloc_rows if row.date == alloc_date and row.value > 0]
-    n_trades = max(1, len(allocs) // 3)
-    trade_allocs = random.sample(allocs, min(n_trades, len(allocs)))
+    allocs = [row for row in alloc_rows if row.value > 0]
+    n_trades = min(max(1, len(allocs) // 3), len(allocs))
+    trade_allocs = [allocs[i] for i in rng.choice(len(allocs), size=n_trades, replace=False)]
+
+    is_buy = rng.random(n_trades) < 0.5
+    signs = np.where(is_buy, 1.0, -1.0)
+    prices = np.round(rng.uniform(20, 400, size=n_trades), 2)
+    share_changes = np.round(rng.uniform(1, 50, size=n_trades), 2)
+    cash_changes = np.round(share_changes * prices * -signs, 2)
+    shifts = rng.uniform(0.005, 0.03, size=n_trades) * signs
 
     trades = []
-    for alloc in trade_allocs:
-        side = random.choice(["BUY", "SELL"])
-        price = round(random.uniform(20, 400), 2)
-        share_change = round(random.uniform(1, 50), 2)
-        cash_change = round(share_change * price * (-1 if side == "BUY" else 1), 2)
+    for k, alloc in enumerate(trade_allocs):
         prev_w = alloc.allocation_pct / 100
-        shift = random.uniform(0.005, 0.03) * (1 if side == "BUY" else -1)
-        next_w = max(0, prev_w + shift)
+        next_w = max(0, prev_w + float(shifts[k]))
         trades.append(
             {
                 "ticker": alloc.ticker,
                 "name": None,
-                "side": side,
-                "share_change": share_change if side == "BUY" else -share_change,
-                "cash_change": cash_change,
-                "average_price": price,
+                "side": "BUY" if is_buy[k] else "SELL",
+                "share_change": float(share_changes[k] * signs[k]),
+                "cash_change": float(cash_changes[k]),
+                "average_price": float(prices[k]),
                 "prev_value": round(alloc.value, 2),
                 "prev_weight": round(prev_w * 100, 2),
                 "next_weight": round(next_w * 100, 2),
@@ -147,6 +181,52 @@ def _generate_test_symphony_trade_preview(db: Session, symphony_id: str, account
     }
 
 
+def _trade_columns(trades: List[Dict], fields: tuple) -> np.ndarray:
+    """Numeric trade fields as a (len(trades), len(fields)) float64 matrix."""
+    return np.array(
+        [[trade.get(field, 0) for field in fields] for trade in trades],
+        dtype=np.float64,
+    ).reshape(len(trades), len(fields))
+
+
+def _dry_run_rows(dry_run_data: List[Dict], acct_names: dict) -> List[Dict]:
+    rows = []
+    trades = []
+    for acct_result in dry_run_data:
+        broker_uuid = acct_result.get("broker_account_uuid", "")
+        acct_name = acct_names.get(broker_uuid, acct_result.get("account_name", broker_uuid))
+        dry_run_result = acct_result.get("dry_run_result", {})
+        for sym_id, sym_data in dry_run_result.items():
+            for trade in sym_data.get("recommended_trades", []) or []:
+                rows.append(
+                    {
+                        "symphony_id": sym_id,
+                        "symphony_name": sym_data.get("symphony_name", "Unknown"),
+                        "account_id": broker_uuid,
+                        "account_name": acct_name,
+                        "ticker": trade.get("ticker", ""),
+                    }
+                )
+                trades.append(trade)
+    if not trades:
+        return rows
+
+    # Round every numeric column in one pass instead of per-trade round() calls.
+    cols = _trade_columns(trades, ("notional", "quantity", "prev_value", "prev_weight", "next_weight"))
+    notional = np.round(cols[:, 0], 2).tolist()
+    quantity = np.round(cols[:, 1], 4).tolist()
+    prev_value = np.round(cols[:, 2], 2).tolist()
+    weights = np.round(cols[:, 3:] * 100, 2).tolist()
+    is_buy = (cols[:, 0] >= 0).tolist()
+    for i, row in enumerate(rows):
+        row["notional"] = notional[i]
+        row["quantity"] = quantity[i]
+        row["prev_value"] = prev_value[i]
+        row["prev_weight"], row["next_weight"] = weights[i]
+        row["side"] = "BUY" if is_buy[i] else "SELL"
+    return rows
+
+
 def get_trade_preview_data(
     db: Session,
     account_id: Optional[str],
@@ -154,64 +234,48 @@ def get_trade_preview_data(
     test_credential: str = "__TEST__",
 ) -> List[Dict]:
     ids = resolve_account_ids(db, account_id)
-    acct_names = {a.id: a.display_name for a in db.query(Account).filter(Account.id.in_(ids)).all()}
+    accts = (
+        db.query(Account.id, Account.credential_name, Account.display_name)
+        .filter(Account.id.in_(ids))
+        .all()
+    )
+    acct_names = {aid: display_name for aid, _cred, display_name in accts}
 
-    accts = db.query(Account).filter(Account.id.in_(ids)).all()
     cred_to_ids: dict[str, list[str]] = {}
     cred_to_client: dict[str, object] = {}
-    for acct in accts:
-        cred_to_ids.setdefault(acct.credential_name, []).append(acct.id)
-        if acct.credential_name not in cred_to_client:
+    for aid, cred_name, _display_name in accts:
+        cred_to_ids.setdefault(cred_name, []).append(aid)
+        if cred_name != test_credential and cred_name not in cred_to_client:
             try:
-                cred_to_client[acct.credential_name] = get_client_for_account_fn(db, acct.id)
+                cred_to_client[cred_name] = get_client_for_account_fn(db, aid)
             except Exception:
                 pass
 
-    results = []
-    for cred_name, aid_list in cred_to_ids.items():
-        if cred_name == test_credential:
-            results.extend(_generate_test_trade_preview(db, aid_list, acct_names))
-            continue
-
-        client = cred_to_client.get(cred_name)
-        if not client:
-            continue
-        try:
-            dry_run_data = client.dry_run(account_uuids=aid_list)
-        except requests.exceptions.HTTPError as exc:
-            if exc.response is not None and exc.response.status_code == 400:
-                body = exc.response.json() if exc.response.text else {}
-                errors = body.get("errors", [])
-                if any(err.get("code") == "dry-run-markets-closed" for err in errors):
-                    continue
-            continue
-        except Exception:
-            continue
+    # One dry run per credential; overlap them so wall time tracks the
+    # slowest credential rather than the sum.
+    dry_runs = {}
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(_DRY_RUN_MAX_WORKERS, len(cred_to_client)))
+    ) as pool:
+        for cred_name, client in cred_to_client.items():
+            dry_runs[cred_name] = pool.submit(client.dry_run, account_uuids=cred_to_ids[cred_name])
 
-        for acct_result in dry_run_data:
-            broker_uuid = acct_result.get("broker_account_uuid", "")
-            acct_name = acct_names.get(broker_uuid, acct_result.get("account_name", broker_uuid))
-            dry_run_result = acct_result.get("dry_run_result", {})
-            for sym_id, sym_data in dry_run_result.items():
-                trades = sym_data.get("recommended_trades", [])
-                if not trades:
-                    continue
-                for trade in trades:
-                    results.append(
-                        {
-                            "symphony_id": sym_id,
-                            "symphony_name": sym_data.get("symphony_name", "Unknown"),
-                            "account_id": broker_uuid,
-                            "account_name": acct_name,
-                            "ticker": trade.get("ticker", ""),
-                            "notional": round(trade.get("notional", 0), 2),
-                            "quantity": round(trade.get("quantity", 0), 4),
-                            "prev_value": round(trade.get("prev_value", 0), 2),
-                            "prev_weight": round(trade.get("prev_weight", 0) * 100, 2),
-                            "next_weight": round(trade.get("next_weight", 0) * 100, 2),
-                            "side": "BUY" if trade.get("notional", 0) >= 0 else "SELL",
-                        }
-                    )
+        results = []
+        for cred_name, aid_list in cred_to_ids.items():
+            if cred_name == test_credential:
+                results.extend(_generate_test_trade_preview(db, aid_list, acct_names))
+                continue
+            future = dry_runs.get(cred_name)
+            if future is None:
+                continue
+            try:
+                dry_run_data = future.result()
+            except Exception as exc:
+                # Markets closed (400 dry-run-markets-closed) and other API
+                # errors simply contribute no rows.
+                logger.debug("Dry run for credential '%s' failed: %s", cred_name, exc)
+                continue
+            results.extend(_dry_run_rows(dry_run_data, acct_names))
     return results
 
 
@@ -222,8 +286,7 @@ def get_symphony_trade_preview_data(
     get_client_for_account_fn: Callable[[Session, str], object],
     test_credential: str = "__TEST__",
 ) -> Dict:
-    acct = db.query(Account).filter_by(id=account_id).first()
-    if acct and acct.credential_name == test_credential:
+    if get_account_credential_name(db, account_id) == test_credential:
         return _generate_test_symphony_trade_preview(db, symphony_id, account_id)
 
     client = get_client_for_account_fn(db, account_id)
@@ -247,20 +310,31 @@ def get_symphony_trade_preview_data(
     except Exception as exc:
         raise HTTPException(500, f"Trade preview failed: {exc}")
 
+    raw_trades = data.get("recommended_trades", []) or []
+    cols = _trade_columns(
+        raw_trades,
+        ("share_change", "cash_change", "average_price", "prev_value", "prev_weight", "next_weight"),
+    )
+    share_change = np.round(cols[:, 0], 4).tolist()
+    dollars = np.round(cols[:, 1:4], 2).tolist()
+    weights = np.round(cols[:, 4:] * 100, 2).tolist()
+    is_buy = (cols[:, 1] < 0).tolist()
+
     trades = []
-    for trade in data.get("recommended_trades", []):
-        side = trade.get("side", "BUY" if trade.get("cash_change", 0) < 0 else "SELL")
+    for i, trade in enumerate(raw_trades):
+        cash_change, average_price, prev_value = dollars[i]
+        prev_weight, next_weight = weights[i]
         trades.append(
             {
                 "ticker": trade.get("symbol", ""),
                 "name": trade.get("name"),
-                "side": side,
-                "share_change": round(trade.get("share_change", 0), 4),
-                "cash_change": round(trade.get("cash_change", 0), 2),
-                "average_price": round(trade.get("average_price", 0), 2),
-                "prev_value": round(trade.get("prev_value", 0), 2),
-                "prev_weight": round(trade.get("prev_weight", 0) * 100, 2),
-                "next_weight": round(trade.get("next_weight", 0) * 100, 2),
+                "side": trade.get("side", "BUY" if is_buy[i] else "SELL"),
+                "share_change": share_change[i],
+                "cash_change": cash_change,
+                "average_price": average_price,
+                "prev_value": prev_value,
+                "prev_weight": prev_weight,
+                "next_weight": next_weight,
             }
         )
 
@@ -22,6 +22,7 @@ from app.models import (
 )
 from app.routers import portfolio, symphonies
 from app.routers import health
+from app.services import account_scope, symphony_catalog, symphony_read
 
 
 @pytest.fixture
@@ -29,6 +30,10 @@ def session_factory(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setenv("PD_TEST_MODE", "1")
     monkeypatch.setenv("PD_LOCAL_AUTH_TOKEN", "contract-test-token")
     monkeypatch.delenv("PD_ALLOWED_ORIGINS", raising=False)
+    # Response caches are process-wide; every test seeds the same ids.
+    symphony_read.invalidate_symphony_performance_cache()
+    symphony_catalog._catalog_rows_cache.clear()
+    account_scope._credential_name_cache.clear()
 
     engine = create_engine(
         "sqlite+pysqlite:///:memory:",
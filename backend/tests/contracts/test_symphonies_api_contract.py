@@ -89,3 +89,45 @@ def test_symphony_summary_contract(client):
         "daily_return_pct",
     }
     assert payload["symphony_id"] == "test-sym-000"
+
+
+def test_symphony_allocations_revalidates_with_etag(client):
+    url = "/api/symphonies/test-sym-000/allocations?account_id=test-account-001"
+    res = client.get(url)
+    assert res.status_code == 200
+    assert res.json() == {}
+    assert res.headers["cache-control"] == "private, max-age=60"
+    etag = res.headers["etag"]
+
+    not_modified = client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+
+def test_symphonies_bulk_contract(client):
+    res = client.post(
+        "/api/symphonies/bulk",
+        json={
+            "account_id": "test-account-001",
+            "symphony_ids": ["test-sym-000", "missing-sym"],
+            "fields": ["summary", "allocations", "backtest_summary"],
+        },
+    )
+    assert res.status_code == 200
+    payload = res.json()
+    assert set(payload) == {"test-sym-000", "missing-sym"}
+
+    row = payload["test-sym-000"]
+    assert set(row) == {"summary", "allocations", "backtest_summary"}
+    assert row["summary"]["symphony_id"] == "test-sym-000"
+    assert row["summary"]["portfolio_value"] == 52000.0
+    assert row["allocations"] == {}
+    assert row["backtest_summary"] is None
+    assert payload["missing-sym"]["summary"] is None
+
+    bad = client.post(
+        "/api/symphonies/bulk",
+        json={"account_id": "test-account-001", "symphony_ids": ["test-sym-000"], "fields": ["nope"]},
+    )
+    assert bad.status_code == 400
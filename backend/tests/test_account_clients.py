@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.config import AccountCredentials
+from app.database import Base
+from app.models import Account
+from app.services import account_clients
+
+
+def _build_session():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    return session, engine
+
+
+def test_client_reused_per_credential_until_credentials_change(monkeypatch: pytest.MonkeyPatch):
+    db, engine = _build_session()
+    account_clients._client_cache.clear()
+    try:
+        for aid in ("acct-1", "acct-2"):
+            db.add(
+                Account(
+                    id=aid,
+                    credential_name="Primary",
+                    account_type="INDIVIDUAL",
+                    display_name=aid,
+                    status="ACTIVE",
+                )
+            )
+        db.commit()
+
+        creds = [AccountCredentials(name="Primary", api_key_id="key", api_secret="secret")]
+        monkeypatch.setattr(account_clients, "load_accounts_by_name", lambda: {c.name: c for c in creds})
+
+        first = account_clients.get_client_for_account(db, "acct-1")
+        assert account_clients.get_client_for_account(db, "acct-2") is first
+
+        creds[0] = AccountCredentials(name="Primary", api_key_id="key", api_secret="rotated")
+        rotated = account_clients.get_client_for_account(db, "acct-1")
+        assert rotated is not first
+        assert rotated.headers["Authorization"] == "Bearer rotated"
+
+        with pytest.raises(HTTPException) as exc:
+            account_clients.get_client_for_account(db, "missing")
+        assert exc.value.status_code == 404
+    finally:
+        account_clients._client_cache.clear()
+        db.close()
+        engine.dispose()
@@ -9,7 +9,7 @@ from sqlalchemy.orm import Session, sessionmaker
 
 from app.database import Base
 from app.models import Account
-from app.services.account_scope import resolve_account_ids
+from app.services.account_scope import get_account_credential_name, resolve_account_ids
 
 
 def _build_session(accounts: Iterable[Account]) -> Session:
@@ -91,3 +91,21 @@ def test_resolve_account_ids_no_accounts_message(monkeypatch: pytest.MonkeyPatch
             )
     finally:
         db.close()
+
+
+def test_get_account_credential_name_cached_until_account_changes():
+    db = _build_session([_acct("cached-1", "Primary", "Primary: Main")])
+    try:
+        assert get_account_credential_name(db, "cached-1") == "Primary"
+        # Served from the cache: a raw statement bypasses mapper events.
+        db.execute(Account.__table__.update().values(credential_name="Other"))
+        assert get_account_credential_name(db, "cached-1") == "Primary"
+
+        acct = db.get(Account, "cached-1")
+        db.expire(acct)
+        acct.credential_name = "Secondary"
+        db.commit()
+        assert get_account_credential_name(db, "cached-1") == "Secondary"
+        assert get_account_credential_name(db, "missing") is None
+    finally:
+        db.close()
@@ -0,0 +1,475 @@
+from __future__ import annotations
+
+import json
+import math
+import time
+import zlib
+from datetime import date, datetime
+
+import pytest
+from fastapi import BackgroundTasks, HTTPException, Response
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import Account, SymphonyBacktestCache
+from app.services import backtest_cache
+from app.services.ttl_cache import TTLCache
+
+
+def _build_session():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    return session, engine
+
+
+def test_backtest_summary_orders_offsets_numerically(monkeypatch: pytest.MonkeyPatch):
+    captured = {}
+
+    def fake_compute_latest_metrics(daily_rows, cash_flows, risk_free_rate):
+        captured["rows"] = daily_rows
+        return {"cumulative_return_pct": 12.5}
+
+    monkeypatch.setattr(backtest_cache, "compute_latest_metrics", fake_compute_latest_metrics)
+
+    summary = backtest_cache._compute_backtest_summary(
+        backtest_cache.dvm_series_records({"10": 110.0, "2": 100.0, "9": 105.0}),
+        first_day=2,
+        last_market_day=10,
+    )
+
+    assert summary["cumulative_return_pct"] == 12.5
+    assert captured["rows"] == [
+        {"date": date(2020, 1, 3), "portfolio_value": 100.0, "net_deposits": 100.0},
+        {"date": date(2020, 1, 10), "portfolio_value": 105.0, "net_deposits": 100.0},
+        {"date": date(2020, 1, 11), "portfolio_value": 110.0, "net_deposits": 100.0},
+    ]
+    assert all(type(row["date"]) is date for row in captured["rows"])
+
+
+def test_backtest_summary_needs_two_points():
+    assert backtest_cache._compute_backtest_summary(None, 0, 0) == {}
+    assert backtest_cache._compute_backtest_summary(backtest_cache.dvm_series_records({"5": 100.0}), 5, 5) == {}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_backtest_json_helpers_round_trip_with_and_without_orjson(
+    monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+):
+    if not use_orjson:
+        monkeypatch.setattr(backtest_cache, "orjson", None)
+
+    payload = {"dvm_capital": {"1": 100.0, "2": 101.5}, "stats": {"name": "Alpha"}}
+    assert backtest_cache._json_loads(backtest_cache._json_dumps(payload)) == payload
+    # Rows written by stdlib json may contain NaN, which orjson rejects.
+    assert math.isnan(backtest_cache._json_loads('{"sharpe_ratio": NaN}')["sharpe_ratio"])
+
+
+def test_backtest_cache_hit_serves_stored_response_body():
+    db, engine = _build_session()
+    try:
+        db.add(
+            Account(
+                id="acct-1",
+                credential_name="Primary",
+                account_type="INDIVIDUAL",
+                display_name="Main",
+                status="ACTIVE",
+            )
+        )
+        db.commit()
+
+        class _Client:
+            backtest_calls = 0
+
+            def get_symphony_versions(self, _symphony_id):
+                return []
+
+            def get_symphony_backtest(self, _symphony_id):
+                _Client.backtest_calls += 1
+                return {
+                    "stats": {"name": "Alpha", "benchmarks": {}},
+                    "dvm_capital": {"sym-1": {"1": 100.0, "2": 110.0}},
+                    "tdvm_weights": {},
+                    "first_day": 1,
+                    "last_market_day": 2,
+                }
+
+        def _fetch():
+            return backtest_cache.get_symphony_backtest_data(
+                db=db,
+                symphony_id="sym-1",
+                account_id="acct-1",
+                force_refresh=False,
+                get_client_for_account_fn=lambda *_args: _Client(),
+            )
+
+        fresh = _fetch()
+        cached = _fetch()
+
+        assert _Client.backtest_calls == 1
+        assert isinstance(cached, Response)
+        assert cached.media_type == "application/json"
+        # The fresh reply is the stored body itself, byte for byte.
+        assert cached.body == fresh.body
+        assert cached.headers["etag"] == fresh.headers["etag"]
+
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        db.expunge_all()
+        revalidated = backtest_cache.get_symphony_backtest_data(
+            db=db,
+            symphony_id="sym-1",
+            account_id="acct-1",
+            force_refresh=False,
+            get_client_for_account_fn=lambda *_args: _Client(),
+            if_none_match=fresh.headers["etag"],
+        )
+        assert revalidated.status_code == 304
+        assert revalidated.body == b""
+        # Revalidation only reads the freshness/ETag columns, not the blobs.
+        assert not any("response_blob" in sql or "dvm_capital_json" in sql for sql in statements)
+
+        row = db.query(SymphonyBacktestCache).filter_by(symphony_id="sym-1").one()
+        assert row.response_encoding == "zlib"
+        assert json.loads(zlib.decompress(row.response_blob)) == json.loads(fresh.body)
+        # The benchmarks subtree is stored once and rejoined when rebuilding.
+        assert json.loads(row.stats_json) == {"name": "Alpha"}
+        assert backtest_cache._serialize_cached_backtest(row)["stats"] == {"name": "Alpha", "benchmarks": {}}
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def test_backtest_cache_hits_reuse_recent_versions_lookup():
+    db, engine = _build_session()
+    backtest_cache._symphony_versions_cache.clear()
+    try:
+        db.add(
+            Account(
+                id="acct-1",
+                credential_name="Primary",
+                account_type="INDIVIDUAL",
+                display_name="Main",
+                status="ACTIVE",
+            )
+        )
+        db.commit()
+        calls = {"versions": 0, "backtest": 0}
+
+        class _Client:
+            def get_symphony_versions(self, _symphony_id):
+                calls["versions"] += 1
+                return [{"created_at": "2025-01-01T00:00:00"}]
+
+            def get_symphony_backtest(self, _symphony_id):
+                calls["backtest"] += 1
+                return {
+                    "stats": {"benchmarks": {}},
+                    "dvm_capital": {"1": 100.0, "2": 101.0},
+                    "last_semantic_update_at": "2025-01-01T00:00:00",
+                }
+
+        for _ in range(3):
+            backtest_cache.get_symphony_backtest_data(
+                db=db,
+                symphony_id="sym-1",
+                account_id="acct-1",
+                force_refresh=False,
+                get_client_for_account_fn=lambda *_args: _Client(),
+            )
+
+        assert calls == {"versions": 1, "backtest": 1}
+    finally:
+        backtest_cache._symphony_versions_cache.clear()
+        db.close()
+        engine.dispose()
+
+
+def test_legacy_backtest_rows_without_response_body_are_rebuilt():
+    db, engine = _build_session()
+    try:
+        db.add(
+            Account(
+                id="test-acct",
+                credential_name="__TEST__",
+                account_type="INDIVIDUAL",
+                display_name="Test",
+                status="ACTIVE",
+            )
+        )
+        db.add(
+            SymphonyBacktestCache(
+                symphony_id="sym-1",
+                account_id="test-acct",
+                cached_at=datetime(2025, 1, 2, 3, 4, 5),
+                dvm_capital_json='{"1": 100.0}',
+            )
+        )
+        db.commit()
+
+        result = backtest_cache.get_symphony_backtest_data(
+            db=db,
+            symphony_id="sym-1",
+            account_id="test-acct",
+            force_refresh=False,
+            get_client_for_account_fn=lambda *_args: None,
+        )
+
+        payload = json.loads(result.body)
+        assert payload["dvm_capital"] == {"1": 100.0}
+        assert payload["cached_at"] == "2025-01-02T03:04:05"
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def test_backtest_cache_freshness_uses_epoch_with_datetime_fallback():
+    now_epoch = 1_700_000_000
+    ttl = backtest_cache.CACHE_TTL_HOURS * 3600
+
+    fresh = SymphonyBacktestCache(cached_at=datetime(2000, 1, 1), cached_at_epoch=now_epoch - ttl + 1)
+    expired = SymphonyBacktestCache(cached_at=datetime.utcnow(), cached_at_epoch=now_epoch - ttl)
+    legacy = SymphonyBacktestCache(cached_at=datetime.utcnow(), cached_at_epoch=None)
+
+    assert backtest_cache._is_cache_fresh(fresh, now_epoch)
+    assert not backtest_cache._is_cache_fresh(expired, now_epoch)
+    assert backtest_cache._is_cache_fresh(legacy, now_epoch)
+    # The legacy cutoff is taken from the same clock reading as the epoch check.
+    legacy_expired = SymphonyBacktestCache(cached_at=datetime(2023, 11, 13, 22, 13, 20), cached_at_epoch=None)
+    assert not backtest_cache._is_cache_fresh(legacy_expired, now_epoch)
+
+
+def test_upsert_backtest_cache_inserts_then_replaces_row():
+    db, engine = _build_session()
+    try:
+        fields = dict(account_id="acct-1", cached_at=datetime(2025, 1, 1), stats_json='{"v": 1}')
+        backtest_cache._upsert_backtest_cache(db, "sym-1", fields)
+        db.commit()
+
+        backtest_cache._upsert_backtest_cache(
+            db, "sym-1", dict(fields, stats_json='{"v": 2}', response_encoding="zlib")
+        )
+        db.commit()
+
+        rows = db.query(SymphonyBacktestCache).all()
+        assert len(rows) == 1
+        assert rows[0].stats_json == '{"v": 2}'
+        assert rows[0].response_encoding == "zlib"
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def test_rows_without_a_stored_response_are_rebuilt_from_columns():
+    row = SymphonyBacktestCache(
+        stats_json='{"name": "Old"}',
+        dvm_capital_json='{"1": 100.0}',
+        tdvm_weights_json="{}",
+        benchmarks_json="{}",
+        first_day=1,
+        last_market_day=1,
+        cached_at=datetime(2025, 1, 2),
+        response_blob=None,
+    )
+    response = backtest_cache._cached_backtest_response(row)
+    assert isinstance(response, Response)
+    body = json.loads(response.body)
+    assert body["stats"] == {"name": "Old", "benchmarks": {}}
+    assert body["dvm_capital"] == {"1": 100.0}
+
+
+def test_dvm_series_blob_is_sorted_and_read_without_parsing():
+    nested = {"sym-1": {"19726": 90.0, "19723": 100.0, "19724": 120.5}, "SPY": {"19723": 1.0}}
+    blob = backtest_cache.dvm_series_records(nested).tobytes()
+
+    records = backtest_cache.unpack_dvm_series(blob)
+
+    assert records["day"].tolist() == [19723, 19724, 19726]
+    assert records["value"].tolist() == [100.0, 120.5, 90.0]
+    assert backtest_cache.dvm_series_records(nested["sym-1"]).tobytes() == blob
+    assert backtest_cache.dvm_series_records({}) is None
+    assert backtest_cache.dvm_series_records({"x": 1.0}) is None
+
+
+def test_backtest_summary_metrics_are_read_from_columns():
+    db, engine = _build_session()
+    try:
+        db.add_all(
+            [
+                SymphonyBacktestCache(
+                    symphony_id="sym-cols",
+                    account_id="acct-1",
+                    cached_at=datetime(2025, 1, 2),
+                    sharpe_ratio=1.25,
+                    max_drawdown=-0.1,
+                    longest_drawdown_days=7,
+                ),
+                SymphonyBacktestCache(
+                    symphony_id="sym-legacy",
+                    account_id="acct-1",
+                    cached_at=datetime(2025, 1, 2),
+                    summary_metrics_json='{"sharpe_ratio": 0.5, "max_drawdown": -0.2}',
+                ),
+            ]
+        )
+        db.commit()
+
+        assert backtest_cache.get_symphony_backtest_summary_data(
+            db, "sym-cols", ["sharpe_ratio", "longest_drawdown_days"]
+        ) == {"sharpe_ratio": 1.25, "longest_drawdown_days": 7}
+        assert backtest_cache.get_symphony_backtest_summary_data(
+            db, "sym-legacy", ["max_drawdown"]
+        ) == {"max_drawdown": -0.2}
+
+        full = backtest_cache._serialize_cached_backtest(db.get(SymphonyBacktestCache, "sym-cols"))
+        assert list(full["summary_metrics"]) == list(backtest_cache.SUMMARY_METRIC_KEYS)
+        assert full["summary_metrics"]["max_drawdown"] == -0.1
+
+        with pytest.raises(HTTPException) as bad_key:
+            backtest_cache.get_symphony_backtest_summary_data(db, "sym-cols", ["nope"])
+        assert bad_key.value.status_code == 400
+        with pytest.raises(HTTPException) as missing:
+            backtest_cache.get_symphony_backtest_summary_data(db, "sym-missing")
+        assert missing.value.status_code == 404
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def test_edited_symphony_serves_cache_and_refreshes_in_background(monkeypatch: pytest.MonkeyPatch):
+    db, engine = _build_session()
+    backtest_cache._symphony_versions_cache.clear()
+    monkeypatch.setattr(backtest_cache, "SessionLocal", sessionmaker(bind=engine))
+    exported = []
+    monkeypatch.setattr(
+        backtest_cache,
+        "export_single_symphony",
+        lambda _client, symphony_id, name: exported.append((symphony_id, name)),
+    )
+    try:
+        db.add(
+            Account(
+                id="acct-1",
+                credential_name="Primary",
+                account_type="INDIVIDUAL",
+                display_name="Main",
+                status="ACTIVE",
+            )
+        )
+        db.add(
+            SymphonyBacktestCache(
+                symphony_id="sym-1",
+                account_id="acct-1",
+                cached_at=datetime.utcnow(),
+                cached_at_epoch=int(time.time()),
+                dvm_capital_json='{"1": 100.0}',
+                last_semantic_update_at="2025-01-01T00:00:00",
+            )
+        )
+        db.commit()
+
+        class _Client:
+            def get_symphony_versions(self, _symphony_id):
+                return [{"created_at": "2025-02-01T00:00:00"}]
+
+            def get_symphony_stats(self, _account_id):
+                return [{"id": "sym-1", "name": "Edited"}]
+
+            def get_symphony_backtest(self, _symphony_id):
+                return {
+                    "stats": {"benchmarks": {}},
+                    "dvm_capital": {"1": 100.0, "2": 120.0},
+                    "last_semantic_update_at": "2025-02-01T00:00:00",
+                }
+
+        tasks = BackgroundTasks()
+        result = backtest_cache.get_symphony_backtest_data(
+            db=db,
+            symphony_id="sym-1",
+            account_id="acct-1",
+            force_refresh=False,
+            get_client_for_account_fn=lambda *_args: _Client(),
+            background_tasks=tasks,
+        )
+
+        assert json.loads(result.body)["dvm_capital"] == {"1": 100.0}
+        assert exported == []
+        assert len(tasks.tasks) == 1
+
+        task = tasks.tasks[0]
+        task.func(*task.args, **task.kwargs)
+
+        db.expire_all()
+        row = db.get(SymphonyBacktestCache, "sym-1")
+        assert exported == [("sym-1", "Edited")]
+        assert row.last_semantic_update_at == "2025-02-01T00:00:00"
+        assert json.loads(row.dvm_capital_json) == {"1": 100.0, "2": 120.0}
+        assert len(backtest_cache._refreshing) == 0
+    finally:
+        backtest_cache._symphony_versions_cache.clear()
+        db.close()
+        engine.dispose()
+
+
+def test_refresh_claim_expires_when_the_background_task_never_runs(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    now = [0.0]
+    monkeypatch.setattr(
+        backtest_cache,
+        "_refreshing",
+        TTLCache(maxsize=8, ttl=backtest_cache._REFRESH_CLAIM_TTL, timer=lambda: now[0]),
+    )
+    dropped = BackgroundTasks()  # e.g. the client disconnected before tasks ran
+    backtest_cache._schedule_backtest_refresh(dropped, "sym-1", "acct-1", lambda *_args: None)
+    assert len(dropped.tasks) == 1
+
+    retry = BackgroundTasks()
+    backtest_cache._schedule_backtest_refresh(retry, "sym-1", "acct-1", lambda *_args: None)
+    assert retry.tasks == []
+
+    now[0] += backtest_cache._REFRESH_CLAIM_TTL
+    backtest_cache._schedule_backtest_refresh(retry, "sym-1", "acct-1", lambda *_args: None)
+    assert len(retry.tasks) == 1
+
+
+def test_cached_dvm_series_is_decoded_once_per_cache_version():
+    db, engine = _build_session()
+    backtest_cache._dvm_series_cache.clear()
+    epoch = int(time.time())
+    try:
+        row = SymphonyBacktestCache(
+            symphony_id="sym-dvm",
+            account_id="acct-1",
+            cached_at=datetime.utcnow(),
+            cached_at_epoch=epoch,
+            stats_json='{"name": "First"}',
+            dvm_series_blob=backtest_cache.dvm_series_records({"1": 100.0}).tobytes(),
+        )
+        db.add(row)
+        db.commit()
+
+        name, series = backtest_cache.get_cached_dvm_series(db, "sym-dvm")
+        assert name == "First"
+        assert series["value"].tolist() == [100.0]
+
+        # Same version: served without re-reading the JSON/blob columns.
+        row.stats_json = '{"name": "Ignored"}'
+        db.commit()
+        assert backtest_cache.get_cached_dvm_series(db, "sym-dvm")[0] == "First"
+
+        row.cached_at_epoch = epoch + 1
+        row.stats_json = '{"name": "Second"}'
+        db.commit()
+        assert backtest_cache.get_cached_dvm_series(db, "sym-dvm")[0] == "Second"
+    finally:
+        backtest_cache._dvm_series_cache.clear()
+        db.close()
+        engine.dispose()
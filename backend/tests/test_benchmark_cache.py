@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from datetime import date
+import threading
+import time
+from datetime import date, timedelta
 
 from fastapi import HTTPException
 import pytest
@@ -10,6 +12,7 @@ from sqlalchemy.pool import StaticPool
 
 from app.database import Base
 from app.services import benchmark_read
+from app.services.ttl_cache import TTLCache
 
 
 @pytest.fixture
@@ -28,13 +31,28 @@ def db_session():
         engine.dispose()
 
 
+@pytest.fixture(autouse=True)
+def _clear_upstream_miss_caches():
+    for cache in (
+        benchmark_read._stooq_miss_cache,
+        benchmark_read._finnhub_denied_cache,
+        benchmark_read._latest_price_cache,
+    ):
+        cache.clear()
+    yield
+    for cache in (
+        benchmark_read._stooq_miss_cache,
+        benchmark_read._finnhub_denied_cache,
+        benchmark_read._latest_price_cache,
+    ):
+        cache.clear()
+
+
 def test_benchmark_cache_enforces_max_entries(
     db_session: Session,
     monkeypatch: pytest.MonkeyPatch,
 ):
-    benchmark_read._benchmark_cache.clear()
-    monkeypatch.setattr(benchmark_read, "_BENCHMARK_CACHE_MAX", 2)
-    monkeypatch.setattr(benchmark_read, "_BENCHMARK_TTL", 3600)
+    monkeypatch.setattr(benchmark_read, "_benchmark_cache", TTLCache(maxsize=2, ttl=3600))
 
     def _stooq(_ticker: str, _start: date, _end: date):
         return [(date(2025, 1, 2), 100.0), (date(2025, 1, 3), 101.0)]
@@ -55,6 +73,95 @@ def test_benchmark_cache_enforces_max_entries(
     assert all(cache_key[0] in {"BBB", "CCC"} for cache_key in benchmark_read._benchmark_cache.keys())
 
 
+def test_benchmark_history_skips_finnhub_when_stooq_answers_quickly(db_session: Session):
+    benchmark_read._benchmark_cache.clear()
+    finnhub_calls: list[str] = []
+
+    def _finnhub(ticker, *_args):
+        finnhub_calls.append(ticker)
+        return []
+
+    result = benchmark_read.get_benchmark_history_data(
+        db=db_session,
+        ticker="SPY",
+        start_date="2025-01-02",
+        end_date="2025-01-03",
+        account_id=None,
+        get_daily_closes_stooq_fn=lambda *_args: [(date(2025, 1, 2), 100.0), (date(2025, 1, 3), 101.0)],
+        get_daily_closes_fn=_finnhub,
+        get_latest_price_fn=lambda _sym: None,
+    )
+
+    assert [row["close"] for row in result["data"]] == [100.0, 101.0]
+    assert finnhub_calls == []
+
+
+def test_benchmark_history_remembers_finnhub_denial_when_slow_stooq_wins(
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    benchmark_read._benchmark_cache.clear()
+    monkeypatch.setattr(benchmark_read, "_STOOQ_HEAD_START_SECONDS", 0.01)
+    finnhub_done = threading.Event()
+
+    def _stooq(*_args):
+        assert finnhub_done.wait(timeout=5)
+        return [(date(2025, 1, 2), 100.0), (date(2025, 1, 3), 101.0)]
+
+    def _finnhub(*_args):
+        finnhub_done.set()
+        raise benchmark_read.FinnhubAccessError("plan does not include candles")
+
+    result = benchmark_read.get_benchmark_history_data(
+        db=db_session,
+        ticker="SPY",
+        start_date="2025-01-02",
+        end_date="2025-01-03",
+        account_id=None,
+        get_daily_closes_stooq_fn=_stooq,
+        get_daily_closes_fn=_finnhub,
+        get_latest_price_fn=lambda _sym: None,
+    )
+
+    assert [row["close"] for row in result["data"]] == [100.0, 101.0]
+    for _ in range(100):  # the done-callback runs on the worker thread
+        if "SPY" in benchmark_read._finnhub_denied_cache:
+            break
+        time.sleep(0.01)
+    assert benchmark_read._finnhub_denied_cache.get("SPY") == "plan does not include candles"
+
+
+def test_benchmark_history_requests_finnhub_while_stooq_is_in_flight(
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    benchmark_read._benchmark_cache.clear()
+    monkeypatch.setattr(benchmark_read, "_STOOQ_HEAD_START_SECONDS", 0.01)
+    finnhub_started = threading.Event()
+
+    def _stooq(*_args):
+        # Only returns once Finnhub has been asked too.
+        assert finnhub_started.wait(timeout=5)
+        return []
+
+    def _finnhub(*_args):
+        finnhub_started.set()
+        return [(date(2025, 1, 2), 100.0), (date(2025, 1, 3), 101.0)]
+
+    result = benchmark_read.get_benchmark_history_data(
+        db=db_session,
+        ticker="EWJ",
+        start_date="2025-01-02",
+        end_date="2025-01-03",
+        account_id=None,
+        get_daily_closes_stooq_fn=_stooq,
+        get_daily_closes_fn=_finnhub,
+        get_latest_price_fn=lambda _sym: None,
+    )
+
+    assert [row["close"] for row in result["data"]] == [100.0, 101.0]
+
+
 def test_benchmark_history_falls_back_to_polygon_when_finnhub_access_is_denied(
     db_session: Session,
 ):
@@ -190,3 +297,62 @@ def test_benchmark_history_sanitizes_polygon_failure_when_finnhub_also_fails(
         "Finnhub: upstream timeout; Polygon: Polygon benchmark data unavailable"
     )
     assert "secret-key" not in exc_info.value.detail
+
+
+def test_benchmark_history_remembers_stooq_misses_and_finnhub_denials(db_session: Session):
+    calls = {"stooq": 0, "finnhub": 0}
+
+    def _stooq(*_args):
+        calls["stooq"] += 1
+        return []
+
+    def _finnhub(*_args):
+        calls["finnhub"] += 1
+        raise benchmark_read.FinnhubAccessError("no candle entitlement")
+
+    for _ in range(2):
+        benchmark_read._benchmark_cache.clear()
+        result = benchmark_read.get_benchmark_history_data(
+            db=db_session,
+            ticker="SPY",
+            start_date="2025-01-02",
+            end_date="2025-01-03",
+            account_id=None,
+            get_daily_closes_stooq_fn=_stooq,
+            get_daily_closes_fn=_finnhub,
+            get_daily_closes_polygon_fn=lambda *_args: [(date(2025, 1, 2), 100.0)],
+            get_latest_price_fn=lambda _sym: None,
+        )
+        assert len(result["data"]) == 1
+
+    assert calls == {"stooq": 1, "finnhub": 1}
+
+
+def test_benchmark_history_reuses_live_quote_across_ranges(db_session: Session):
+    today = date.today()
+    quotes = []
+
+    def _latest(symbol: str):
+        quotes.append(symbol)
+        return 123.0
+
+    for start in (today - timedelta(days=10), today - timedelta(days=5)):
+        result = benchmark_read.get_benchmark_history_data(
+            db=db_session,
+            ticker="QQQ",
+            start_date=str(start),
+            end_date=None,
+            account_id=None,
+            get_daily_closes_stooq_fn=lambda *_args: [(start, 100.0)],
+            get_daily_closes_fn=lambda *_args: [],
+            get_latest_price_fn=_latest,
+        )
+        assert result["data"][-1] == {
+            "date": str(today),
+            "close": 123.0,
+            "return_pct": 23.0,
+            "drawdown_pct": 0.0,
+            "mwr_pct": 0.0,
+        }
+
+    assert quotes == ["QQQ"]
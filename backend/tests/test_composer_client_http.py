@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import app.composer_client as composer_client
+from app.composer_client import ComposerClient
+
+
+class _Response:
+    status_code = 200
+    headers: dict = {}
+    text = ""
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return {}
+
+
+def test_requests_per_credential_are_bounded(monkeypatch: pytest.MonkeyPatch):
+    lock = threading.Lock()
+    in_flight = {"now": 0, "peak": 0}
+
+    def _fake_get(*_args, **_kwargs):
+        with lock:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        time.sleep(0.02)
+        with lock:
+            in_flight["now"] -= 1
+        return _Response()
+
+    monkeypatch.setattr(composer_client._http, "get", _fake_get)
+    monkeypatch.setattr(composer_client, "_MAX_CONCURRENT_REQUESTS_PER_CREDENTIAL", 2)
+    monkeypatch.setattr(composer_client, "_credential_slots", {})
+
+    # Two client instances for the same key share one set of slots.
+    clients = [
+        ComposerClient("bounded-key", "secret", base_url="https://unit.test"),
+        ComposerClient("bounded-key", "secret", base_url="https://unit.test"),
+    ]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: clients[i % 2]._get_json("ping"), range(8)))
+
+    assert in_flight["peak"] == 2
@@ -50,7 +50,7 @@ def test_get_symphony_stats_reuses_recent_cache(monkeypatch: pytest.MonkeyPatch)
         )
 
     times = iter([100.0, 101.0, 102.0])
-    monkeypatch.setattr(composer_client.requests, "get", _fake_get)
+    monkeypatch.setattr(composer_client._http, "get", _fake_get)
     monkeypatch.setattr(composer_client.time, "monotonic", lambda: next(times))
 
     client = ComposerClient("key-1", "secret-1", base_url="https://unit.test")
@@ -83,7 +83,7 @@ def test_get_symphony_stats_falls_back_to_cached_payload_after_429(
     # First fetch caches at t=201. Second call at t=220 forces a refetch
     # (TTL is 15s), which then receives 429 and should fall back to cache.
     times = iter([200.0, 201.0, 220.0, 221.0, 222.0])
-    monkeypatch.setattr(composer_client.requests, "get", _fake_get)
+    monkeypatch.setattr(composer_client._http, "get", _fake_get)
     monkeypatch.setattr(composer_client.time, "monotonic", lambda: next(times))
 
     client = ComposerClient("key-2", "secret-2", base_url="https://unit.test")
@@ -114,7 +114,7 @@ def test_get_symphony_stats_raises_during_429_cooldown_without_cache(
         )
 
     times = iter([300.0, 301.0, 302.0])
-    monkeypatch.setattr(composer_client.requests, "get", _fake_get)
+    monkeypatch.setattr(composer_client._http, "get", _fake_get)
     monkeypatch.setattr(composer_client.time, "monotonic", lambda: next(times))
 
     client = ComposerClient("key-3", "secret-3", base_url="https://unit.test")
@@ -143,7 +143,7 @@ def test_get_symphony_stats_uses_response_completion_time_for_cache_ttl(
     # Simulate a slow response where completion is much later than request start.
     # The second read should still be treated as fresh cache data.
     times = iter([100.0, 130.0, 140.0, 141.0])
-    monkeypatch.setattr(composer_client.requests, "get", _fake_get)
+    monkeypatch.setattr(composer_client._http, "get", _fake_get)
     monkeypatch.setattr(composer_client.time, "monotonic", lambda: next(times))
 
     client = ComposerClient("key-4", "secret-4", base_url="https://unit.test")
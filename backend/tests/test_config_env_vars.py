@@ -92,3 +92,45 @@ def test_symphony_export_defaults_enabled_when_flag_omitted(monkeypatch: pytest.
     export_cfg = config.load_symphony_export_config()
     assert export_cfg is not None
     assert export_cfg["enabled"] is True
+
+
+def test_get_settings_reuses_instance_until_inputs_change(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv("PD_DATABASE_URL", raising=False)
+    monkeypatch.delenv("PD_LOCAL_AUTH_TOKEN", raising=False)
+    monkeypatch.delenv("PD_LOCAL_WRITE_BASE_DIR", raising=False)
+    overrides = {"settings": {"risk_free_rate": 0.03}}
+    monkeypatch.setattr(config, "_load_config_json", lambda: overrides)
+
+    first = config.get_settings()
+    assert config.get_settings() is first
+    assert first.risk_free_rate == 0.03
+
+    overrides["settings"] = {"risk_free_rate": 0.04}
+    updated = config.get_settings()
+    assert updated is not first
+    assert updated.risk_free_rate == 0.04
+
+    monkeypatch.setenv("PD_LOCAL_AUTH_TOKEN", "token")
+    assert config.get_settings().local_auth_token == "token"
+
+
+def test_accounts_by_name_rebuilds_only_when_config_reloads(monkeypatch: pytest.MonkeyPatch):
+    data = {
+        "composer_accounts": [
+            {"name": "Primary", "api_key_id": "k1", "api_secret": "s1"},
+            {"name": "Primary", "api_key_id": "dup", "api_secret": "dup"},
+            {"name": "Roth", "api_key_id": "k2", "api_secret": "s2"},
+        ]
+    }
+    monkeypatch.setattr(config, "_accounts_by_name_cache", None)
+    monkeypatch.setattr(config, "_load_config_json", lambda: data)
+
+    first = config.load_accounts_by_name()
+    assert sorted(first) == ["Primary", "Roth"]
+    assert first["Primary"].api_key_id == "k1"
+    assert config.load_accounts_by_name() is first
+
+    data = {"composer_accounts": [{"name": "Primary", "api_key_id": "k3", "api_secret": "s3"}]}
+    reloaded = config.load_accounts_by_name()
+    assert reloaded is not first
+    assert reloaded["Primary"].api_key_id == "k3"
@@ -17,6 +17,12 @@ def test_parse_iso_date_invalid():
         parse_iso_date("01/15/2025", "start_date")
 
 
+@pytest.mark.parametrize("value", ["20250115", "2025-W03-3", "2025-02-30", "2025-01-15T00:00"])
+def test_parse_iso_date_requires_calendar_yyyy_mm_dd(value: str):
+    with pytest.raises(HTTPException, match="Invalid end_date: expected YYYY-MM-DD"):
+        parse_iso_date(value, "end_date")
+
+
 def test_resolve_date_range_custom_bounds():
     start, end = resolve_date_range(start_date="2025-02-01", end_date="2025-02-14")
     assert start == date(2025, 2, 1)
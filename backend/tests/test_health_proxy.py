@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from app.services import health_proxy
+
+
+@pytest.fixture(autouse=True)
+def _clear_quote_cache():
+    health_proxy._quote_cache.clear()
+    yield
+    health_proxy._quote_cache.clear()
+
+
+class _FakeResponse:
+    def __init__(self, payload: dict, status_code: int = 200):
+        self._payload = payload
+        self.ok = 200 <= status_code < 300
+
+    def json(self):
+        return self._payload
+
+
+def test_quote_proxy_fetches_symbols_concurrently_in_request_order(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(health_proxy, "load_finnhub_key", lambda: "test-key")
+    barrier = threading.Barrier(3, timeout=5)
+    requested: list[str] = []
+
+    def fake_get(_url, params, timeout):
+        requested.append(params["symbol"])
+        barrier.wait()  # only passes if all three calls are in flight together
+        if params["symbol"] == "BAD":
+            return _FakeResponse({}, status_code=403)
+        return _FakeResponse({"c": len(params["symbol"])})
+
+    monkeypatch.setattr(health_proxy._http, "get", fake_get)
+
+    result = health_proxy.get_finnhub_quote_proxy_data(" spy,bad, qqqm ,spy")
+
+    assert sorted(requested) == ["BAD", "QQQM", "SPY"]
+    assert list(result) == ["SPY", "QQQM"]
+    assert result == {"SPY": {"c": 3}, "QQQM": {"c": 4}}
+
+
+def test_quote_proxy_serves_recent_quotes_from_cache(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(health_proxy, "load_finnhub_key", lambda: "test-key")
+    calls: list[str] = []
+
+    def fake_get(_url, params, timeout):
+        calls.append(params["symbol"])
+        if params["symbol"] == "BAD":
+            return _FakeResponse({}, status_code=429)
+        return _FakeResponse({"c": 1.0})
+
+    monkeypatch.setattr(health_proxy._http, "get", fake_get)
+
+    assert health_proxy.get_finnhub_quote_proxy_data("SPY,BAD") == {"SPY": {"c": 1.0}}
+    assert health_proxy.get_finnhub_quote_proxy_data("spy,bad,QQQ") == {
+        "SPY": {"c": 1.0},
+        "QQQ": {"c": 1.0},
+    }
+    # Failed quotes are not cached, so BAD is retried; SPY is not.
+    assert sorted(calls) == ["BAD", "BAD", "QQQ", "SPY"]
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import threading
+from datetime import date
+
+import pytest
+
+from app.services import holdings
+
+
+@pytest.fixture(autouse=True)
+def _clear_split_cache():
+    holdings._split_cache.clear()
+    yield
+    holdings._split_cache.clear()
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("2024-03-05", date(2024, 3, 5)),
+        ("2024-03-05 14:30:00", date(2024, 3, 5)),
+        ("2024-03-05 14:30:00+0000", date(2024, 3, 5)),
+        ("2024-03-05 14:30:00.123456+0000", date(2024, 3, 5)),
+        ("2024-03-05T14:30:00+0000", date(2024, 3, 5)),
+        ("2024-02-30", None),
+        ("03/05/2024", None),
+        ("", None),
+    ],
+)
+def test_parse_date_accepts_composer_formats(raw: str, expected):
+    assert holdings._parse_date(raw) == expected
+
+
+def test_reconstruct_holdings_nets_daily_trades_and_applies_splits(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        holdings,
+        "get_splits_by_date",
+        lambda symbols, since: {"2024-01-03": [("AAA", 2.0), ("BBB", 3.0)]},
+    )
+    transactions = [
+        {"date": "2024-01-02 10:00:00", "symbol": "AAA", "action": "buy", "quantity": "5"},
+        {"date": "2024-01-02 11:00:00", "symbol": "BBB", "action": "buy", "quantity": 1},
+        {"date": "2024-01-02 15:00:00", "symbol": "BBB", "action": "sell", "quantity": 1},
+        {"date": "2024-01-03", "symbol": "AAA", "action": "sell", "quantity": 4},
+        {"date": "2024-01-04", "symbol": "AAA", "action": "dividend", "quantity": 9},
+        {"date": "not a date", "symbol": "CCC", "action": "buy", "quantity": 1},
+    ]
+
+    history = holdings.reconstruct_holdings(transactions)
+
+    assert history == [
+        {"date": "2024-01-02", "holdings": {"AAA": 5.0}},
+        {"date": "2024-01-03", "holdings": {"AAA": 6.0}},
+        {"date": "2024-01-04", "holdings": {"AAA": 6.0}},
+    ]
+
+
+def test_get_splits_by_date_fetches_symbols_concurrently(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+):
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_finnhub(sym, _start, _end):
+        barrier.wait()  # only passes if all three lookups are in flight together
+        if sym == "AAA":
+            return [(date(2024, 6, 10), 10.0)]
+        raise holdings.FinnhubAccessError("no access")
+
+    def fake_polygon(sym, _start, _end):
+        if sym == "BBB":
+            return [(date(2024, 6, 10), 0.5)]
+        return []
+
+    monkeypatch.setattr(holdings, "get_splits", fake_finnhub)
+    monkeypatch.setattr(holdings, "get_splits_polygon", fake_polygon)
+
+    with caplog.at_level("WARNING", logger=holdings.logger.name):
+        splits = holdings.get_splits_by_date(["AAA", "BBB", "CCC"], since="2024-01-01")
+
+    assert splits == {"2024-06-10": [("AAA", 10.0), ("BBB", 0.5)]}
+    assert [r.getMessage() for r in caplog.records] == ["Finnhub split data is unavailable: no access"]
+
+
+def test_get_splits_by_date_reuses_answers_but_retries_failures(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    calls: list[str] = []
+
+    def fake_finnhub(sym, _start, _end):
+        calls.append(sym)
+        if sym == "BAD":
+            raise RuntimeError("timeout")
+        return [(date(2024, 6, 10), 2.0)] if sym == "AAA" else []
+
+    monkeypatch.setattr(holdings, "get_splits", fake_finnhub)
+    monkeypatch.setattr(
+        holdings,
+        "get_splits_polygon",
+        lambda *_args: (_ for _ in ()).throw(holdings.PolygonError("down")),
+    )
+
+    first = holdings.get_splits_by_date(["AAA", "NONE", "BAD"], since="2024-01-01")
+    second = holdings.get_splits_by_date(["AAA", "NONE", "BAD"], since="2024-01-01")
+
+    assert first == second == {"2024-06-10": [("AAA", 2.0)]}
+    assert sorted(calls) == ["AAA", "BAD", "BAD", "NONE"]
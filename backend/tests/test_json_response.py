@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+from types import SimpleNamespace
+
+from pydantic import TypeAdapter
+
+from app.schemas import PerformancePoint
+from app.services.json_response import typed_json_response
+
+
+def test_typed_json_response_validates_dicts_and_attribute_rows():
+    adapter = TypeAdapter(list[PerformancePoint])
+    row = {
+        "date": date(2024, 1, 2),
+        "portfolio_value": 100.0,
+        "net_deposits": 90.0,
+        "cumulative_return_pct": 1.5,
+        "daily_return_pct": 0.5,
+        "time_weighted_return": 1.5,
+        "money_weighted_return": 1.4,
+        "current_drawdown": 0.0,
+    }
+
+    response = typed_json_response(adapter, [row, SimpleNamespace(**row)])
+
+    assert response.media_type == "application/json"
+    body = json.loads(response.body)
+    assert len(body) == 2
+    assert body[0] == body[1]
+    assert body[0]["date"] == "2024-01-02"
+    assert body[0]["portfolio_value"] == 100.0
+
+
+def test_fast_json_response_renders_numpy_values_and_int_keys():
+    import numpy as np
+    import pytest
+
+    pytest.importorskip("orjson")
+    from app.services.json_response import FastJSONResponse
+
+    response = FastJSONResponse({"value": np.float64(1.5), "series": np.array([1, 2]), 7: "x"})
+
+    assert json.loads(response.body) == {"value": 1.5, "series": [1, 2], "7": "x"}
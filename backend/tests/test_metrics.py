@@ -3,18 +3,23 @@
 import math
 from datetime import date, timedelta
 
+import numpy as np
 import pytest
 
 from app.services.metrics import (
+    _rolling_window_stats,
+    _window_stats,
     compute_daily_returns,
     compute_cumulative_return,
     compute_twr,
     compute_mwr,
+    compute_mwr_window,
     compute_cagr,
     compute_annualized_return,
     compute_annualized_return_cumulative,
     compute_drawdown,
     compute_drawdown_stats,
+    compute_return_drawdown_series,
     compute_volatility,
     compute_sharpe,
     compute_sortino,
@@ -23,6 +28,7 @@ from app.services.metrics import (
     compute_all_metrics,
     compute_latest_metrics,
     compute_performance_series,
+    sort_cash_flows,
 )
 
 
@@ -340,6 +346,38 @@ class TestComputeDrawdownStats:
         assert stats["longest_drawdown_days"] == 0
         assert stats["median_drawdown_days"] == 0
 
+    def test_episode_lengths_and_troughs(self):
+        """Episodes of 3 and 1 days; recovery to an equal peak closes an episode."""
+        pv = [100, 90, 80, 95, 100, 120, 108, 130]
+        stats = compute_drawdown_stats(pv)
+        assert stats["longest_drawdown_days"] == 3
+        assert stats["median_drawdown_days"] == 2
+        assert stats["median_drawdown"] == pytest.approx((-0.20 + -0.10) / 2, abs=1e-9)
+
+
+# =====================================================================
+# compute_return_drawdown_series
+# =====================================================================
+
+class TestComputeReturnDrawdownSeries:
+    def test_known_series(self, drawdown_series):
+        ret, dd = compute_return_drawdown_series(drawdown_series["pv"])
+        assert ret.tolist() == [0.0, 10.0, 20.0, -4.0, 8.0, 25.0]
+        assert dd.tolist() == [0.0, 0.0, 0.0, -20.0, -10.0, 0.0]
+
+    def test_matches_running_peak_loop(self):
+        pv = [100.0, 97.3, 101.2, 88.8, 99.9, 120.01, 119.5]
+        ret, dd = compute_return_drawdown_series(pv)
+        peak = pv[0]
+        for i, v in enumerate(pv):
+            peak = max(peak, v)
+            assert ret[i] == pytest.approx((v / pv[0] - 1) * 100, abs=1e-4)
+            assert dd[i] == pytest.approx((v / peak - 1) * 100, abs=1e-4)
+
+    def test_empty(self):
+        ret, dd = compute_return_drawdown_series([])
+        assert ret.size == 0 and dd.size == 0
+
 
 # =====================================================================
 # compute_volatility
@@ -554,6 +592,19 @@ class TestComputeAllMetrics:
         max_dd, _ = compute_drawdown(drawdown_series["pv"])
         assert results[-1]["max_drawdown"] == pytest.approx(max_dd * 100, abs=0.01)
 
+    def test_rolling_window_stats_match_per_day_windows(self):
+        """The one-pass rolling statistics equal the pure functions on every prefix."""
+        rng = np.random.default_rng(7)
+        rets = rng.normal(0.0005, 0.02, 400)
+        rets[rng.random(400) < 0.25] = 0.0  # non-trading days
+        rets[0] = 0.0
+        equity = np.cumprod(1.0 + rets)
+        rolling = _rolling_window_stats(rets, equity, rf_daily=0.0002)
+        for i in range(len(rets)):
+            expected = _window_stats(rets[1 : i + 1], equity[: i + 1], 0.0002)
+            for key, value in expected.items():
+                assert rolling[key][i] == pytest.approx(value, rel=1e-9, abs=1e-12), (i, key)
+
     def test_steady_growth_metrics(self, simple_series):
         results = compute_all_metrics(simple_series["daily_rows"], simple_series["cash_flows"])
         last = results[-1]
@@ -691,6 +742,46 @@ class TestComputeMWR_IRR:
         # Lost money on $100k base → negative MWR
         assert period < 0
 
+    def test_sorted_flows_match_dict_flows_for_every_window(self):
+        """Pre-sorted flow arrays select the same window as the flow dict."""
+        d0 = date(2024, 1, 1)
+        flows = {
+            d0: 1000.0,  # only Modified Dietz counts a flow on d0
+            d0 + timedelta(days=40): 5000.0,
+            d0 + timedelta(days=10): -2000.0,
+            d0 + timedelta(days=90): 3000.0,
+        }
+        ords, amts = sort_cash_flows(flows)
+        assert ords.tolist() == sorted(d.toordinal() for d in flows)
+        assert amts.tolist() == [1000.0, -2000.0, 5000.0, 3000.0]
+
+        for days, pv_start, pv_end in [(10, 10000.0, 8100.0), (60, 10000.0, 13500.0), (120, 0.0, 100.0)]:
+            dn = d0 + timedelta(days=days)
+            assert compute_mwr_window(d0, dn, pv_start, pv_end, (ords, amts)) == pytest.approx(
+                compute_mwr_window(d0, dn, pv_start, pv_end, flows)
+            )
+        # Solver fails on a zero start; the Dietz fallback counts the d0 flow.
+        _, period = compute_mwr_window(d0, d0 + timedelta(days=5), 0.0, 100.0, {d0: 1000.0})
+        assert period == pytest.approx(-0.9)
+
+    def test_warm_started_windows_match_cold_solves(self):
+        """Seeding each day's solve with the previous IRR finds the same roots."""
+        rng = np.random.default_rng(11)
+        d0 = date(2020, 1, 1)
+        dates = [d0 + timedelta(days=i) for i in range(300)]
+        flows = {dates[i]: float(amt) for i, amt in [(30, 5000), (90, -2000), (150, 3000), (200, 2500)]}
+        pv = [10000.0]
+        for i in range(1, len(dates)):
+            pv.append(pv[-1] * (1 + rng.normal(0.0004, 0.012)) + flows.get(dates[i], 0.0))
+        sorted_flows = sort_cash_flows(flows)
+
+        guess = None
+        for i in range(1, len(dates)):
+            warm = compute_mwr_window(d0, dates[i], pv[0], pv[i], sorted_flows, guess)
+            cold = compute_mwr_window(d0, dates[i], pv[0], pv[i], flows)
+            assert warm == pytest.approx(cold, rel=1e-9, abs=1e-12), i
+            guess = warm[0]
+
     def test_solver_fallback(self):
         """Edge case: zero-value start should not crash (falls back to Dietz)."""
         d0 = date(2024, 1, 1)
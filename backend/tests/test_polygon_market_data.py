@@ -22,7 +22,7 @@ def test_get_daily_closes_polygon_accepts_delayed_status(
 ):
     monkeypatch.setattr(finnhub_market_data, "load_polygon_key", lambda: "test-key")
     monkeypatch.setattr(
-        finnhub_market_data.requests,
+        finnhub_market_data._http,
         "get",
         lambda *_args, **_kwargs: _FakeResponse(
             {
@@ -45,3 +45,65 @@ def test_get_daily_closes_polygon_accepts_delayed_status(
         (date(2025, 1, 2), 584.64),
         (date(2025, 1, 3), 591.95),
     ]
+
+
+class _FakeStreamResponse:
+    encoding = None
+
+    def __init__(self, lines: list[bytes]):
+        self._lines = lines
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def raise_for_status(self):
+        return None
+
+    def iter_lines(self, decode_unicode: bool = False):
+        for line in self._lines:
+            yield line.decode(self.encoding) if decode_unicode else line
+
+
+def test_get_daily_closes_stooq_streams_csv_rows(monkeypatch: pytest.MonkeyPatch):
+    bodies = {
+        "spy.us": [b"No data"],
+        "spy": [
+            b"Date,Open,High,Low,Close,Volume",
+            b"2025-01-03,1,1,1,591.95,10",
+            b"2024-12-31,1,1,1,580.00,10",
+            b"2025-01-02,1,1,1,584.64,10",
+            b"2025-01-06,1,1",
+        ],
+    }
+    monkeypatch.setattr(
+        finnhub_market_data._http,
+        "get",
+        lambda *_args, params, **_kwargs: _FakeStreamResponse(bodies[params["s"]]),
+    )
+
+    rows = finnhub_market_data.get_daily_closes_stooq("SPY", date(2025, 1, 2), date(2025, 1, 6))
+
+    assert rows == [
+        (date(2025, 1, 2), 584.64),
+        (date(2025, 1, 3), 591.95),
+    ]
+
+
+def test_get_daily_closes_filters_and_skips_bad_finnhub_points(monkeypatch: pytest.MonkeyPatch):
+    payloads = [
+        {"s": "ok", "t": [1735689600, 1735776000, 1735862400, 1735862460], "c": [1.0, 584.64, 590.0, 591.95]},
+        {"s": "ok", "t": [1735776000, 1735862400], "c": [584.64, None]},
+    ]
+    monkeypatch.setattr(finnhub_market_data, "_request_json", lambda *_args: payloads.pop(0))
+
+    # 2025-01-01 is outside the range; the later 2025-01-03 point wins.
+    assert finnhub_market_data.get_daily_closes("SPY", date(2025, 1, 2), date(2025, 1, 3)) == [
+        (date(2025, 1, 2), 584.64),
+        (date(2025, 1, 3), 591.95),
+    ]
+    assert finnhub_market_data.get_daily_closes("SPY", date(2025, 1, 2), date(2025, 1, 3)) == [
+        (date(2025, 1, 2), 584.64),
+    ]
@@ -1,6 +1,15 @@
 from __future__ import annotations
 
-from app.security import get_allowed_origins
+import pytest
+from fastapi import HTTPException
+
+from app.security import (
+    _enforce_origin,
+    _enforce_token,
+    _normalize_host,
+    _raw_headers,
+    get_allowed_origins,
+)
 
 
 def test_allowed_origins_defaults_without_env(monkeypatch):
@@ -28,3 +37,44 @@ def test_allowed_origins_falls_back_when_env_has_no_loopback(monkeypatch):
         "http://localhost:3000",
         "http://127.0.0.1:3000",
     }
+
+
+def test_enforce_token_compares_as_bytes(monkeypatch):
+    monkeypatch.setenv("PD_LOCAL_AUTH_TOKEN", "token-a")
+    _enforce_token(token="token-a")
+    with pytest.raises(HTTPException) as exc:
+        _enforce_token(token="tökén")
+    assert exc.value.status_code == 401
+
+    monkeypatch.setenv("PD_LOCAL_AUTH_TOKEN", "token-b")
+    _enforce_token(token="token-b")
+    with pytest.raises(HTTPException):
+        _enforce_token(token="token-a")
+
+
+def test_enforce_origin_accepts_raw_header_bytes(monkeypatch):
+    monkeypatch.delenv("PD_ALLOWED_ORIGINS", raising=False)
+    headers = _raw_headers(
+        [(b"host", b"localhost:8000"), (b"origin", b"http://localhost:3000/")],
+        b"host",
+        b"origin",
+    )
+    _enforce_origin(origin=headers[b"origin"], require_origin=True)
+    _enforce_origin(origin="http://127.0.0.1:3000", require_origin=True)
+    with pytest.raises(HTTPException) as exc:
+        _enforce_origin(origin=b"http://evil.example", require_origin=True)
+    assert exc.value.status_code == 403
+
+
+@pytest.mark.parametrize(
+    ("host_header", "expected"),
+    [
+        (b"localhost:8000", b"localhost"),
+        (b" LocalHost ", b"localhost"),
+        (b"[::1]:8000", b"[::1]"),
+        (b"[::1", b"["),
+        (b"", b""),
+    ],
+)
+def test_normalize_host_strips_port(host_header, expected):
+    assert _normalize_host(host_header) == expected
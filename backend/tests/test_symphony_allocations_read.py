@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import SymphonyAllocationHistory
+from app.services.symphony_allocations_read import (
+    get_symphony_allocations_bulk,
+    get_symphony_allocations_data,
+)
+
+
+def _build_session():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    return session, engine
+
+
+def test_allocations_grouped_by_date_in_order():
+    db, engine = _build_session()
+    try:
+        rows = [
+            ("acct-1", "sym-1", date(2025, 1, 3), "SPY", 60.0),
+            ("acct-1", "sym-1", date(2025, 1, 2), "SPY", 50.0),
+            ("acct-1", "sym-1", date(2025, 1, 2), "TLT", 50.0),
+            ("acct-1", "sym-1", date(2025, 1, 3), "TLT", 40.0),
+            ("acct-1", "sym-2", date(2025, 1, 2), "QQQ", 100.0),
+            ("acct-2", "sym-1", date(2025, 1, 2), "GLD", 100.0),
+        ]
+        for account_id, symphony_id, row_date, ticker, pct in rows:
+            db.add(
+                SymphonyAllocationHistory(
+                    account_id=account_id,
+                    symphony_id=symphony_id,
+                    date=row_date,
+                    ticker=ticker,
+                    allocation_pct=pct,
+                )
+            )
+        db.commit()
+
+        result = get_symphony_allocations_data(db, "sym-1", "acct-1")
+
+        assert list(result) == ["2025-01-02", "2025-01-03"]
+        assert result["2025-01-02"] == {"SPY": 50.0, "TLT": 50.0}
+        assert result["2025-01-03"] == {"SPY": 60.0, "TLT": 40.0}
+        assert get_symphony_allocations_data(db, "sym-1", "missing") == {}
+
+        bulk = get_symphony_allocations_bulk(db, ["sym-1", "sym-2", "sym-3"], "acct-1")
+        assert bulk == {
+            "sym-1": result,
+            "sym-2": {"2025-01-02": {"QQQ": 100.0}},
+            "sym-3": {},
+        }
+    finally:
+        db.close()
+        engine.dispose()
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import Account, SymphonyBacktestCache
+from app.services import backtest_cache, symphony_benchmark_read
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = Session(engine)
+    try:
+        for aid, cred in (("acct-a", "Alpha"), ("acct-b", "Beta")):
+            session.add(
+                Account(
+                    id=aid,
+                    credential_name=cred,
+                    account_type="INDIVIDUAL",
+                    display_name=aid,
+                    status="ACTIVE",
+                )
+            )
+        session.commit()
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _patch_clients(monkeypatch: pytest.MonkeyPatch, clients: dict):
+    monkeypatch.setattr(
+        symphony_benchmark_read,
+        "load_accounts_by_name",
+        lambda: {name: SimpleNamespace(name=name) for name in clients},
+    )
+    monkeypatch.setattr(
+        symphony_benchmark_read,
+        "get_client_for_credentials",
+        lambda creds: clients[creds.name],
+    )
+
+
+_BACKTEST = {"stats": {"name": "Alpha Sym"}, "dvm_capital": {"s": {"1": 100.0, "2": 110.0}}}
+
+
+def test_symphony_benchmark_queries_credentials_concurrently(
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    symphony_benchmark_read._symphony_bench_cache.clear()
+    alpha_started = threading.Event()
+
+    class _Failing:
+        def get_symphony_backtest(self, _symphony_id):
+            # Only fails once the other credential's request is already in flight.
+            assert alpha_started.wait(timeout=5)
+            raise RuntimeError("not shared with this credential")
+
+    class _Working:
+        def get_symphony_backtest(self, _symphony_id):
+            alpha_started.set()
+            return _BACKTEST
+
+    _patch_clients(monkeypatch, {"Alpha": _Failing(), "Beta": _Working()})
+
+    result = symphony_benchmark_read.get_symphony_benchmark_data(db_session, "sym-x")
+
+    assert result["name"] == "Alpha Sym"
+    assert [row["return_pct"] for row in result["data"]] == [0.0, 10.0]
+    symphony_benchmark_read._symphony_bench_cache.clear()
+
+
+def test_symphony_benchmark_does_not_wait_for_slower_credentials(
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    symphony_benchmark_read._symphony_bench_cache.clear()
+    release = threading.Event()
+
+    class _Working:
+        def get_symphony_backtest(self, _symphony_id):
+            return _BACKTEST
+
+    class _Hanging:
+        def get_symphony_backtest(self, _symphony_id):
+            release.wait(timeout=5)
+            raise RuntimeError("slow")
+
+    _patch_clients(monkeypatch, {"Alpha": _Working(), "Beta": _Hanging()})
+
+    try:
+        result = symphony_benchmark_read.get_symphony_benchmark_data(db_session, "sym-y")
+        assert not release.is_set()
+        assert result["ticker"] == "Alpha Sym"
+    finally:
+        release.set()
+        symphony_benchmark_read._symphony_bench_cache.clear()
+
+
+def test_symphony_benchmark_does_not_wait_for_a_slow_first_credential(
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    symphony_benchmark_read._symphony_bench_cache.clear()
+    release = threading.Event()
+
+    class _Hanging:
+        def get_symphony_backtest(self, _symphony_id):
+            release.wait(timeout=5)
+            return {"stats": {"name": "Slow"}, "dvm_capital": {"s": {"1": 1.0, "2": 2.0}}}
+
+    class _Working:
+        def get_symphony_backtest(self, _symphony_id):
+            return _BACKTEST
+
+    _patch_clients(monkeypatch, {"Alpha": _Hanging(), "Beta": _Working()})
+
+    try:
+        result = symphony_benchmark_read.get_symphony_benchmark_data(db_session, "sym-z")
+        assert not release.is_set()
+        assert result["name"] == "Alpha Sym"
+    finally:
+        release.set()
+        symphony_benchmark_read._symphony_bench_cache.clear()
+
+
+def test_concurrent_symphony_benchmark_misses_share_one_fetch(
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from concurrent.futures import ThreadPoolExecutor
+
+    symphony_benchmark_read._symphony_bench_cache.clear()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    class _Slow:
+        def get_symphony_backtest(self, symphony_id):
+            calls.append(symphony_id)
+            started.set()
+            assert release.wait(timeout=5)
+            return _BACKTEST
+
+    _patch_clients(monkeypatch, {"Alpha": _Slow()})
+
+    try:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(symphony_benchmark_read.get_symphony_benchmark_data, db_session, "sym-z")
+            assert started.wait(timeout=5)
+            second = pool.submit(symphony_benchmark_read.get_symphony_benchmark_data, db_session, "sym-z")
+            release.set()
+            assert first.result(timeout=5) is second.result(timeout=5)
+
+        assert calls == ["sym-z"]
+        assert symphony_benchmark_read._symphony_bench_inflight == {}
+    finally:
+        release.set()
+        symphony_benchmark_read._symphony_bench_cache.clear()
+
+
+def test_symphony_benchmark_series_orders_days_and_tracks_drawdown(
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    symphony_benchmark_read._symphony_bench_cache.clear()
+
+    class _Client:
+        def get_symphony_backtest(self, _symphony_id):
+            # Day offsets from 1970-01-01: 19723 == 2024-01-01.
+            return {
+                "stats": {"name": "Dippy"},
+                "dvm_capital": {
+                    "s": {
+                        "19726": 90.0,
+                        "19723": 100.0,
+                        "19725": float("nan"),
+                        "19724": 120.0,
+                        "19727": 0.0,
+                        "19728": 132.123,
+                    }
+                },
+            }
+
+    _patch_clients(monkeypatch, {"Alpha": _Client()})
+
+    try:
+        result = symphony_benchmark_read.get_symphony_benchmark_data(db_session, "sym-dd")
+    finally:
+        symphony_benchmark_read._symphony_bench_cache.clear()
+
+    assert result["data"] == [
+        {"date": "2024-01-01", "close": 100.0, "return_pct": 0.0, "drawdown_pct": 0.0, "mwr_pct": 0.0},
+        {"date": "2024-01-02", "close": 120.0, "return_pct": 20.0, "drawdown_pct": 0.0, "mwr_pct": 0.0},
+        {"date": "2024-01-04", "close": 90.0, "return_pct": -10.0, "drawdown_pct": -25.0, "mwr_pct": 0.0},
+        {"date": "2024-01-06", "close": 132.12, "return_pct": 32.123, "drawdown_pct": 0.0, "mwr_pct": 0.0},
+    ]
+
+
+def test_symphony_benchmark_picks_up_credentials_added_to_config(
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    symphony_benchmark_read._symphony_bench_cache.clear()
+    configured = ["Alpha"]
+
+    class _NotShared:
+        def get_symphony_backtest(self, _symphony_id):
+            raise RuntimeError("not shared with this credential")
+
+    class _Working:
+        def get_symphony_backtest(self, _symphony_id):
+            return _BACKTEST
+
+    clients = {"Alpha": _NotShared(), "Beta": _Working()}
+    monkeypatch.setattr(
+        symphony_benchmark_read,
+        "load_accounts_by_name",
+        lambda: {name: SimpleNamespace(name=name) for name in configured},
+    )
+    monkeypatch.setattr(
+        symphony_benchmark_read,
+        "get_client_for_credentials",
+        lambda creds: clients[creds.name],
+    )
+
+    try:
+        with pytest.raises(HTTPException) as exc_info:
+            symphony_benchmark_read.get_symphony_benchmark_data(db_session, "sym-1")
+        assert exc_info.value.status_code == 404
+
+        configured.append("Beta")  # key added to config.json
+        result = symphony_benchmark_read.get_symphony_benchmark_data(db_session, "sym-1")
+        assert result["name"] == "Alpha Sym"
+    finally:
+        symphony_benchmark_read._symphony_bench_cache.clear()
+
+
+def test_symphony_benchmark_uses_stored_backtest_series(
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    symphony_benchmark_read._symphony_bench_cache.clear()
+    backtest_cache._dvm_series_cache.clear()
+    db_session.add(
+        SymphonyBacktestCache(
+            symphony_id="sym-cached",
+            account_id="acct-a",
+            cached_at=datetime.utcnow(),
+            cached_at_epoch=int(time.time()),
+            stats_json='{"name": "Stored Sym"}',
+            dvm_series_blob=backtest_cache.dvm_series_records({"19724": 120.0, "19723": 100.0}).tobytes(),
+        )
+    )
+    db_session.commit()
+
+    class _Client:
+        def get_symphony_backtest(self, _symphony_id):
+            raise AssertionError("stored series should be used")
+
+    _patch_clients(monkeypatch, {"Alpha": _Client()})
+
+    try:
+        result = symphony_benchmark_read.get_symphony_benchmark_data(db_session, "sym-cached")
+    finally:
+        symphony_benchmark_read._symphony_bench_cache.clear()
+
+    assert result["name"] == "Stored Sym"
+    assert [row["date"] for row in result["data"]] == ["2024-01-01", "2024-01-02"]
+    assert [row["return_pct"] for row in result["data"]] == [0.0, 20.0]
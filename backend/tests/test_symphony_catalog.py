@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 import pytest
@@ -85,13 +87,8 @@ def test_refresh_catalog_keeps_existing_rows_when_refresh_has_errors(
             def get_drafts(self):
                 return []
 
-        class _ComposerClient:
-            @staticmethod
-            def from_credentials(_creds):
-                return _Client()
-
         monkeypatch.setattr(symphony_catalog, "load_accounts", lambda: [cred])
-        monkeypatch.setattr(symphony_catalog, "ComposerClient", _ComposerClient)
+        monkeypatch.setattr(symphony_catalog, "get_client_for_credentials", lambda _creds: _Client())
 
         symphony_catalog._refresh_symphony_catalog(db)
 
@@ -101,3 +98,131 @@ def test_refresh_catalog_keeps_existing_rows_when_refresh_has_errors(
     finally:
         db.close()
         engine.dispose()
+
+
+def test_refresh_catalog_merges_parallel_fetches_in_credential_order(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    db, engine = _build_session()
+    try:
+        for acct_id, cred_name in (("acct-1", "Primary"), ("acct-2", "Secondary")):
+            db.add(
+                Account(
+                    id=acct_id,
+                    credential_name=cred_name,
+                    account_type="INDIVIDUAL",
+                    display_name=cred_name,
+                    status="ACTIVE",
+                )
+            )
+        db.add(
+            SymphonyCatalogEntry(
+                symphony_id="own",
+                name="Old Name",
+                source="watchlist",
+                credential_name="Secondary",
+                updated_at=datetime(2020, 1, 1),
+            )
+        )
+        db.commit()
+
+        primary = type("Cred", (), {"name": "Primary"})()
+        secondary = type("Cred", (), {"name": "Secondary"})()
+
+        class _Client:
+            def __init__(self, creds):
+                self.creds = creds
+
+            def get_symphony_stats(self, account_id: str):
+                if account_id == "acct-2":
+                    return [{"id": "shared", "name": "Shared Invested"}]
+                return [{"id": "own", "name": "Own Invested"}]
+
+            def get_watchlist(self):
+                if self.creds is primary:
+                    return [{"symphony_id": "shared", "name": "Shared Watched"}]
+                return []
+
+            def get_drafts(self):
+                return [{"id": "own", "name": "Own Draft"}, {"id": "draft", "name": "Draft Only"}]
+
+        monkeypatch.setattr(symphony_catalog, "load_accounts", lambda: [primary, secondary])
+        monkeypatch.setattr(symphony_catalog, "get_client_for_credentials", _Client)
+
+        symphony_catalog._refresh_symphony_catalog(db)
+
+        rows = {
+            row.symphony_id: (row.name, row.source, row.credential_name)
+            for row in db.query(SymphonyCatalogEntry).all()
+        }
+        assert db.query(SymphonyCatalogEntry).filter_by(symphony_id="own").count() == 1
+        assert rows == {
+            "own": ("Own Invested", "invested", "Primary"),
+            "shared": ("Shared Invested", "invested", "Secondary"),
+            "draft": ("Draft Only", "draft", "Primary"),
+        }
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def test_catalog_rows_are_cached_until_refresh(monkeypatch: pytest.MonkeyPatch):
+    db, engine = _build_session()
+    symphony_catalog._catalog_rows_cache.clear()
+    try:
+        db.add(
+            SymphonyCatalogEntry(
+                symphony_id="sym-a",
+                name="Alpha",
+                source="invested",
+                credential_name="Primary",
+                updated_at=datetime.utcnow(),
+            )
+        )
+        db.commit()
+
+        first = symphony_catalog.get_symphony_catalog_data(db)
+        assert [row["symphony_id"] for row in first] == ["sym-a"]
+
+        db.add(
+            SymphonyCatalogEntry(
+                symphony_id="sym-b",
+                name="Beta",
+                source="invested",
+                credential_name="Primary",
+                updated_at=datetime.utcnow(),
+            )
+        )
+        db.commit()
+        assert symphony_catalog.get_symphony_catalog_data(db) is first
+
+        monkeypatch.setattr(symphony_catalog, "load_accounts", lambda: [])
+        refreshed = symphony_catalog.get_symphony_catalog_data(db, refresh=True)
+        assert refreshed is not first
+        assert symphony_catalog.get_symphony_catalog_data(db) is refreshed
+    finally:
+        symphony_catalog._catalog_rows_cache.clear()
+        db.close()
+        engine.dispose()
+
+
+def test_concurrent_catalog_misses_share_one_refresh(monkeypatch: pytest.MonkeyPatch):
+    db, engine = _build_session()
+    symphony_catalog._catalog_rows_cache.clear()
+    calls = []
+
+    def _fake_refresh(_db):
+        calls.append(1)
+        time.sleep(0.05)
+
+    monkeypatch.setattr(symphony_catalog, "_refresh_symphony_catalog", _fake_refresh)
+    try:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: symphony_catalog.get_symphony_catalog_data(db), range(4)))
+
+        assert len(calls) == 1
+        assert all(result == [] for result in results)
+    finally:
+        symphony_catalog._catalog_rows_cache.clear()
+        db.close()
+        engine.dispose()
@@ -78,3 +78,195 @@ def test_test_symphony_list_falls_back_to_db_when_meta_missing(monkeypatch):
     finally:
         db.close()
         engine.dispose()
+
+
+def test_build_symphony_rows_rounds_stats_in_batch():
+    symphonies = [
+        {
+            "id": "sym-1",
+            "name": "Alpha",
+            "value": 1234.5678,
+            "net_deposits": 1000.0,
+            "cash": 12.346,
+            "simple_return": 0.234567,
+            "time_weighted_return": 0.1,
+            "last_dollar_change": -3.456,
+            "last_percent_change": -0.00281,
+            "sharpe_ratio": 1.23456,
+            "max_drawdown": -0.0567,
+            "annualized_rate_of_return": 0.4321,
+            "holdings": [{"ticker": "SPY", "allocation": 0.5, "value": 617.28, "last_percent_change": 0.01}],
+        },
+        {"id": "sym-2", "value": 50.0, "net_deposits": 0},
+    ]
+
+    rows = symphony_list_read._build_symphony_rows(
+        symphonies,
+        account_id="acct-1",
+        account_name="Main",
+        stored_twr={("acct-1", "sym-2"): 7.78},
+    )
+
+    first, second = rows
+    assert first["value"] == 1234.57
+    assert first["cash"] == 12.35
+    assert first["total_return"] == 234.57
+    assert first["cumulative_return_pct"] == 23.46
+    assert first["simple_return"] == 23.46
+    assert first["time_weighted_return"] == 10.0
+    assert first["last_dollar_change"] == -3.46
+    assert first["last_percent_change"] == -0.28
+    assert first["sharpe_ratio"] == 1.23
+    assert first["max_drawdown"] == -5.67
+    assert first["annualized_return"] == 43.21
+    assert first["holdings"] == [
+        {"ticker": "SPY", "allocation": 50.0, "value": 617.28, "last_percent_change": 1.0}
+    ]
+    assert second["cumulative_return_pct"] == 0.0
+    assert second["time_weighted_return"] == 7.78
+    assert second["name"] == "Unknown"
+    assert isinstance(second["value"], float)
+
+
+def test_symphony_list_fetches_accounts_concurrently_and_keeps_order(monkeypatch):
+    import threading
+
+    monkeypatch.delenv("PD_TEST_MODE", raising=False)
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    try:
+        for aid in ("acct-a", "acct-b", "acct-c"):
+            db.add(
+                Account(
+                    id=aid,
+                    credential_name="Primary",
+                    account_type="INDIVIDUAL",
+                    display_name=aid.upper(),
+                    status="ACTIVE",
+                )
+            )
+        db.commit()
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        class _Client:
+            def get_symphony_stats(self, aid):
+                if aid == "acct-b":
+                    raise RuntimeError("boom")
+                # Both healthy accounts must be in flight at the same time.
+                barrier.wait()
+                return [{"id": f"{aid}-sym", "value": 10.0, "net_deposits": 5.0}]
+
+        rows = symphony_list_read.get_symphonies_list_data(
+            db=db,
+            account_id="all",
+            get_client_for_account_fn=lambda *_args: _Client(),
+        )
+
+        assert [row["id"] for row in rows] == ["acct-a-sym", "acct-c-sym"]
+        assert [row["account_name"] for row in rows] == ["ACCT-A", "ACCT-C"]
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def test_symphony_list_uses_latest_stored_twr_rounded_in_sql(monkeypatch):
+    monkeypatch.delenv("PD_TEST_MODE", raising=False)
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    try:
+        db.add(
+            Account(
+                id="acct-a",
+                credential_name="Primary",
+                account_type="INDIVIDUAL",
+                display_name="A",
+                status="ACTIVE",
+            )
+        )
+        for day, twr in ((1, 1.111), (3, 3.3333), (2, 2.222)):
+            db.add(
+                SymphonyDailyMetrics(
+                    account_id="acct-a",
+                    symphony_id="sym-1",
+                    date=date(2025, 1, day),
+                    time_weighted_return=twr,
+                )
+            )
+        db.commit()
+
+        class _Client:
+            def get_symphony_stats(self, _aid):
+                return [
+                    {"id": "sym-1", "value": 10.0, "net_deposits": 5.0, "time_weighted_return": 0.5},
+                    {"id": "sym-2", "value": 10.0, "net_deposits": 5.0, "time_weighted_return": 0.5},
+                ]
+
+        rows = symphony_list_read.get_symphonies_list_data(
+            db=db,
+            account_id="acct-a",
+            get_client_for_account_fn=lambda *_args: _Client(),
+        )
+
+        assert [row["time_weighted_return"] for row in rows] == [3.33, 50.0]
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def test_symphony_list_resolves_one_client_per_credential(monkeypatch):
+    monkeypatch.delenv("PD_TEST_MODE", raising=False)
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    try:
+        for aid, cred in (("acct-a", "Primary"), ("acct-b", "Primary"), ("acct-c", "Other")):
+            db.add(
+                Account(
+                    id=aid,
+                    credential_name=cred,
+                    account_type="INDIVIDUAL",
+                    display_name=aid,
+                    status="ACTIVE",
+                )
+            )
+        db.commit()
+
+        class _Client:
+            def get_symphony_stats(self, aid):
+                return [{"id": f"{aid}-sym", "value": 10.0, "net_deposits": 5.0}]
+
+        resolved = []
+
+        def _get_client(_db, aid):
+            resolved.append(aid)
+            return _Client()
+
+        rows = symphony_list_read.get_symphonies_list_data(
+            db=db,
+            account_id="all",
+            get_client_for_account_fn=_get_client,
+        )
+
+        assert [row["id"] for row in rows] == ["acct-a-sym", "acct-b-sym", "acct-c-sym"]
+        assert sorted(resolved) == ["acct-a", "acct-c"]
+    finally:
+        db.close()
+        engine.dispose()
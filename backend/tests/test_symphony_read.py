@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import SymphonyDailyPortfolio
+from app.services import symphony_read
+
+
+def _build_session():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    return session, engine
+
+
+def _seed_daily(db, start: date, days: int, account_id: str = "acct-1", symphony_id: str = "sym-1"):
+    for i in range(days):
+        db.add(
+            SymphonyDailyPortfolio(
+                account_id=account_id,
+                symphony_id=symphony_id,
+                date=start + timedelta(days=i),
+                portfolio_value=1000.0 + i,
+                net_deposits=1000.0,
+            )
+        )
+    db.commit()
+
+
+def test_load_filtered_rows_applies_period_cutoff_from_last_stored_date():
+    db, engine = _build_session()
+    try:
+        _seed_daily(db, date(2024, 1, 1), 60)
+
+        rows = symphony_read._load_filtered_rows(
+            db=db,
+            symphony_id="sym-1",
+            account_id="acct-1",
+            period="1W",
+            start_date=None,
+            end_date=None,
+        )
+
+        assert [row.date for row in rows] == [date(2024, 2, 22) + timedelta(days=i) for i in range(8)]
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def test_load_filtered_rows_applies_custom_range_bounds():
+    db, engine = _build_session()
+    try:
+        _seed_daily(db, date(2024, 1, 1), 10)
+
+        rows = symphony_read._load_filtered_rows(
+            db=db,
+            symphony_id="sym-1",
+            account_id="acct-1",
+            period="1W",
+            start_date="2024-01-03",
+            end_date="2024-01-05",
+        )
+
+        assert [row.date for row in rows] == [date(2024, 1, 3), date(2024, 1, 4), date(2024, 1, 5)]
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def test_load_filtered_rows_distinguishes_missing_history_from_empty_range():
+    db, engine = _build_session()
+    try:
+        with pytest.raises(HTTPException) as missing:
+            symphony_read._load_filtered_rows(db, "sym-1", "acct-1", None, None, None)
+        assert missing.value.status_code == 404
+        assert "Run sync first" in missing.value.detail
+
+        _seed_daily(db, date(2024, 1, 1), 3)
+        with pytest.raises(HTTPException) as empty:
+            symphony_read._load_filtered_rows(db, "sym-1", "acct-1", None, "2025-01-01", None)
+        assert empty.value.status_code == 404
+        assert empty.value.detail == "No data in selected period."
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def test_build_symphony_cash_flows_detects_deposit_and_withdrawal_deltas():
+    start = date(2024, 1, 1)
+    net_deposits = [1000.0, 1000.3, 1500.3, 1500.3, 1200.3]
+    rows = [
+        SymphonyDailyPortfolio(date=start + timedelta(days=i), portfolio_value=0.0, net_deposits=nd)
+        for i, nd in enumerate(net_deposits)
+    ]
+
+    flows = symphony_read._build_symphony_cash_flows(rows)
+
+    assert [flow["date"] for flow in flows] == [date(2024, 1, 3), date(2024, 1, 5)]
+    assert [flow["amount"] for flow in flows] == pytest.approx([500.0, -300.0])
+    assert all(type(flow["amount"]) is float for flow in flows)
+    assert symphony_read._build_symphony_cash_flows(rows[:1]) == []
+
+
+def test_summary_live_overlays_today_without_mutating_cached_rows(monkeypatch: pytest.MonkeyPatch):
+    db, engine = _build_session()
+    symphony_read._sym_live_cache.clear()
+    try:
+        today = date.today()
+        _seed_daily(db, today - timedelta(days=4), 5)
+        captured = {}
+
+        def _fake_latest(series, cf, risk_free_rate):
+            captured["series"] = series
+            captured["cf"] = cf
+            return {"time_weighted_return": 1.0}
+
+        monkeypatch.setattr(symphony_read, "compute_latest_metrics", _fake_latest)
+
+        for live_pv in (2000.0, 3000.0):
+            result = symphony_read.get_symphony_summary_live_data(
+                db=db,
+                symphony_id="sym-1",
+                live_pv=live_pv,
+                live_nd=1000.0,
+                account_id="acct-1",
+                period=None,
+                start_date=None,
+                end_date=None,
+            )
+            assert result["portfolio_value"] == live_pv
+            assert len(captured["series"]) == 5
+            assert captured["series"][-1]["portfolio_value"] == live_pv
+
+        cached = symphony_read._sym_live_cache.get(("sym-1", "acct-1", None, None, None))
+        assert cached["daily_dicts"][-1]["portfolio_value"] == 1004.0
+    finally:
+        symphony_read._sym_live_cache.clear()
+        db.close()
+        engine.dispose()
+
+
+def test_symphony_performance_is_cached_until_invalidated(monkeypatch: pytest.MonkeyPatch):
+    db, engine = _build_session()
+    symphony_read.invalidate_symphony_performance_cache()
+    try:
+        _seed_daily(db, date(2024, 1, 1), 3)
+        calls = []
+        real_load = symphony_read._load_symphony_performance
+
+        def counting_load(**kwargs):
+            calls.append(kwargs["account_id"])
+            return real_load(**kwargs)
+
+        monkeypatch.setattr(symphony_read, "_load_symphony_performance", counting_load)
+
+        def no_client(*_args):
+            raise AssertionError("live fallback should not run for stored rows")
+
+        first = symphony_read.get_symphony_performance_data(db, "sym-1", "acct-1", no_client)
+        second = symphony_read.get_symphony_performance_data(db, "sym-1", "acct-1", no_client)
+
+        assert len(first) == 3
+        assert second is first
+        assert calls == ["acct-1"]
+
+        assert symphony_read.invalidate_symphony_performance_cache(account_id="other") == 0
+        assert symphony_read.invalidate_symphony_performance_cache(account_id="acct-1") == 1
+        symphony_read.get_symphony_performance_data(db, "sym-1", "acct-1", no_client)
+        assert calls == ["acct-1", "acct-1"]
+    finally:
+        symphony_read.invalidate_symphony_performance_cache()
+        db.close()
+        engine.dispose()
+
+
+def test_latest_symphony_portfolio_is_cached_per_pair_until_invalidated():
+    db, engine = _build_session()
+    symphony_read.invalidate_symphony_performance_cache()
+    try:
+        assert symphony_read.get_latest_symphony_portfolio(db, "acct-1", "sym-1") is None
+
+        _seed_daily(db, date(2024, 1, 1), 3)
+        latest = symphony_read.get_latest_symphony_portfolio(db, "acct-1", "sym-1")
+        assert (latest.date, latest.portfolio_value) == (date(2024, 1, 3), 1002.0)
+
+        _seed_daily(db, date(2024, 1, 4), 1)
+        assert symphony_read.get_latest_symphony_portfolio(db, "acct-1", "sym-1").date == date(2024, 1, 3)
+
+        symphony_read.invalidate_symphony_performance_cache(account_id="acct-1")
+        assert symphony_read.get_latest_symphony_portfolio(db, "acct-1", "sym-1").date == date(2024, 1, 4)
+    finally:
+        symphony_read.invalidate_symphony_performance_cache()
+        db.close()
+        engine.dispose()
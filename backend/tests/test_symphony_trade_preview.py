@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import Account, SymphonyAllocationHistory, SymphonyCatalogEntry, SymphonyDailyPortfolio
+from app.services import symphony_read, symphony_trade_preview
+
+
+def _build_session():
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    return session, engine
+
+
+def _seed_allocations(db, account_id: str, symphony_ids, alloc_date: date, tickers=("SPY", "QQQ", "TLT")):
+    for sid in symphony_ids:
+        for ticker in tickers:
+            db.add(
+                SymphonyAllocationHistory(
+                    account_id=account_id,
+                    symphony_id=sid,
+                    date=alloc_date,
+                    ticker=ticker,
+                    allocation_pct=100.0 / len(tickers),
+                    value=1000.0,
+                )
+            )
+    db.commit()
+
+
+def test_generate_test_trade_preview_uses_latest_allocation_snapshot():
+    db, engine = _build_session()
+    try:
+        _seed_allocations(db, "acct-1", ["old-sym"], date(2025, 1, 1))
+        _seed_allocations(db, "acct-1", ["sym-a", "sym-b", "sym-c"], date(2025, 1, 2))
+        _seed_allocations(db, "acct-2", ["sym-d"], date(2025, 1, 2))
+        db.add(
+            SymphonyCatalogEntry(
+                symphony_id="sym-a",
+                name="Alpha",
+                source="invested",
+                credential_name="__TEST__",
+                updated_at=datetime(2025, 1, 2),
+            )
+        )
+        db.commit()
+
+        rows = symphony_trade_preview._generate_test_trade_preview(
+            db, ["acct-1", "acct-2"], {"acct-1": "Main"}
+        )
+
+        assert rows
+        assert {row["symphony_id"] for row in rows} <= {"sym-a", "sym-b", "sym-c", "sym-d"}
+        for row in rows:
+            assert row["side"] in ("BUY", "SELL")
+            assert 200 <= row["notional"] <= 5000
+            assert row["quantity"] > 0
+            assert row["prev_weight"] == round(100.0 / 3, 2)
+            if row["side"] == "BUY":
+                assert row["next_weight"] > row["prev_weight"]
+            else:
+                assert row["next_weight"] < row["prev_weight"]
+            if row["symphony_id"] == "sym-a":
+                assert row["symphony_name"] == "Alpha"
+        assert {row["account_name"] for row in rows if row["account_id"] == "acct-1"} <= {"Main"}
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def test_generate_test_symphony_trade_preview_signs_match_side():
+    db, engine = _build_session()
+    symphony_read.invalidate_symphony_performance_cache()
+    try:
+        _seed_allocations(db, "acct-1", ["sym-a"], date(2025, 1, 2), tickers=("A", "B", "C", "D", "E", "F"))
+        db.add(
+            SymphonyDailyPortfolio(
+                account_id="acct-1",
+                symphony_id="sym-a",
+                date=date(2025, 1, 2),
+                portfolio_value=6000.123,
+                net_deposits=5000.0,
+            )
+        )
+        db.commit()
+
+        preview = symphony_trade_preview._generate_test_symphony_trade_preview(db, "sym-a", "acct-1")
+
+        assert preview["symphony_value"] == 6000.12
+        trades = preview["recommended_trades"]
+        assert len(trades) == 2
+        for trade in trades:
+            if trade["side"] == "BUY":
+                assert trade["share_change"] > 0 and trade["cash_change"] < 0
+            else:
+                assert trade["share_change"] < 0 and trade["cash_change"] > 0
+            assert 20 <= trade["average_price"] <= 400
+    finally:
+        symphony_read.invalidate_symphony_performance_cache()
+        db.close()
+        engine.dispose()
+
+
+def test_trade_preview_runs_credential_dry_runs_concurrently(monkeypatch):
+    import threading
+
+    monkeypatch.delenv("PD_TEST_MODE", raising=False)
+    db, engine = _build_session()
+    try:
+        for aid, cred in (("acct-a", "Alpha"), ("acct-b", "Broken"), ("acct-c", "Gamma")):
+            db.add(
+                Account(
+                    id=aid,
+                    credential_name=cred,
+                    account_type="INDIVIDUAL",
+                    display_name=aid.upper(),
+                    status="ACTIVE",
+                )
+            )
+        db.commit()
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        class _Client:
+            def __init__(self, aid):
+                self.aid = aid
+
+            def dry_run(self, account_uuids):
+                if self.aid == "acct-b":
+                    raise RuntimeError("boom")
+                # Both healthy credentials must be in flight at the same time.
+                barrier.wait()
+                return [
+                    {
+                        "broker_account_uuid": account_uuids[0],
+                        "dry_run_result": {
+                            "sym-1": {
+                                "symphony_name": "One",
+                                "recommended_trades": [{"ticker": "SPY", "notional": -12.345}],
+                            }
+                        },
+                    }
+                ]
+
+        rows = symphony_trade_preview.get_trade_preview_data(
+            db=db,
+            account_id="all",
+            get_client_for_account_fn=lambda _db, aid: _Client(aid),
+        )
+
+        assert [(row["account_name"], row["side"]) for row in rows] == [
+            ("ACCT-A", "SELL"),
+            ("ACCT-C", "SELL"),
+        ]
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def test_symphony_trade_preview_rounds_trade_columns(monkeypatch):
+    db, engine = _build_session()
+    try:
+        db.add(
+            Account(
+                id="acct-1",
+                credential_name="Primary",
+                account_type="INDIVIDUAL",
+                display_name="Main",
+                status="ACTIVE",
+            )
+        )
+        db.commit()
+
+        class _Client:
+            def get_trade_preview(self, symphony_id, broker_account_uuid):
+                return {
+                    "symphony_name": "One",
+                    "symphony_value": 1000.456,
+                    "recommended_trades": [
+                        {
+                            "symbol": "SPY",
+                            "share_change": 1.23456,
+                            "cash_change": -500.126,
+                            "average_price": 405.1234,
+                            "prev_value": 100.004,
+                            "prev_weight": 0.12344,
+                            "next_weight": 0.23456,
+                        },
+                        {"symbol": "TLT", "side": "SELL", "cash_change": 10.0},
+                    ],
+                }
+
+        preview = symphony_trade_preview.get_symphony_trade_preview_data(
+            db=db,
+            symphony_id="sym-1",
+            account_id="acct-1",
+            get_client_for_account_fn=lambda *_args: _Client(),
+        )
+
+        assert preview["symphony_value"] == 1000.46
+        spy, tlt = preview["recommended_trades"]
+        assert spy == {
+            "ticker": "SPY",
+            "name": None,
+            "side": "BUY",
+            "share_change": 1.2346,
+            "cash_change": -500.13,
+            "average_price": 405.12,
+            "prev_value": 100.0,
+            "prev_weight": 12.34,
+            "next_weight": 23.46,
+        }
+        assert tlt["side"] == "SELL"
+        assert tlt["share_change"] == 0.0
+        assert tlt["cash_change"] == 10.0
+    finally:
+        db.close()
+        engine.dispose()
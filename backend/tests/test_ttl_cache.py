@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from app.services.ttl_cache import TTLCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expires_entries_after_ttl():
+    clock = _Clock()
+    cache = TTLCache(maxsize=4, ttl=10, timer=clock)
+    cache.set("a", 1)
+
+    clock.now = 9.9
+    assert cache.get("a") == 1
+
+    clock.now = 10.0
+    assert cache.get("a") is None
+    assert "a" not in cache
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used_past_maxsize():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # refresh "a" so "b" is the LRU entry
+
+    cache.set("c", 3)
+
+    assert sorted(cache.keys()) == ["a", "c"]
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "missing") == "missing"